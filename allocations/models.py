@@ -2,6 +2,7 @@ from django.conf import settings
 from django.db import models
 from django.db.models import PROTECT, F, Q
 
+from core.change_tracking import ChangeTrackingMixin
 from core.exceptions.domain_exceptions import BusinessRuleException
 from employees.models import Employee
 from telecom.models import PhoneLine
@@ -14,8 +15,9 @@ class LineAllocationQuerySet(models.QuerySet):
         )
 
 
-class LineAllocation(models.Model):
+class LineAllocation(ChangeTrackingMixin, models.Model):
     objects = LineAllocationQuerySet.as_manager()
+    tracked_fields = ("employee", "is_active")
 
     class LineStatus(models.TextChoices):
         UNDER_ANALYSIS = "under_analysis", "Em análise"
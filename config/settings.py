@@ -139,6 +139,35 @@ if "pytest" in sys.modules:
         "NAME": os.path.join(BASE_DIR, "test_db.sqlite3"),
     }
 
+# Cache compartilhado entre workers (ex.: CACHE_URL=redis://redis:6379/1).
+# O padrao em memoria local atende desenvolvimento e testes.
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+# Com cache local, invalidacoes feitas por um worker nao chegam aos demais.
+CACHE_IS_SHARED = CACHES["default"]["BACKEND"] not in {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+DASHBOARD_TODAY_INDICATOR_CACHE_TTL = env.int(
+    "DASHBOARD_TODAY_INDICATOR_CACHE_TTL", default=30
+)
+# Le entregues/reconectados/novos da tabela de contadores incrementais.
+# Habilite apos popular com `manage.py rebuild_dashboard_counters`.
+DASHBOARD_EVENT_COUNTERS_ENABLED = env.bool(
+    "DASHBOARD_EVENT_COUNTERS_ENABLED", default=False
+)
+# Validade maxima (s) dos ETags dos endpoints de polling/listagem.
+CONDITIONAL_GET_MAX_AGE = env.int("CONDITIONAL_GET_MAX_AGE", default=30)
+# Validade maxima (s) dos contadores de inventario em cache; as escritas via
+# signals ja invalidam antes disso.
+INVENTORY_COUNTERS_CACHE_TTL = env.int("INVENTORY_COUNTERS_CACHE_TTL", default=300)
+# Validade maxima (s) do escopo de acesso (funcionarios visiveis) em cache;
+# os signals de Employee e SystemUser ja invalidam antes disso.
+ROLE_SCOPE_CACHE_TTL = env.int("ROLE_SCOPE_CACHE_TTL", default=60)
+# Linhas por pagina da tabela de Acoes do Dia.
+DASHBOARD_ACTION_BOARD_PAGE_SIZE = env.int(
+    "DASHBOARD_ACTION_BOARD_PAGE_SIZE", default=50
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -226,6 +255,22 @@ RECONNECT_MONGO_COLLECTION = env(
     "RECONNECT_MONGO_COLLECTION", default="reconnect_sessions"
 )
 RECONNECT_POLL_INTERVAL_MS = env.int("RECONNECT_POLL_INTERVAL_MS", default=1000)
+# Validade do cache por processo dos documentos de sessao (0 desativa).
+RECONNECT_SESSION_CACHE_TTL_MS = env.int(
+    "RECONNECT_SESSION_CACHE_TTL_MS", default=RECONNECT_POLL_INTERVAL_MS
+)
+# Revalidacao do indice unico de reconexao: positivo / ausente ou com erro.
+RECONNECT_INDEX_CHECK_INTERVAL_SECONDS = env.int(
+    "RECONNECT_INDEX_CHECK_INTERVAL_SECONDS", default=300
+)
+RECONNECT_INDEX_RETRY_SECONDS = env.int("RECONNECT_INDEX_RETRY_SECONDS", default=30)
+# Status da reconexao por SSE em vez de polling; requer servir config.asgi.
+RECONNECT_STATUS_STREAM_ENABLED = env.bool(
+    "RECONNECT_STATUS_STREAM_ENABLED", default=False
+)
+RECONNECT_STATUS_STREAM_MAX_SECONDS = env.int(
+    "RECONNECT_STATUS_STREAM_MAX_SECONDS", default=55
+)
 
 try:
     RECONNECT_TARGET_SERVER_BY_ORIGEM = json.loads(
@@ -14,6 +14,14 @@ ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", default=[])
 if not ALLOWED_HOSTS:
     raise ImproperlyConfigured("ALLOWED_HOSTS deve ser definido em produção.")
 
+# Os caches de indicadores, ETags e escopo de acesso sao invalidados por
+# signals; com varios workers gunicorn o cache precisa ser compartilhado.
+if not CACHE_IS_SHARED:  # noqa: F405
+    raise ImproperlyConfigured(
+        "CACHE_URL deve apontar para um cache compartilhado (ex.: Redis) em "
+        "produção."
+    )
+
 # Exemplos de flags seguras adicionais (ajuste conforme infraestrutura):
 CSRF_COOKIE_SECURE = True
 SESSION_COOKIE_SECURE = True
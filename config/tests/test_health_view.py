@@ -34,3 +34,24 @@ class HealthCheckViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "ok"})
         self.assertEqual(response["Cache-Control"], "no-store")
+
+    @override_settings(RECONNECT_ENABLED=True)
+    def test_health_reports_cached_reconnect_index_status(self):
+        from telecom.services.reconnect_index_health_service import (
+            get_reconnect_index_health,
+        )
+
+        index_health = get_reconnect_index_health()
+        index_health.reset()
+        self.addCleanup(index_health.reset)
+
+        response = self.client.get(reverse("health"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "status": "ok",
+                "reconnect_index": {"status": "unknown", "checked_at": None},
+            },
+        )
@@ -113,7 +113,15 @@ class HealthCheckView(View):
             response["Cache-Control"] = "no-store"
             return response
 
-        response = JsonResponse({"status": "ok"})
+        payload = {"status": "ok"}
+        if getattr(settings, "RECONNECT_ENABLED", False):
+            from telecom.services.reconnect_index_health_service import (
+                get_reconnect_index_health,
+            )
+
+            # Estado ja conhecido pelo processo; o health check nao consulta o Mongo.
+            payload["reconnect_index"] = get_reconnect_index_health().snapshot()
+        response = JsonResponse(payload)
         response["Cache-Control"] = "no-store"
         return response
 
@@ -0,0 +1,76 @@
+"""
+Rastreamento de alteracoes de campos sem reler a linha no pre_save.
+
+Models com ChangeTrackingMixin guardam em from_db os valores carregados dos
+campos listados em tracked_fields; os signals de historico comparam com esse
+snapshot em vez de fazer Model.objects.get(pk=...) a cada save. O snapshot e
+atualizado apos cada save (apenas update_fields, quando informados) e em
+refresh_from_db. Instancias sem snapshot completo (criadas com pk manual ou
+carregadas com only()/defer()) buscam so os campos que faltam, numa unica
+consulta.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+
+
+class ChangeTrackingMixin:
+    tracked_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._tracked_snapshot = {}
+        instance._store_tracked_snapshot()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if not hasattr(self, "_tracked_snapshot"):
+            self._tracked_snapshot = {}
+        self._store_tracked_snapshot(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if hasattr(self, "_tracked_snapshot"):
+            self._store_tracked_snapshot(fields)
+
+    def get_previous_values(self):
+        """
+        Valores persistidos (por attname) dos campos rastreados.
+
+        Retorna None se a linha nao existe mais no banco.
+        """
+        snapshot = getattr(self, "_tracked_snapshot", {})
+        missing = [
+            attname for attname in self._tracked_attnames() if attname not in snapshot
+        ]
+        if not missing:
+            return dict(snapshot)
+
+        row = type(self)._base_manager.filter(pk=self.pk).values(*missing).first()
+        if row is None:
+            return None
+        return {**snapshot, **row}
+
+    def get_previous_display(self, field_name, value):
+        """Rotulo das choices para um valor anterior (como get_FOO_display)."""
+        field = self._meta.get_field(field_name)
+        return str(dict(field.flatchoices).get(value, value))
+
+    def _tracked_attnames(self):
+        return [self._meta.get_field(name).attname for name in self.tracked_fields]
+
+    def _store_tracked_snapshot(self, field_names=None):
+        attnames = self._tracked_attnames()
+        if field_names is not None:
+            selected = set()
+            for name in field_names:
+                try:
+                    selected.add(self._meta.get_field(name).attname)
+                except FieldDoesNotExist:
+                    selected.add(name)
+            attnames = [attname for attname in attnames if attname in selected]
+        for attname in attnames:
+            # Campos adiados (only/defer) nao estao no __dict__.
+            if attname in self.__dict__:
+                self._tracked_snapshot[attname] = self.__dict__[attname]
@@ -0,0 +1,19 @@
+"""
+Comparacao de e-mail sem diferenciar maiusculas que aproveita indices.
+
+field__iexact vira UPPER(campo) = UPPER(valor) no PostgreSQL e LIKE no
+SQLite; nenhum dos dois usa o indice simples do campo. email_iexact gera
+LOWER(campo) = valor normalizado, atendido pelos indices funcionais
+Lower(campo) declarados nos models de escopo (Employee, SystemUser,
+DailyIndicator).
+"""
+
+from django.db.models.functions import Lower
+from django.db.models.lookups import Exact
+
+from core.normalization import normalize_email_address
+
+
+def email_iexact(field_name: str, email: str | None) -> Exact:
+    """Equivalente a Q(**{f"{field_name}__iexact": email}) com indice Lower."""
+    return Exact(Lower(field_name), normalize_email_address(email))
@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.synthetic_data_service import (
+    SyntheticDatasetConfig,
+    generate_synthetic_dataset,
+    purge_synthetic_dataset,
+)
+
+DEFAULT_VOLUMES = {
+    "employees": 5_000,
+    "lines": 20_000,
+    "allocations": 200_000,
+    "history": 1_000_000,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera massa sintetica (funcionarios, linhas, alocacoes, historico, "
+        "pendencias) para benchmarks. Use --scale para reduzir o volume."
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_VOLUMES.items():
+            parser.add_argument(
+                f"--{name}",
+                type=int,
+                default=default,
+                help=f"Quantidade de {name} antes da escala (padrao: {default}).",
+            )
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiplica todos os volumes (ex.: 0.01 para um teste rapido).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Remove a massa sintetica existente e encerra.",
+        )
+
+    def handle(self, *args, **options):
+        if options["purge"]:
+            try:
+                employees, lines = purge_synthetic_dataset()
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Massa sintetica removida: {employees} funcionario(s), "
+                    f"{lines} linha(s)."
+                )
+            )
+            return
+
+        if options["scale"] <= 0 or options["batch_size"] < 1:
+            raise CommandError("--scale e --batch-size devem ser maiores que 0.")
+        volumes = {
+            name: max(1, int(options[name] * options["scale"]))
+            for name in DEFAULT_VOLUMES
+        }
+        try:
+            summary = generate_synthetic_dataset(
+                SyntheticDatasetConfig(
+                    **volumes,
+                    seed=options["seed"],
+                    batch_size=options["batch_size"],
+                ),
+                progress=self.stdout.write,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        details = ", ".join(
+            f"{key}={value}" for key, value in summary.to_dict().items()
+        )
+        self.stdout.write(self.style.SUCCESS(f"Massa sintetica gerada: {details}."))
@@ -0,0 +1,88 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.benchmark_service import (
+    BENCHMARK_SCENARIOS,
+    DEFAULT_BUDGETS_PATH,
+    check_budget,
+    load_budgets,
+    run_benchmarks,
+    save_budgets,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede tempo e quantidade de queries dos cenarios criticos e falha "
+        "quando algum orcamento e ultrapassado."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=sorted(BENCHMARK_SCENARIOS),
+            help="Cenario a executar (pode repetir). Padrao: todos.",
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--budgets",
+            default=str(DEFAULT_BUDGETS_PATH),
+            help="Arquivo JSON de orcamentos.",
+        )
+        parser.add_argument(
+            "--time-tolerance",
+            type=float,
+            default=0.2,
+            help="Folga sobre max_seconds antes de falhar (padrao: 0.2 = 20%%).",
+        )
+        parser.add_argument(
+            "--queries-only",
+            action="store_true",
+            help="Confere apenas a contagem de queries (util em CI compartilhado).",
+        )
+        parser.add_argument(
+            "--update-budgets",
+            action="store_true",
+            help="Grava os valores medidos como novos orcamentos.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = run_benchmarks(options["scenario"], repeat=options["repeat"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        for result in results:
+            if result.skipped:
+                self.stdout.write(f"{result.name:<26} ignorado ({result.skipped})")
+                continue
+            self.stdout.write(
+                f"{result.name:<26} {result.seconds * 1000:>9.1f} ms "
+                f"{result.queries:>5} queries"
+            )
+
+        if options["update_budgets"]:
+            save_budgets(results, options["budgets"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Orcamentos gravados em {options['budgets']}.")
+            )
+            return
+
+        budgets = load_budgets(options["budgets"])
+        violations = [
+            violation
+            for result in results
+            for violation in check_budget(
+                result,
+                budgets.get(result.name),
+                time_tolerance=options["time_tolerance"],
+                check_time=not options["queries_only"],
+            )
+        ]
+        if violations:
+            for violation in violations:
+                self.stderr.write(violation)
+            raise CommandError(
+                f"{len(violations)} orcamento(s) de benchmark ultrapassado(s)."
+            )
+        self.stdout.write(self.style.SUCCESS("Benchmarks dentro do orcamento."))
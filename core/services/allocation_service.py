@@ -5,6 +5,7 @@ from django.utils import timezone
 
 from allocations.models import LineAllocation
 from core.exceptions.domain_exceptions import BusinessRuleException
+from dashboard.services.event_counter_service import record_line_allocated
 from employees.models import Employee
 from telecom.models import PhoneLine
 
@@ -62,6 +63,7 @@ class AllocationService:
             allocated_by=allocated_by,
             is_active=True,
         )
+        record_line_allocated(allocation)
 
         phone_line.status = PhoneLine.Status.ALLOCATED
         phone_line._history_origin_action = "ALLOCATED"
@@ -0,0 +1,257 @@
+"""
+Benchmarks das views e servicos mais pesados, com orcamento de custo.
+
+Cada cenario roda dentro de uma transacao desfeita ao final (o upload nao
+persiste nada), medindo tempo de parede e quantidade de queries. Os
+orcamentos ficam em config/benchmark_budgets.json; a contagem de queries e
+estavel entre ambientes, o tempo depende do hardware e do volume de dados.
+"""
+
+import json
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from telecom.models import PhoneLine
+from users.models import SystemUser
+
+DEFAULT_BUDGETS_PATH = Path(settings.BASE_DIR) / "config" / "benchmark_budgets.json"
+UPLOAD_BENCHMARK_ROWS = 100
+
+
+@dataclass
+class BenchmarkContext:
+    admin: SystemUser
+    day: object
+    upload_path: Path
+    reconnect_line: PhoneLine | None = None
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    seconds: float | None = None
+    queries: int | None = None
+    skipped: str = ""
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    name: str
+    run: object
+    skip_reason: object = None
+
+    def get_skip_reason(self, context):
+        return self.skip_reason(context) if self.skip_reason else ""
+
+
+def _run_indicator_for_day(context):
+    from dashboard.views import build_indicator_for_day
+
+    build_indicator_for_day(context.day)
+
+
+def _run_daily_user_action_rows(context):
+    from dashboard.views import (
+        build_daily_user_action_rows,
+        get_supervised_employees_queryset,
+    )
+
+    build_daily_user_action_rows(
+        get_supervised_employees_queryset(context.admin), context.admin
+    )
+
+
+def _run_pendency_metrics(context):
+    from dashboard.services.metrics_service import build_pendency_metrics
+
+    build_pendency_metrics(context.admin)
+
+
+def _run_telecom_overview_ajax(context):
+    from telecom.views import TelecomOverviewView
+
+    request = RequestFactory().get(
+        reverse("telecom:overview"),
+        {"table": "main", "limit": 50},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    request.user = context.admin
+    view = TelecomOverviewView()
+    view.setup(request)
+    view._handle_ajax_request(request)
+
+
+def _run_upload_file(context):
+    from core.services.upload_service import process_upload_file
+
+    process_upload_file(context.upload_path)
+
+
+def _run_reconnect_status(context):
+    from telecom.views import PhoneLineReconnectStatusView
+
+    request = RequestFactory().get(
+        reverse("telecom:phoneline_reconnect_status", args=[context.reconnect_line.pk])
+    )
+    request.user = context.admin
+    PhoneLineReconnectStatusView.as_view()(request, pk=context.reconnect_line.pk)
+
+
+def _reconnect_skip_reason(context):
+    if not settings.RECONNECT_ENABLED:
+        return "RECONNECT_ENABLED desativado"
+    if context.reconnect_line is None:
+        return "nenhuma linha SRVMEMU-01 visivel"
+    return ""
+
+
+BENCHMARK_SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        BenchmarkScenario("indicator_for_day", _run_indicator_for_day),
+        BenchmarkScenario("daily_user_action_rows", _run_daily_user_action_rows),
+        BenchmarkScenario("pendency_metrics", _run_pendency_metrics),
+        BenchmarkScenario("telecom_overview_ajax", _run_telecom_overview_ajax),
+        BenchmarkScenario("upload_file", _run_upload_file),
+        BenchmarkScenario(
+            "reconnect_status", _run_reconnect_status, _reconnect_skip_reason
+        ),
+    )
+}
+
+
+def _write_upload_file(directory):
+    lines = [
+        "type,full_name,corporate_email,employee_id,teams,status,iccid,carrier,"
+        "phone_number,origem"
+    ]
+    for index in range(UPLOAD_BENCHMARK_ROWS // 2):
+        lines.append(
+            f"employee,Benchmark Upload {index:04d},supervisor@benchmark.local,"
+            "Natura,Joinville,ativo,,,,"
+        )
+        lines.append(
+            f"simcard,,,,,,{8997000000000000000 + index},Vivo,"
+            f"+55970{index:08d},SRVMEMU-01"
+        )
+    path = Path(directory) / "benchmark_upload.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def build_benchmark_context(directory, admin=None):
+    admin = admin or (
+        SystemUser.objects.filter(role=SystemUser.Role.ADMIN, is_active=True)
+        .order_by("pk")
+        .first()
+    )
+    if admin is None:
+        raise ValueError("Nenhum usuario admin ativo para executar os benchmarks.")
+    reconnect_line = (
+        PhoneLine.objects.filter(
+            origem=PhoneLine.Origem.SRVMEMU_01,
+            sim_card__is_deleted=False,
+        )
+        .order_by("pk")
+        .first()
+    )
+    return BenchmarkContext(
+        admin=admin,
+        day=timezone.localdate(),
+        upload_path=_write_upload_file(directory),
+        reconnect_line=reconnect_line,
+    )
+
+
+def run_scenario(scenario, context, repeat=3):
+    """Mediana do tempo e maior contagem de queries entre as repeticoes."""
+    skip_reason = scenario.get_skip_reason(context)
+    if skip_reason:
+        return BenchmarkResult(name=scenario.name, skipped=skip_reason)
+
+    timings = []
+    query_counts = []
+    for _ in range(max(repeat, 1)):
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as captured:
+                started_at = time.perf_counter()
+                scenario.run(context)
+                timings.append(time.perf_counter() - started_at)
+            query_counts.append(len(captured.captured_queries))
+            transaction.set_rollback(True)
+
+    return BenchmarkResult(
+        name=scenario.name,
+        seconds=statistics.median(timings),
+        queries=max(query_counts),
+    )
+
+
+def run_benchmarks(names=None, repeat=3, admin=None):
+    names = names or list(BENCHMARK_SCENARIOS)
+    unknown = sorted(set(names) - set(BENCHMARK_SCENARIOS))
+    if unknown:
+        raise ValueError(f"Cenario(s) desconhecido(s): {', '.join(unknown)}.")
+
+    with tempfile.TemporaryDirectory() as directory:
+        context = build_benchmark_context(directory, admin=admin)
+        return [
+            run_scenario(BENCHMARK_SCENARIOS[name], context, repeat=repeat)
+            for name in names
+        ]
+
+
+def load_budgets(path=DEFAULT_BUDGETS_PATH):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_budgets(results, path=DEFAULT_BUDGETS_PATH):
+    budgets = load_budgets(path)
+    for result in results:
+        if result.skipped:
+            continue
+        budgets[result.name] = {
+            "max_queries": result.queries,
+            "max_seconds": round(result.seconds, 3),
+        }
+    Path(path).write_text(
+        json.dumps(budgets, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return budgets
+
+
+def check_budget(result, budget, time_tolerance=0.2, check_time=True):
+    """Lista as violacoes de orcamento do resultado (vazia quando ok)."""
+    if result.skipped or not budget:
+        return []
+
+    violations = []
+    max_queries = budget.get("max_queries")
+    if max_queries is not None and result.queries > max_queries:
+        violations.append(
+            f"{result.name}: {result.queries} queries (orcamento {max_queries})"
+        )
+    max_seconds = budget.get("max_seconds")
+    if (
+        check_time
+        and max_seconds is not None
+        and result.seconds > max_seconds * (1 + time_tolerance)
+    ):
+        violations.append(
+            f"{result.name}: {result.seconds:.3f}s (orcamento {max_seconds:.3f}s "
+            f"+{time_tolerance:.0%})"
+        )
+    return violations
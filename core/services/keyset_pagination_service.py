@@ -0,0 +1,78 @@
+"""
+Paginacao por cursor (keyset) para listagens com carregamento incremental.
+
+Em vez de OFFSET + COUNT, cada pagina filtra pelos valores da ultima linha
+entregue na ordenacao informada e busca limit + 1 registros para saber se ha
+proxima pagina. O custo de cada pagina nao cresce com a profundidade.
+"""
+
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+
+
+def _split_ordering(ordering):
+    return [(field.lstrip("-"), field.startswith("-")) for field in ordering]
+
+
+def encode_cursor(instance, ordering):
+    values = []
+    for field_name, _ in _split_ordering(ordering):
+        value = getattr(instance, field_name)
+        values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+    payload = json.dumps(values)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(raw_cursor, model, ordering):
+    """Valores do cursor convertidos para o tipo dos campos; None se invalido."""
+    if not raw_cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(raw_cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    fields = _split_ordering(ordering)
+    if not isinstance(values, list) or len(values) != len(fields):
+        return None
+    try:
+        return [
+            model._meta.get_field(field_name).to_python(value)
+            for (field_name, _), value in zip(fields, values, strict=True)
+        ]
+    except Exception:
+        return None
+
+
+def _after_cursor_q(ordering, values):
+    """(a, b) > (va, vb) respeitando a direcao de cada campo."""
+    condition = Q()
+    equal_prefix = {}
+    for (field_name, descending), value in zip(
+        _split_ordering(ordering), values, strict=True
+    ):
+        lookup = "lt" if descending else "gt"
+        condition |= Q(**equal_prefix, **{f"{field_name}__{lookup}": value})
+        equal_prefix[field_name] = value
+    return condition
+
+
+def keyset_page(queryset, ordering, cursor="", limit=10):
+    """
+    Retorna (itens, proximo cursor, has_more) da pagina apos o cursor.
+
+    ordering deve terminar em um campo unico (ex.: id) para desempatar; cursor
+    invalido ou vazio devolve a primeira pagina.
+    """
+    queryset = queryset.order_by(*ordering)
+    values = decode_cursor(cursor, queryset.model, ordering)
+    if values is not None:
+        queryset = queryset.filter(_after_cursor_q(ordering, values))
+
+    items = list(queryset[: limit + 1])
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = encode_cursor(items[-1], ordering) if has_more else ""
+    return items, next_cursor, has_more
@@ -0,0 +1,36 @@
+"""
+Consulta "ultimo registro por chave" resolvida no banco.
+
+No PostgreSQL usa DISTINCT ON; nos demais bancos (SQLite nos testes) usa
+ROW_NUMBER() particionado, filtrado na propria query. Substitui o padrao de
+carregar todo o historico ordenado e manter o primeiro de cada chave em Python.
+"""
+
+from django.db import connections
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+LATEST_ROW_RANK = "latest_row_rank"
+
+
+def latest_per_key(queryset, key_fields, ordering):
+    """
+    Restringe o queryset ao primeiro registro de cada chave segundo ordering.
+
+    key_fields aceita campos ou anotacoes ja presentes no queryset; ordering
+    segue a sintaxe de order_by ("-changed_at", "-id").
+    """
+    key_fields = list(key_fields)
+    ordering = list(ordering)
+    if connections[queryset.db].features.can_distinct_on_fields:
+        return queryset.order_by(*key_fields, *ordering).distinct(*key_fields)
+
+    return queryset.annotate(
+        **{
+            LATEST_ROW_RANK: Window(
+                expression=RowNumber(),
+                partition_by=[F(field) for field in key_fields],
+                order_by=ordering,
+            )
+        }
+    ).filter(**{LATEST_ROW_RANK: 1})
@@ -0,0 +1,37 @@
+"""
+Busca por trecho de numero de linha e ICCID.
+
+Operadores digitam parte dos digitos (normalmente os ultimos 4 ou 5). A busca
+usa LIKE '%termo%' sensivel a maiusculas, que no PostgreSQL e atendido pelos
+indices GIN pg_trgm de telecom_phoneline.phone_number e telecom_simcard.iccid;
+o UPPER() gerado por icontains impediria o uso desses indices. Como os campos
+so tem digitos e '+', o resultado e o mesmo de icontains. Em SQLite o mesmo
+filtro roda sem indice.
+"""
+
+from django.db.models import Q
+
+from core.validation import normalize_phone_number
+
+
+def normalize_number_search(value):
+    """Remove espacos, hifens e parenteses digitados junto com o numero."""
+    return normalize_phone_number(value)
+
+
+def number_search_q(value, *fields):
+    """Q com OR de "contem o trecho" nos campos; None quando a busca e vazia."""
+    term = normalize_number_search(value)
+    if not term:
+        return None
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__contains": term})
+    return condition
+
+
+def filter_by_number(queryset, value, *fields):
+    condition = number_search_q(value, *fields)
+    if condition is None:
+        return queryset
+    return queryset.filter(condition)
@@ -0,0 +1,128 @@
+"""
+Escopo de acesso do usuario (funcionarios visiveis) resolvido uma vez.
+
+SystemUser.scope_employee_queryset e PhoneLine.visible_to_user eram
+remontados a cada chamada, com subconsultas __in e comparacoes iexact de
+e-mail repetidas varias vezes na mesma requisicao. O RoleScope guarda os ids
+dos funcionarios visiveis e os e-mails dos supervisores geridos; fica
+memorizado na instancia do usuario (request.user vive uma requisicao) e,
+com cache compartilhado entre workers (CACHE_IS_SHARED), no cache por
+ROLE_SCOPE_CACHE_TTL segundos entre requisicoes. Com cache local os signals
+so invalidariam o worker que fez a escrita, e um supervisor continuaria
+vendo funcionarios reatribuidos nos demais; nesse caso fica so a memoria
+da requisicao.
+
+A chave inclui o carimbo do namespace de escopo, incrementado pelos signals
+de Employee e SystemUser; o TTL limita a defasagem de escritas sem signals
+(queryset.update(), bulk_create()).
+"""
+
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from core.lookups import email_iexact
+from core.services.version_stamp_service import get_version_stamp
+
+ROLE_SCOPE_VERSION_NAMESPACE = "role-scope"
+ROLE_SCOPE_PREFIX = "role-scope"
+ROLE_SCOPE_ATTR = "_role_scope_cache"
+
+
+def get_role_scope_ttl():
+    return getattr(settings, "ROLE_SCOPE_CACHE_TTL", 60)
+
+
+def uses_shared_scope_cache():
+    return getattr(settings, "CACHE_IS_SHARED", False)
+
+
+@dataclass(frozen=True)
+class RoleScope:
+    unrestricted: bool
+    employee_ids: tuple[int, ...] = ()
+    managed_supervisor_emails: frozenset[str] = frozenset()
+
+    def filter_employees(self, queryset):
+        """Restringe um queryset de Employee aos funcionarios visiveis."""
+        return self.filter_by_employee(queryset, "pk")
+
+    def filter_by_employee(self, queryset, field="employee_id"):
+        """Restringe qualquer queryset pelo campo que aponta para Employee."""
+        if self.unrestricted:
+            return queryset
+        if not self.employee_ids:
+            return queryset.none()
+        return queryset.filter(**{f"{field}__in": self.employee_ids})
+
+
+def _scope_key(user, stamp):
+    return ":".join(
+        (
+            ROLE_SCOPE_PREFIX,
+            str(stamp),
+            str(user.pk),
+            user.role or "",
+            (user.email or "").casefold(),
+            (user.supervisor_email or "").strip().casefold(),
+        )
+    )
+
+
+def build_role_scope(user):
+    """Calcula o escopo no banco (no maximo duas consultas)."""
+    if user.role not in (*user.SUPERVISOR_SCOPE_ROLES, user.Role.GERENTE):
+        return RoleScope(unrestricted=True)
+
+    employee_model = apps.get_model("employees", "Employee")
+    # all_objects: o escopo vale tambem para querysets com excluidos.
+    employees = employee_model.all_objects.all()
+    managed_supervisor_emails = frozenset()
+    if user.role == user.Role.GERENTE:
+        managed_supervisor_emails = frozenset(
+            user.__class__.objects.filter(
+                email_iexact("manager_email", user.email),
+                role=user.Role.SUPER,
+            ).values_list("email", flat=True)
+        )
+        employees = employees.filter(
+            Q(email_iexact("manager_email", user.email))
+            | Q(corporate_email__in=managed_supervisor_emails)
+        )
+    else:
+        supervisor_email = user.get_effective_supervisor_email()
+        if not supervisor_email:
+            return RoleScope(unrestricted=False)
+        employees = employees.filter(email_iexact("corporate_email", supervisor_email))
+
+    return RoleScope(
+        unrestricted=False,
+        employee_ids=tuple(employees.order_by("pk").values_list("pk", flat=True)),
+        managed_supervisor_emails=managed_supervisor_emails,
+    )
+
+
+def get_role_scope(user):
+    """
+    Escopo do usuario, memorizado na instancia e no cache compartilhado.
+
+    Cada chamada le apenas o carimbo de versao; o banco so e consultado
+    quando o escopo ainda nao esta em cache ou foi invalidado. Sem cache
+    compartilhado, cada requisicao recalcula o escopo uma vez.
+    """
+    key = _scope_key(user, get_version_stamp(ROLE_SCOPE_VERSION_NAMESPACE))
+    memo = getattr(user, ROLE_SCOPE_ATTR, None)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    shared = uses_shared_scope_cache()
+    scope = cache.get(key) if shared else None
+    if scope is None:
+        scope = build_role_scope(user)
+        if shared:
+            cache.set(key, scope, timeout=get_role_scope_ttl())
+    setattr(user, ROLE_SCOPE_ATTR, (key, scope))
+    return scope
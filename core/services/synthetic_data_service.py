@@ -0,0 +1,420 @@
+"""
+Gerador de massa sintetica para medir custo de views e servicos.
+
+Grava em lote (bulk_create) sem disparar signals; datas sao espalhadas por
+lote com um UPDATE, ja que allocated_at/changed_at usam auto_now_add.
+
+A massa e marcada com valores que nunca aparecem em dados reais: usuarios e
+funcionarios usam o dominio SYNTHETIC_EMAIL_DOMAIN e SIMcards o prefixo de
+ICCID SYNTHETIC_ICCID_PREFIX (ICCIDs reais comecam com 89). Linhas sinteticas
+sao sempre alcancadas pelos SIMcards marcados, nunca pelo numero. Geracao e
+remocao sao recusadas com APP_ENV=prod.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard.models import DailyUserAction
+from employees.models import Employee, EmployeeHistory
+from pendencies.models import AllocationPendency
+from telecom.models import PhoneLine, PhoneLineHistory, SIMcard
+from users.models import SystemUser
+
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.lineops.local"
+SYNTHETIC_ADMIN_EMAIL = f"admin@{SYNTHETIC_EMAIL_DOMAIN}"
+# DDD 00 nao existe; o numero e so cosmetico, a marca e o ICCID.
+SYNTHETIC_PHONE_PREFIX = "+5500"
+SYNTHETIC_ICCID_PREFIX = "0000"
+SYNTHETIC_CARRIERS = ("Vivo", "Claro", "TIM")
+EMPLOYEES_PER_SUPERVISOR = 25
+SUPERVISORS_PER_MANAGER = 5
+ACTIVE_LINE_RATIO = 0.7
+PHONE_LINE_HISTORY_RATIO = 0.7
+ACTIVE_EMPLOYEE_RATIO = 0.9
+ACTIVE_LINE_STATUS_RATIO = 0.8
+# Sobre as alocacoes ativas: pendencias abertas, parte delas ja com
+# responsavel tecnico, e acoes do dia.
+OPEN_PENDENCY_RATIO = 0.10
+CLAIMED_PENDENCY_RATIO = 0.05
+DAILY_ACTION_RATIO = 0.05
+SPREAD_DAYS = 180
+
+
+@dataclass(frozen=True)
+class SyntheticDatasetConfig:
+    employees: int
+    lines: int
+    allocations: int
+    history: int
+    seed: int = 0
+    batch_size: int = 5000
+
+
+@dataclass(frozen=True)
+class _BuildContext:
+    admin: SystemUser
+    rng: random.Random
+    batch_size: int
+
+
+@dataclass
+class SyntheticDatasetSummary:
+    users: int = 0
+    employees: int = 0
+    lines: int = 0
+    allocations: int = 0
+    history: int = 0
+    pendencies: int = 0
+    daily_actions: int = 0
+
+    def to_dict(self):
+        return {
+            "users": self.users,
+            "employees": self.employees,
+            "lines": self.lines,
+            "allocations": self.allocations,
+            "history": self.history,
+            "pendencies": self.pendencies,
+            "daily_actions": self.daily_actions,
+        }
+
+
+def ensure_synthetic_data_allowed():
+    if getattr(settings, "APP_ENV", "dev") == "prod":
+        raise ValueError("Massa sintetica nao pode ser gerada ou removida em producao.")
+
+
+def _synthetic_phone_lines():
+    return PhoneLine.all_objects.filter(
+        sim_card__iccid__startswith=SYNTHETIC_ICCID_PREFIX
+    )
+
+
+def _batched(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _spread_moment(now, batch_index, batch_count):
+    """Momento do lote: do mais antigo (SPREAD_DAYS atras) ate hoje."""
+    if batch_count <= 1:
+        return now
+    days_back = SPREAD_DAYS - (SPREAD_DAYS * batch_index) // (batch_count - 1)
+    return now - timedelta(days=days_back)
+
+
+def _create_users(employee_count):
+    password = make_password(None)
+    supervisor_count = max(1, -(-employee_count // EMPLOYEES_PER_SUPERVISOR))
+    manager_count = max(1, -(-supervisor_count // SUPERVISORS_PER_MANAGER))
+    managers = [
+        SystemUser(
+            email=f"gerente{index:04d}@{SYNTHETIC_EMAIL_DOMAIN}",
+            password=password,
+            role=SystemUser.Role.GERENTE,
+        )
+        for index in range(manager_count)
+    ]
+    supervisors = [
+        SystemUser(
+            email=f"super{index:04d}@{SYNTHETIC_EMAIL_DOMAIN}",
+            password=password,
+            role=SystemUser.Role.SUPER,
+            manager_email=managers[index // SUPERVISORS_PER_MANAGER].email,
+        )
+        for index in range(supervisor_count)
+    ]
+    admin = SystemUser(
+        email=SYNTHETIC_ADMIN_EMAIL,
+        password=password,
+        role=SystemUser.Role.ADMIN,
+    )
+    SystemUser.objects.bulk_create([admin, *managers, *supervisors])
+    return SystemUser.objects.get(email=SYNTHETIC_ADMIN_EMAIL), supervisors
+
+
+def _create_employees(count, supervisors, context):
+    rng = context.rng
+
+    def build():
+        for index in range(count):
+            supervisor = supervisors[index // EMPLOYEES_PER_SUPERVISOR]
+            yield Employee(
+                full_name=f"Sintetico {index:06d}",
+                email=f"negociador{index:06d}@{SYNTHETIC_EMAIL_DOMAIN}",
+                corporate_email=supervisor.email,
+                manager_email=supervisor.manager_email,
+                employee_id=rng.choice(("Natura", "Pepsico", "Claro", "Vivo")),
+                teams=rng.choice(Employee.UnitChoices.values),
+                status=(
+                    Employee.Status.ACTIVE
+                    if rng.random() < ACTIVE_EMPLOYEE_RATIO
+                    else Employee.Status.INACTIVE
+                ),
+                pa=f"PA-{index % 300:03d}",
+            )
+
+    for batch in _batched(build(), context.batch_size):
+        Employee.objects.bulk_create(batch)
+    return list(
+        Employee.objects.filter(email__endswith=f"@{SYNTHETIC_EMAIL_DOMAIN}")
+        .values_list("id", flat=True)
+        .order_by("id")
+    )
+
+
+def _create_lines(count, context):
+    rng, batch_size = context.rng, context.batch_size
+    active_count = int(count * ACTIVE_LINE_RATIO)
+    origens = PhoneLine.Origem.values
+    for batch_start in range(0, count, batch_size):
+        indexes = range(batch_start, min(batch_start + batch_size, count))
+        sim_cards = SIMcard.objects.bulk_create(
+            [
+                SIMcard(
+                    iccid=f"{SYNTHETIC_ICCID_PREFIX}{index:015d}",
+                    carrier=rng.choice(SYNTHETIC_CARRIERS),
+                    status=SIMcard.Status.AVAILABLE,
+                )
+                for index in indexes
+            ]
+        )
+        PhoneLine.objects.bulk_create(
+            [
+                PhoneLine(
+                    phone_number=f"{SYNTHETIC_PHONE_PREFIX}{index:09d}",
+                    sim_card=sim_card,
+                    status=(
+                        PhoneLine.Status.ALLOCATED
+                        if index < active_count
+                        else PhoneLine.Status.AVAILABLE
+                    ),
+                    origem=rng.choice(origens),
+                    canal=rng.choice(PhoneLine.Canal.values),
+                )
+                for index, sim_card in zip(indexes, sim_cards, strict=True)
+            ]
+        )
+    return list(_synthetic_phone_lines().values_list("id", flat=True).order_by("id"))
+
+
+def _create_allocations(count, employee_ids, line_ids, context):
+    """
+    Historico de alocacoes encerradas seguido de uma alocacao ativa para cada
+    linha ALLOCATED (as primeiras ACTIVE_LINE_RATIO linhas), a mais recente.
+    """
+    admin, rng, batch_size = context.admin, context.rng, context.batch_size
+    now = timezone.now()
+    active_count = min(int(len(line_ids) * ACTIVE_LINE_RATIO), count)
+    released_count = count - active_count
+    batch_count = max(1, -(-count // batch_size))
+    line_statuses = LineAllocation.LineStatus.values
+
+    def build():
+        for index in range(count):
+            is_active = index >= released_count
+            line_index = index - released_count if is_active else index
+            yield LineAllocation(
+                employee_id=employee_ids[index % len(employee_ids)],
+                phone_line_id=line_ids[line_index % len(line_ids)],
+                allocated_by=admin,
+                is_active=is_active,
+                released_at=None if is_active else now + timedelta(days=1),
+                released_by=None if is_active else admin,
+                line_status=(
+                    LineAllocation.LineStatus.ACTIVE
+                    if rng.random() < ACTIVE_LINE_STATUS_RATIO
+                    else rng.choice(line_statuses)
+                ),
+            )
+
+    active_ids = []
+    for batch_index, batch in enumerate(_batched(build(), batch_size)):
+        created = LineAllocation.objects.bulk_create(batch)
+        moment = _spread_moment(now, batch_index, batch_count)
+        batch_active_ids = [item.pk for item in created if item.is_active]
+        released_ids = [item.pk for item in created if not item.is_active]
+        active_ids.extend(batch_active_ids)
+        LineAllocation.objects.filter(pk__in=batch_active_ids).update(
+            allocated_at=moment
+        )
+        LineAllocation.objects.filter(pk__in=released_ids).update(
+            allocated_at=moment - timedelta(days=1),
+            released_at=moment,
+        )
+    return active_ids
+
+
+def _create_history(count, employee_ids, line_ids, context):
+    admin, rng, batch_size = context.admin, context.rng, context.batch_size
+    now = timezone.now()
+    line_count = int(count * PHONE_LINE_HISTORY_RATIO)
+    line_actions = PhoneLineHistory.ActionType.values
+    employee_actions = EmployeeHistory.ActionType.values
+
+    def build_line_history():
+        for index in range(line_count):
+            yield PhoneLineHistory(
+                phone_line_id=line_ids[index % len(line_ids)],
+                action=rng.choice(line_actions),
+                old_value="Status: Disponivel",
+                new_value="Status: Alocado",
+                changed_by=admin,
+                description="Historico sintetico",
+            )
+
+    def build_employee_history():
+        for index in range(count - line_count):
+            yield EmployeeHistory(
+                employee_id=employee_ids[index % len(employee_ids)],
+                action=rng.choice(employee_actions),
+                old_value="Ativo",
+                new_value="Ativo",
+                changed_by=admin,
+                description="Historico sintetico",
+            )
+
+    for model, rows, total in (
+        (PhoneLineHistory, build_line_history(), line_count),
+        (EmployeeHistory, build_employee_history(), count - line_count),
+    ):
+        batch_count = max(1, -(-total // batch_size))
+        for batch_index, batch in enumerate(_batched(rows, batch_size)):
+            created = model.objects.bulk_create(batch)
+            model.objects.filter(pk__in=[item.pk for item in created]).update(
+                changed_at=_spread_moment(now, batch_index, batch_count)
+            )
+
+
+def _create_open_work(active_allocation_ids, context):
+    """Pendencias abertas e acoes do dia sobre alocacoes ativas."""
+    admin, rng, batch_size = context.admin, context.rng, context.batch_size
+    now = timezone.now()
+    open_actions = (
+        AllocationPendency.ActionType.NEW_NUMBER,
+        AllocationPendency.ActionType.RECONNECT_WHATSAPP,
+        AllocationPendency.ActionType.PENDING,
+    )
+    allocations = LineAllocation.objects.filter(pk__in=active_allocation_ids)
+    pendencies = []
+    daily_actions = []
+    for allocation_id, employee_id in allocations.values_list("id", "employee_id"):
+        roll = rng.random()
+        if roll < OPEN_PENDENCY_RATIO:
+            action = rng.choice(open_actions)
+            pendencies.append(
+                AllocationPendency(
+                    employee_id=employee_id,
+                    allocation_id=allocation_id,
+                    action=action,
+                    last_submitted_action=action,
+                    pendency_submitted_at=now,
+                    technical_responsible=(
+                        admin if roll < CLAIMED_PENDENCY_RATIO else None
+                    ),
+                )
+            )
+        elif roll < OPEN_PENDENCY_RATIO + DAILY_ACTION_RATIO:
+            daily_actions.append(
+                DailyUserAction(
+                    day=timezone.localdate(),
+                    employee_id=employee_id,
+                    allocation_id=allocation_id,
+                    action_type=rng.choice(DailyUserAction.ActionType.values),
+                    created_by=admin,
+                )
+            )
+    AllocationPendency.objects.bulk_create(pendencies, batch_size=batch_size)
+    DailyUserAction.objects.bulk_create(daily_actions, batch_size=batch_size)
+    return len(pendencies), len(daily_actions)
+
+
+def generate_synthetic_dataset(config, progress=None):
+    """
+    Cria a massa sintetica descrita por um SyntheticDatasetConfig e retorna
+    um SyntheticDatasetSummary.
+
+    progress, se informado, recebe uma mensagem por etapa concluida.
+    """
+    ensure_synthetic_data_allowed()
+    if SystemUser.objects.filter(email=SYNTHETIC_ADMIN_EMAIL).exists():
+        raise ValueError(
+            "Massa sintetica ja existe; remova com --purge antes de gerar outra."
+        )
+
+    notify = progress or (lambda message: None)
+    summary = SyntheticDatasetSummary()
+
+    with transaction.atomic():
+        admin, supervisors = _create_users(config.employees)
+        context = _BuildContext(
+            admin=admin,
+            rng=random.Random(config.seed),
+            batch_size=config.batch_size,
+        )
+        summary.users = SystemUser.objects.filter(
+            email__endswith=f"@{SYNTHETIC_EMAIL_DOMAIN}"
+        ).count()
+        notify(f"Usuarios: {summary.users}")
+
+        employee_ids = _create_employees(config.employees, supervisors, context)
+        summary.employees = len(employee_ids)
+        notify(f"Funcionarios: {summary.employees}")
+
+        line_ids = _create_lines(config.lines, context)
+        summary.lines = len(line_ids)
+        notify(f"Linhas: {summary.lines}")
+
+        active_allocation_ids = _create_allocations(
+            config.allocations, employee_ids, line_ids, context
+        )
+        summary.allocations = config.allocations
+        notify(f"Alocacoes: {summary.allocations}")
+
+        _create_history(config.history, employee_ids, line_ids, context)
+        summary.history = config.history
+        notify(f"Historico: {summary.history}")
+
+        summary.pendencies, summary.daily_actions = _create_open_work(
+            active_allocation_ids, context
+        )
+        notify(
+            f"Pendencias: {summary.pendencies}; acoes do dia: {summary.daily_actions}"
+        )
+    return summary
+
+
+@transaction.atomic
+def purge_synthetic_dataset():
+    """Remove toda a massa sintetica; retorna a quantidade de funcionarios e linhas."""
+    ensure_synthetic_data_allowed()
+    employees = Employee.all_objects.filter(
+        email__endswith=f"@{SYNTHETIC_EMAIL_DOMAIN}"
+    )
+    sim_cards = SIMcard.all_objects.filter(iccid__startswith=SYNTHETIC_ICCID_PREFIX)
+    phone_lines = _synthetic_phone_lines()
+    removed = (employees.count(), phone_lines.count())
+
+    DailyUserAction.objects.filter(employee__in=employees).delete()
+    AllocationPendency.objects.filter(employee__in=employees).delete()
+    LineAllocation.objects.filter(phone_line__in=phone_lines).delete()
+    PhoneLineHistory.objects.filter(phone_line__in=phone_lines).delete()
+    EmployeeHistory.objects.filter(employee__in=employees).delete()
+    phone_lines.delete()
+    sim_cards.delete()
+    employees.delete()
+    SystemUser.objects.filter(email__endswith=f"@{SYNTHETIC_EMAIL_DOMAIN}").delete()
+    return removed
@@ -6,14 +6,23 @@ Extracts business logic from views to improve testability and maintainability.
 
 import logging
 from dataclasses import dataclass
+from functools import partial
 
 from django.db import transaction
+from django.db.models import Max
 
 from allocations.models import LineAllocation
 from core.exceptions.domain_exceptions import BusinessRuleException
 from core.services.allocation_service import AllocationService
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    bump_version_stamp,
+)
+from dashboard.services.indicator_cache_service import (
+    invalidate_today_indicator_cache,
+)
 from employees.models import Employee
-from telecom.models import PhoneLine, SIMcard
+from telecom.models import PhoneLine, PhoneLineHistory, SIMcard
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +38,16 @@ class TelephonyResult:
     allocated: bool = False
 
 
+@dataclass
+class BulkStatusChangeResult:
+    """Result of a bulk line status change."""
+
+    success: bool
+    message: str
+    updated_count: int = 0
+    unchanged_count: int = 0
+
+
 class TelephonyUseCase:
     """Encapsulates telephony-related business logic."""
 
@@ -83,6 +102,115 @@ class TelephonyUseCase:
             phone_line=phone_line,
         )
 
+    @staticmethod
+    @transaction.atomic
+    def change_lines_status(
+        phone_line_ids, new_status: str, actor
+    ) -> BulkStatusChangeResult:
+        """
+        Change the status of many lines with the rules of change_line_status.
+
+        Locks the set in one query, checks active allocations with one grouped
+        query, updates in one statement and writes PhoneLineHistory with one
+        bulk_create (QuerySet.update skips the history signals). All or
+        nothing: any line breaking a rule aborts the whole batch.
+        """
+        if new_status not in PhoneLine.Status.values:
+            raise BusinessRuleException(f"Status invalido: {new_status}.")
+
+        phone_line_ids = set(phone_line_ids)
+        phone_lines = list(
+            PhoneLine.objects.select_for_update()
+            .filter(pk__in=phone_line_ids)
+            .order_by("pk")
+            .only("pk", "phone_number", "status")
+        )
+        missing_count = len(phone_line_ids) - len(phone_lines)
+        if missing_count:
+            raise BusinessRuleException(
+                f"{missing_count} linha(s) nao encontrada(s) ou excluida(s)."
+            )
+
+        allocated_employee_names = dict(
+            LineAllocation.objects.filter(
+                phone_line_id__in=phone_line_ids, is_active=True
+            )
+            .values("phone_line_id")
+            .annotate(employee_name=Max("employee__full_name"))
+            .values_list("phone_line_id", "employee_name")
+        )
+
+        if new_status != PhoneLine.Status.ALLOCATED and allocated_employee_names:
+            blocked = [
+                f"{line.phone_number} ({allocated_employee_names[line.pk]})"
+                for line in phone_lines
+                if line.pk in allocated_employee_names
+            ]
+            raise BusinessRuleException(
+                "Libere a linha primeiro e tente novamente! "
+                f"Linhas vinculadas: {', '.join(blocked)}."
+            )
+
+        if new_status == PhoneLine.Status.ALLOCATED:
+            unallocated = [
+                line.phone_number
+                for line in phone_lines
+                if line.pk not in allocated_employee_names
+            ]
+            if unallocated:
+                raise BusinessRuleException(
+                    "Use o vinculo com usuario para deixar ALLOCATED. "
+                    f"Linhas sem vinculo: {', '.join(unallocated)}."
+                )
+
+        changed_lines = [line for line in phone_lines if line.status != new_status]
+        if changed_lines:
+            PhoneLine.objects.filter(pk__in=[line.pk for line in changed_lines]).update(
+                status=new_status
+            )
+            changed_by = actor if getattr(actor, "is_authenticated", False) else None
+            new_display = PhoneLine.Status(new_status).label
+            history_rows = []
+            for line in changed_lines:
+                old_display = line.get_status_display()
+                history_rows.append(
+                    PhoneLineHistory(
+                        phone_line=line,
+                        action=PhoneLineHistory.ActionType.STATUS_CHANGED,
+                        old_value=old_display,
+                        new_value=new_display,
+                        changed_by=changed_by,
+                        description=(
+                            f"Status alterado de {old_display} para {new_display}"
+                        ),
+                    )
+                )
+            PhoneLineHistory.objects.bulk_create(history_rows)
+            # update() nao dispara post_save: invalida os ETags do inventario e
+            # o indicador do dia (linhas disponiveis dependem do status) apos o
+            # commit, para nenhum leitor cachear o estado anterior.
+            transaction.on_commit(
+                partial(bump_version_stamp, INVENTORY_VERSION_NAMESPACE)
+            )
+            transaction.on_commit(invalidate_today_indicator_cache)
+
+        logger.info(
+            "Line status changed in bulk",
+            extra={
+                "phone_line_ids": sorted(phone_line_ids),
+                "updated_count": len(changed_lines),
+                "new_status": new_status,
+                "actor_id": getattr(actor, "id", None),
+            },
+        )
+
+        return BulkStatusChangeResult(
+            success=True,
+            message=f"Status alterado em {len(changed_lines)} linha(s).",
+            updated_count=len(changed_lines),
+            unchanged_count=len(phone_lines) - len(changed_lines),
+        )
+
     @staticmethod
     @transaction.atomic
     def create_new_line_with_allocation(
@@ -0,0 +1,75 @@
+"""
+Carimbos de versao baratos para GET condicional (ETag / If-None-Match).
+
+Cada namespace tem um contador no cache, incrementado pelos signals de escrita
+das tabelas de origem. O ETag combina o contador com os parametros da
+requisicao, entao uma resposta inalterada vira 304 sem tocar no banco.
+
+Em producao com varios workers o cache precisa ser compartilhado
+(CACHE_URL). O ETag tambem expira a cada CONDITIONAL_GET_MAX_AGE segundos,
+limitando a defasagem com cache local ou escritas via queryset.update().
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+VERSION_STAMP_PREFIX = "version-stamp"
+INVENTORY_VERSION_NAMESPACE = "inventory"
+
+
+def _stamp_key(namespace):
+    return f"{VERSION_STAMP_PREFIX}:{namespace}"
+
+
+def get_version_stamp(namespace):
+    return cache.get_or_set(_stamp_key(namespace), 1, timeout=None)
+
+
+def bump_version_stamp(namespace):
+    try:
+        cache.incr(_stamp_key(namespace))
+    except ValueError:
+        cache.set(_stamp_key(namespace), 2, timeout=None)
+
+
+def get_conditional_get_max_age():
+    return getattr(settings, "CONDITIONAL_GET_MAX_AGE", 30)
+
+
+def build_etag(*parts):
+    """ETag forte a partir das partes informadas e da janela de tempo atual."""
+    time_window = int(time.time() // max(get_conditional_get_max_age(), 1))
+    base = "|".join(str(part) for part in (*parts, time_window))
+    return f'"{hashlib.md5(base.encode("utf-8")).hexdigest()}"'
+
+
+def build_request_etag(request, namespace, *parts):
+    """ETag de uma listagem: versao do namespace, usuario e query string."""
+    user = request.user
+    return build_etag(
+        namespace,
+        get_version_stamp(namespace),
+        getattr(user, "pk", ""),
+        getattr(user, "role", ""),
+        request.get_full_path(),
+        *parts,
+    )
+
+
+def get_not_modified_response(request, etag):
+    """Retorna um 304 quando If-None-Match confere com o ETag, senao None."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response["ETag"] = etag
+    return response
+
+
+def set_conditional_headers(response, etag):
+    """Obriga o navegador a revalidar (If-None-Match) a cada poll."""
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,112 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from core.services.benchmark_service import DEFAULT_BUDGETS_PATH
+from core.services.synthetic_data_service import SYNTHETIC_EMAIL_DOMAIN
+from employees.models import Employee
+from telecom.models import PhoneLine, SIMcard
+
+
+class SyntheticDataBenchmarkTest(TestCase):
+    def setUp(self):
+        call_command("generate_synthetic_data", "--scale", "0.004", stdout=StringIO())
+
+    def test_generator_creates_scaled_dataset_and_purges_it(self):
+        self.assertEqual(
+            Employee.objects.filter(
+                email__endswith=f"@{SYNTHETIC_EMAIL_DOMAIN}"
+            ).count(),
+            20,
+        )
+        self.assertEqual(
+            PhoneLine.objects.filter(status=PhoneLine.Status.ALLOCATED).count(), 56
+        )
+        with self.assertRaises(CommandError):
+            call_command(
+                "generate_synthetic_data", "--scale", "0.004", stdout=StringIO()
+            )
+
+        real_line = PhoneLine.objects.create(
+            phone_number="+5599981234567",
+            sim_card=SIMcard.objects.create(
+                iccid="8955990000000000001", carrier="Vivo"
+            ),
+        )
+
+        call_command("generate_synthetic_data", "--purge", stdout=StringIO())
+
+        self.assertFalse(
+            Employee.all_objects.filter(
+                email__endswith=f"@{SYNTHETIC_EMAIL_DOMAIN}"
+            ).exists()
+        )
+        self.assertEqual(
+            list(PhoneLine.all_objects.values_list("pk", flat=True)), [real_line.pk]
+        )
+        self.assertTrue(SIMcard.all_objects.filter(pk=real_line.sim_card_id).exists())
+
+    @override_settings(APP_ENV="prod")
+    def test_generator_and_purge_refuse_to_run_in_production(self):
+        for args in (("--scale", "0.004"), ("--purge",)):
+            with (
+                self.subTest(args=args),
+                self.assertRaisesMessage(CommandError, "producao"),
+            ):
+                call_command("generate_synthetic_data", *args, stdout=StringIO())
+
+        self.assertTrue(PhoneLine.all_objects.exists())
+
+    def test_scenarios_stay_within_committed_query_budgets(self):
+        output = StringIO()
+        call_command(
+            "run_benchmarks",
+            "--repeat",
+            "1",
+            "--queries-only",
+            "--budgets",
+            str(DEFAULT_BUDGETS_PATH),
+            stdout=output,
+        )
+
+        self.assertIn("Benchmarks dentro do orcamento.", output.getvalue())
+        self.assertIn("reconnect_status", output.getvalue())
+
+    def test_fails_when_query_budget_regresses(self):
+        with tempfile.TemporaryDirectory() as directory:
+            budgets_path = Path(directory) / "budgets.json"
+            budgets_path.write_text(
+                json.dumps({"telecom_overview_ajax": {"max_queries": 1}})
+            )
+
+            with self.assertRaises(CommandError):
+                call_command(
+                    "run_benchmarks",
+                    "--scenario",
+                    "telecom_overview_ajax",
+                    "--repeat",
+                    "1",
+                    "--budgets",
+                    str(budgets_path),
+                    stdout=StringIO(),
+                    stderr=StringIO(),
+                )
+
+            call_command(
+                "run_benchmarks",
+                "--scenario",
+                "telecom_overview_ajax",
+                "--repeat",
+                "1",
+                "--budgets",
+                str(budgets_path),
+                "--update-budgets",
+                stdout=StringIO(),
+            )
+            budgets = json.loads(budgets_path.read_text())
+            self.assertEqual(budgets["telecom_overview_ajax"]["max_queries"], 2)
@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test import TestCase
+
+from core.lookups import email_iexact
+from core.services.role_scope_service import build_role_scope
+from dashboard.models import DailyIndicator
+from employees.models import Employee
+from users.models import SystemUser
+
+
+class EmailIexactLookupTest(TestCase):
+    def setUp(self) -> None:
+        self.supervisor = SystemUser.objects.create_user(
+            email="Super.Lookup@Test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+            manager_email="Gerente.Lookup@Test.com",
+        )
+        self.employee = Employee.objects.create(
+            full_name="Lookup Employee",
+            corporate_email="super.lookup@test.com",
+            manager_email="gerente.lookup@test.com",
+            employee_id="EMP-LK1",
+            teams=Employee.UnitChoices.ARAQUARI,
+            status=Employee.Status.ACTIVE,
+        )
+
+    def _explain(self, queryset) -> str:
+        if connection.vendor == "postgresql":
+            # Tabelas de teste minusculas: sem isso o planner prefere seq scan.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def test_matches_like_iexact(self) -> None:
+        self.assertEqual(
+            SystemUser.objects.filter(
+                email_iexact("email", " super.lookup@TEST.com ")
+            ).get(),
+            self.supervisor,
+        )
+        self.assertEqual(
+            SystemUser.objects.filter(
+                email_iexact("manager_email", "gerente.lookup@test.com")
+            ).get(),
+            self.supervisor,
+        )
+
+    def test_hot_scoped_queries_use_lower_indexes(self) -> None:
+        cases = {
+            "employees_corp_email_lower_idx": Employee.all_objects.filter(
+                email_iexact("corporate_email", "SUPER.lookup@test.com")
+            ),
+            "employees_mgr_email_lower_idx": Employee.all_objects.filter(
+                email_iexact("manager_email", "gerente.lookup@test.com")
+            ),
+            "users_email_lower_idx": SystemUser.objects.filter(
+                email_iexact("email", "super.lookup@test.com")
+            ),
+            "users_manager_email_lower_idx": SystemUser.objects.filter(
+                email_iexact("manager_email", "gerente.lookup@test.com"),
+                role=SystemUser.Role.SUPER,
+            ),
+            "dashboard_supervisor_lower_idx": DailyIndicator.objects.filter(
+                email_iexact("supervisor", "super.lookup@test.com")
+            ),
+        }
+        for index_name, queryset in cases.items():
+            with self.subTest(index=index_name):
+                self.assertIn(index_name, self._explain(queryset))
+
+    def test_role_scope_resolves_case_insensitively(self) -> None:
+        manager = SystemUser.objects.create_user(
+            email="GERENTE.lookup@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.GERENTE,
+        )
+        backoffice = SystemUser(
+            email="backoffice.lookup@test.com",
+            role=SystemUser.Role.BACKOFFICE,
+            supervisor_email="SUPER.LOOKUP@test.com",
+        )
+
+        manager_scope = build_role_scope(manager)
+        self.assertEqual(manager_scope.employee_ids, (self.employee.pk,))
+        self.assertEqual(
+            manager_scope.managed_supervisor_emails, {self.supervisor.email}
+        )
+        self.assertEqual(build_role_scope(backoffice).employee_ids, (self.employee.pk,))
@@ -3,8 +3,9 @@ from django.test import TestCase
 from allocations.models import LineAllocation
 from core.exceptions.domain_exceptions import BusinessRuleException
 from core.services.telephony_use_case import TelephonyUseCase
+from dashboard.services.indicator_cache_service import get_today_indicator_generation
 from employees.models import Employee
-from telecom.models import PhoneLine, SIMcard
+from telecom.models import PhoneLine, PhoneLineHistory, SIMcard
 from users.models import SystemUser
 
 
@@ -80,3 +81,100 @@ class TelephonyUseCaseTests(TestCase):
         self.assertTrue(result.success)
         self.line.refresh_from_db()
         self.assertEqual(self.line.status, PhoneLine.Status.SUSPENDED)
+
+    def _create_lines(self, count):
+        return [
+            PhoneLine.objects.create(
+                phone_number=f"+55119999905{index:02d}",
+                sim_card=SIMcard.objects.create(
+                    iccid=f"89000000000000005{index:02d}",
+                    carrier="CarrierUC",
+                    status=SIMcard.Status.AVAILABLE,
+                ),
+                status=PhoneLine.Status.AVAILABLE,
+            )
+            for index in range(count)
+        ]
+
+    def test_change_lines_status_updates_in_bulk_and_records_history(self):
+        lines = self._create_lines(3)
+        lines[2].status = PhoneLine.Status.SUSPENDED
+        lines[2].save(update_fields=["status"])
+        PhoneLineHistory.objects.all().delete()
+
+        # savepoint, lock, allocations, update, history insert, release
+        with self.assertNumQueries(6):
+            result = TelephonyUseCase.change_lines_status(
+                phone_line_ids=[line.pk for line in lines],
+                new_status=PhoneLine.Status.SUSPENDED,
+                actor=self.admin,
+            )
+
+        self.assertEqual((result.updated_count, result.unchanged_count), (2, 1))
+        self.assertEqual(
+            PhoneLine.objects.filter(
+                pk__in=[line.pk for line in lines],
+                status=PhoneLine.Status.SUSPENDED,
+            ).count(),
+            3,
+        )
+        history = PhoneLineHistory.objects.filter(
+            action=PhoneLineHistory.ActionType.STATUS_CHANGED
+        )
+        self.assertEqual(
+            set(history.values_list("phone_line_id", flat=True)),
+            {lines[0].pk, lines[1].pk},
+        )
+        self.assertEqual(
+            set(history.values_list("old_value", "new_value", "changed_by_id")),
+            {("Disponível", "Quarentena", self.admin.pk)},
+        )
+
+    def test_change_lines_status_invalidates_today_indicator_cache(self):
+        lines = self._create_lines(2)
+        generation = get_today_indicator_generation()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TelephonyUseCase.change_lines_status(
+                phone_line_ids=[line.pk for line in lines],
+                new_status=PhoneLine.Status.SUSPENDED,
+                actor=self.admin,
+            )
+
+        self.assertNotEqual(get_today_indicator_generation(), generation)
+
+    def test_change_lines_status_aborts_batch_when_a_line_is_allocated(self):
+        lines = self._create_lines(2)
+        LineAllocation.objects.create(
+            employee=self.employee,
+            phone_line=lines[1],
+            allocated_by=self.admin,
+            is_active=True,
+        )
+
+        with self.assertRaises(BusinessRuleException) as exc:
+            TelephonyUseCase.change_lines_status(
+                phone_line_ids=[line.pk for line in lines],
+                new_status=PhoneLine.Status.CANCELLED,
+                actor=self.admin,
+            )
+
+        self.assertIn(lines[1].phone_number, str(exc.exception))
+        self.assertIn("Use Case Employee", str(exc.exception))
+        self.assertFalse(
+            PhoneLine.objects.filter(status=PhoneLine.Status.CANCELLED).exists()
+        )
+
+    def test_change_lines_status_requires_allocation_for_allocated_target(self):
+        lines = self._create_lines(1)
+
+        with self.assertRaises(BusinessRuleException) as exc:
+            TelephonyUseCase.change_lines_status(
+                phone_line_ids=[lines[0].pk],
+                new_status=PhoneLine.Status.ALLOCATED,
+                actor=self.admin,
+            )
+
+        self.assertIn(
+            "Use o vinculo com usuario para deixar ALLOCATED", str(exc.exception)
+        )
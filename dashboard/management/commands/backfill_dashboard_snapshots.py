@@ -0,0 +1,189 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from dashboard.services.indicator_cache_service import GLOBAL_DASHBOARD_SCOPE
+from dashboard.services.snapshot_backfill_service import (
+    diff_snapshot_metrics,
+    get_days_to_recompute,
+    get_existing_snapshots,
+    get_scope_users,
+    init_worker,
+    recompute_snapshot_chunk,
+    split_into_chunks,
+)
+from dashboard.views import CURRENT_DASHBOARD_SNAPSHOT_VERSION
+
+DEFAULT_BACKFILL_DAYS = 90
+DEFAULT_CHUNK_DAYS = 7
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula em lote os snapshots historicos do dashboard (global e por "
+        "escopo), em paralelo, pulando os dias ja gravados na versao atual."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="Primeiro dia no formato YYYY-MM-DD (padrao: 90 dias atras).",
+        )
+        parser.add_argument(
+            "--end",
+            help="Ultimo dia no formato YYYY-MM-DD (padrao: ontem).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processos em paralelo; 1 executa no proprio processo.",
+        )
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=DEFAULT_CHUNK_DAYS,
+            help="Quantidade maxima de dias por bloco de recalculo.",
+        )
+        parser.add_argument(
+            "--skip-scopes",
+            action="store_true",
+            help="Recalcula apenas o snapshot global.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recalcula tambem os dias ja gravados na versao atual.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas mostra os dias cujos numeros mudariam, sem gravar.",
+        )
+
+    def _parse_day(self, raw_value, default):
+        if not raw_value:
+            return default
+        try:
+            return datetime.strptime(raw_value, "%Y-%m-%d").date()
+        except ValueError as exc:
+            raise CommandError("Data invalida. Use o formato YYYY-MM-DD.") from exc
+
+    def _build_tasks(self, start_day, end_day, scopes, chunk_days, force):
+        tasks = []
+        snapshots_by_scope = {}
+        for scope_key, user in scopes.items():
+            snapshots = get_existing_snapshots(
+                start_day,
+                end_day,
+                scope_key=None if user is None else scope_key,
+            )
+            snapshots_by_scope[scope_key] = snapshots
+            days = get_days_to_recompute(
+                start_day,
+                end_day,
+                snapshots,
+                CURRENT_DASHBOARD_SNAPSHOT_VERSION,
+                force=force,
+            )
+            for chunk_start, chunk_end in split_into_chunks(days, chunk_days):
+                tasks.append(
+                    (scope_key, getattr(user, "pk", None), chunk_start, chunk_end)
+                )
+        return tasks, snapshots_by_scope
+
+    def _run_tasks(self, tasks, workers, persist):
+        """Gera (tarefa, metricas por dia) na ordem em que os blocos terminam."""
+        if workers <= 1:
+            for task in tasks:
+                yield task, recompute_snapshot_chunk(*task[1:], persist=persist)
+            return
+
+        # Conexoes abertas nao podem ser herdadas pelos processos filhos.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker
+        ) as executor:
+            futures = {
+                executor.submit(recompute_snapshot_chunk, *task[1:], persist): task
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def handle(self, *args, **options):
+        yesterday = timezone.localdate() - timedelta(days=1)
+        end_day = self._parse_day(options.get("end"), yesterday)
+        start_day = self._parse_day(
+            options.get("start"), end_day - timedelta(days=DEFAULT_BACKFILL_DAYS - 1)
+        )
+        if start_day > end_day:
+            raise CommandError("--start deve ser anterior ou igual a --end.")
+        if end_day > yesterday:
+            raise CommandError("--end deve ser um dia historico (ate ontem).")
+        if options["workers"] < 1 or options["chunk_days"] < 1:
+            raise CommandError("--workers e --chunk-days devem ser maiores que 0.")
+        dry_run = options["dry_run"]
+
+        scopes = {GLOBAL_DASHBOARD_SCOPE: None}
+        if not options["skip_scopes"]:
+            scopes.update(get_scope_users())
+
+        tasks, snapshots_by_scope = self._build_tasks(
+            start_day, end_day, scopes, options["chunk_days"], options["force"]
+        )
+        period = f"{start_day.strftime('%d/%m/%Y')} a {end_day.strftime('%d/%m/%Y')}"
+        if not tasks:
+            self.stdout.write(
+                self.style.SUCCESS(f"Snapshots de {period} ja estao atualizados.")
+            )
+            return
+
+        recomputed_days = 0
+        changed_days = 0
+        for index, (task, metrics_by_day) in enumerate(
+            self._run_tasks(tasks, options["workers"], persist=not dry_run),
+            start=1,
+        ):
+            scope_key, _, chunk_start, chunk_end = task
+            recomputed_days += len(metrics_by_day)
+            self.stdout.write(
+                f"[{index}/{len(tasks)}] {scope_key} "
+                f"{chunk_start.strftime('%d/%m/%Y')} a "
+                f"{chunk_end.strftime('%d/%m/%Y')}: "
+                f"{len(metrics_by_day)} dia(s)"
+            )
+            if not dry_run:
+                continue
+            for day, metrics in sorted(metrics_by_day.items()):
+                changes = diff_snapshot_metrics(
+                    snapshots_by_scope[scope_key].get(day), metrics
+                )
+                if not changes:
+                    continue
+                changed_days += 1
+                details = ", ".join(
+                    f"{key}: {stored} -> {computed}"
+                    for key, stored, computed in changes
+                )
+                self.stdout.write(
+                    f"  {day.strftime('%d/%m/%Y')} {scope_key}: {details}"
+                )
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Dry-run: {changed_days} de {recomputed_days} dia(s) "
+                    f"mudariam em {period}."
+                )
+            )
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{recomputed_days} snapshot(s) recalculado(s) em {period} "
+                f"({len(scopes)} escopo(s))."
+            )
+        )
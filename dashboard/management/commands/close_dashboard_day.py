@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Grava o snapshot diario do dashboard (fechamento do dia). "
+        "Agende proximo ao fim do dia; os polls do dashboard apenas leem o cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            help="Dia a fechar no formato YYYY-MM-DD (padrao: hoje).",
+        )
+
+    def handle(self, *args, **options):
+        from dashboard.views import persist_dashboard_snapshot_for_day
+
+        raw_date = options.get("date")
+        if raw_date:
+            try:
+                day = datetime.strptime(raw_date, "%Y-%m-%d").date()
+            except ValueError as exc:
+                raise CommandError("Data invalida. Use o formato YYYY-MM-DD.") from exc
+        else:
+            day = timezone.localdate()
+
+        indicator = persist_dashboard_snapshot_for_day(day)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Snapshot de {day.strftime('%d/%m/%Y')} gravado: "
+                f"pessoas_logadas={indicator['pessoas_logadas']}, "
+                f"numeros_entregues={indicator['numeros_entregues']}, "
+                f"reconectados={indicator['reconectados']}, "
+                f"novos={indicator['novos']}."
+            )
+        )
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from dashboard.services.event_counter_service import (
+    METRIC_INDICATOR_KEYS,
+    SCOPED_METRICS,
+    build_counters_from_indicators,
+    get_counter_indicator_values,
+    replace_counters,
+)
+from dashboard.services.indicator_cache_service import GLOBAL_DASHBOARD_SCOPE
+from dashboard.services.indicator_range_service import build_indicators_for_range
+from dashboard.services.snapshot_backfill_service import get_scope_users
+
+DEFAULT_REBUILD_DAYS = 30
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstroi os contadores incrementais do dashboard a partir do calculo "
+        "completo e mostra as divergencias encontradas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="Primeiro dia no formato YYYY-MM-DD (padrao: 30 dias atras).",
+        )
+        parser.add_argument(
+            "--end",
+            help="Ultimo dia no formato YYYY-MM-DD (padrao: hoje).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas compara contadores e calculo, sem gravar.",
+        )
+
+    def _parse_day(self, raw_value, default):
+        if not raw_value:
+            return default
+        try:
+            return datetime.strptime(raw_value, "%Y-%m-%d").date()
+        except ValueError as exc:
+            raise CommandError("Data invalida. Use o formato YYYY-MM-DD.") from exc
+
+    def _get_scopes(self):
+        return {GLOBAL_DASHBOARD_SCOPE: None, **get_scope_users()}
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        end_day = self._parse_day(options.get("end"), today)
+        start_day = self._parse_day(
+            options.get("start"), end_day - timedelta(days=DEFAULT_REBUILD_DAYS - 1)
+        )
+        if start_day > end_day:
+            raise CommandError("--start deve ser anterior ou igual a --end.")
+        dry_run = options["dry_run"]
+
+        divergences = 0
+        for scope_key, user in self._get_scopes().items():
+            indicators = build_indicators_for_range(
+                start_day, end_day, user=user, use_counters=False
+            )
+            current = get_counter_indicator_values(start_day, end_day, scope_key)
+            metrics = (
+                METRIC_INDICATOR_KEYS
+                if scope_key == GLOBAL_DASHBOARD_SCOPE
+                else SCOPED_METRICS
+            )
+            for day, indicator in indicators.items():
+                for metric in metrics:
+                    key = METRIC_INDICATOR_KEYS[metric]
+                    if current[day][key] == indicator[key]:
+                        continue
+                    divergences += 1
+                    self.stdout.write(
+                        f"{day.strftime('%d/%m/%Y')} {scope_key} {metric}: "
+                        f"contador={current[day][key]} calculado={indicator[key]}"
+                    )
+
+            if not dry_run:
+                replace_counters(
+                    start_day,
+                    end_day,
+                    scope_key,
+                    build_counters_from_indicators(scope_key, indicators),
+                )
+
+        period = f"{start_day.strftime('%d/%m/%Y')} a {end_day.strftime('%d/%m/%Y')}"
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Dry-run: {divergences} divergencia(s) em {period}."
+                )
+            )
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Contadores reconstruidos para {period}; "
+                f"{divergences} divergencia(s) corrigida(s)."
+            )
+        )
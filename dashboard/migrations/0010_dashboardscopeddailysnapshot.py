@@ -0,0 +1,85 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0009_dashboarddailysnapshot_calculation_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DashboardScopedDailySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "scope_key",
+                    models.CharField(max_length=320, verbose_name="Escopo"),
+                ),
+                ("date", models.DateField(verbose_name="Data")),
+                (
+                    "people_logged_in",
+                    models.IntegerField(default=0, verbose_name="Pessoas Logadas"),
+                ),
+                (
+                    "percentage_without_whatsapp",
+                    models.FloatField(default=0, verbose_name="% sem Whats"),
+                ),
+                (
+                    "b2b_without_whatsapp",
+                    models.IntegerField(default=0, verbose_name="B2B sem Whats"),
+                ),
+                (
+                    "b2c_without_whatsapp",
+                    models.IntegerField(default=0, verbose_name="B2C sem Whats"),
+                ),
+                (
+                    "numbers_delivered",
+                    models.IntegerField(default=0, verbose_name="Números Entregues"),
+                ),
+                (
+                    "numbers_reconnected",
+                    models.IntegerField(default=0, verbose_name="Reconectados"),
+                ),
+                (
+                    "total_uncovered_day",
+                    models.IntegerField(
+                        default=0, verbose_name="Total Descoberto DIA"
+                    ),
+                ),
+                (
+                    "calculation_version",
+                    models.PositiveSmallIntegerField(
+                        default=2, verbose_name="Versao do Calculo"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Criado em"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Atualizado em"),
+                ),
+            ],
+            options={
+                "verbose_name": "Snapshot Diário do Dashboard por Escopo",
+                "verbose_name_plural": "Snapshots Diários do Dashboard por Escopo",
+                "ordering": ["scope_key", "-date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("scope_key", "date"),
+                        name="uq_dashboard_scoped_snapshot_day",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0010_dashboardscopeddailysnapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DashboardDailyCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Data")),
+                (
+                    "scope_key",
+                    models.CharField(max_length=320, verbose_name="Escopo"),
+                ),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[
+                            ("delivered", "Números Entregues"),
+                            ("reconnected", "Reconectados"),
+                            ("new", "Novos"),
+                        ],
+                        max_length=20,
+                        verbose_name="Metrica",
+                    ),
+                ),
+                ("value", models.IntegerField(default=0, verbose_name="Valor")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Atualizado em"),
+                ),
+            ],
+            options={
+                "verbose_name": "Contador Diário do Dashboard",
+                "verbose_name_plural": "Contadores Diários do Dashboard",
+                "ordering": ["-date", "scope_key", "metric"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("scope_key", "date", "metric"),
+                        name="uq_dashboard_counter_day_metric",
+                    )
+                ],
+            },
+        ),
+    ]
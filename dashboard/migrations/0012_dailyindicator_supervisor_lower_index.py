@@ -0,0 +1,19 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0011_dashboarddailycounter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dailyindicator",
+            index=models.Index(
+                django.db.models.functions.text.Lower("supervisor"),
+                name="dashboard_supervisor_lower_idx",
+            ),
+        ),
+    ]
@@ -2,8 +2,11 @@ from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Lower
 from django.utils import timezone
 
+from core.change_tracking import ChangeTrackingMixin
+
 
 class DailyIndicator(models.Model):
     SEGMENT_CHOICES = [
@@ -93,6 +96,7 @@ class DailyIndicator(models.Model):
             models.Index(fields=["supervisor", "date"]),
             models.Index(fields=["portfolio", "date"]),
             models.Index(fields=["segment", "supervisor", "date"]),
+            models.Index(Lower("supervisor"), name="dashboard_supervisor_lower_idx"),
         ]
 
     def __str__(self):
@@ -101,7 +105,9 @@ class DailyIndicator(models.Model):
         )
 
 
-class DailyUserAction(models.Model):
+class DailyUserAction(ChangeTrackingMixin, models.Model):
+    tracked_fields = ("action_type", "is_resolved")
+
     class ActionType(models.TextChoices):
         NEW_NUMBER = "new_number", "Número novo"
         RECONNECT_WHATSAPP = "reconnect_whatsapp", "Reconectar WhatsApp"
@@ -235,3 +241,92 @@ class DashboardDailySnapshot(models.Model):
 
     def __str__(self):
         return f"Snapshot {self.date.strftime('%d/%m/%Y')}"
+
+
+class DashboardScopedDailySnapshot(models.Model):
+    """
+    Snapshot diario das metricas de escopo (supervisor/backoffice/gerente).
+
+    scope_key segue get_dashboard_scope_key (ex.: "supervisor:<email>").
+    Metricas globais (disponiveis, novos) vem de DashboardDailySnapshot.
+    """
+
+    CALCULATION_VERSION = DashboardDailySnapshot.CALCULATION_VERSION
+
+    scope_key = models.CharField(max_length=320, verbose_name="Escopo")
+    date = models.DateField(verbose_name="Data")
+    people_logged_in = models.IntegerField(default=0, verbose_name="Pessoas Logadas")
+    percentage_without_whatsapp = models.FloatField(
+        default=0, verbose_name="% sem Whats"
+    )
+    b2b_without_whatsapp = models.IntegerField(
+        default=0, verbose_name="B2B sem Whats"
+    )
+    b2c_without_whatsapp = models.IntegerField(
+        default=0, verbose_name="B2C sem Whats"
+    )
+    numbers_delivered = models.IntegerField(default=0, verbose_name="Números Entregues")
+    numbers_reconnected = models.IntegerField(default=0, verbose_name="Reconectados")
+    total_uncovered_day = models.IntegerField(
+        default=0, verbose_name="Total Descoberto DIA"
+    )
+    calculation_version = models.PositiveSmallIntegerField(
+        default=CALCULATION_VERSION,
+        verbose_name="Versao do Calculo",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Atualizado em")
+
+    class Meta:
+        ordering = ["scope_key", "-date"]
+        verbose_name = "Snapshot Diário do Dashboard por Escopo"
+        verbose_name_plural = "Snapshots Diários do Dashboard por Escopo"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope_key", "date"],
+                name="uq_dashboard_scoped_snapshot_day",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Snapshot {self.scope_key} {self.date.strftime('%d/%m/%Y')}"
+
+
+class DashboardDailyCounter(models.Model):
+    """
+    Contador incremental de eventos do dashboard (dia x escopo x metrica).
+
+    Atualizado na mesma transacao dos fluxos de escrita (alocacao, cadastro
+    de linha, resolucao de pendencia) e reconstruido pelo comando
+    rebuild_dashboard_counters.
+    """
+
+    class Metric(models.TextChoices):
+        DELIVERED = "delivered", "Números Entregues"
+        RECONNECTED = "reconnected", "Reconectados"
+        NEW = "new", "Novos"
+
+    date = models.DateField(verbose_name="Data")
+    scope_key = models.CharField(max_length=320, verbose_name="Escopo")
+    metric = models.CharField(
+        max_length=20, choices=Metric.choices, verbose_name="Metrica"
+    )
+    value = models.IntegerField(default=0, verbose_name="Valor")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Atualizado em")
+
+    class Meta:
+        ordering = ["-date", "scope_key", "metric"]
+        verbose_name = "Contador Diário do Dashboard"
+        verbose_name_plural = "Contadores Diários do Dashboard"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope_key", "date", "metric"],
+                name="uq_dashboard_counter_day_metric",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.scope_key} {self.date.strftime('%d/%m/%Y')} "
+            f"{self.metric}={self.value}"
+        )
@@ -0,0 +1,444 @@
+"""
+Paginacao da tabela de Acoes do Dia.
+
+Filtros de usuario, linha e responsavel tecnico sao aplicados no queryset de
+funcionarios antes de montar as linhas. As paginas seguintes sao buscadas por
+keyset (full_name, pk) do ultimo funcionario entregue: so os funcionarios da
+pagina tem linhas e criticidade montadas, e uma pagina nunca divide as linhas
+de um funcionario (a criticidade depende de todas elas).
+
+As colunas do admin que dependem so do funcionario (PA, usuario, carteira e
+criticidade) viram ordenacao no banco e usam o mesmo keyset, com a chave da
+coluna na frente. As demais colunas ordenam linhas de alocacao; nesse modo as
+paginas continuam cortadas sobre a lista completa, com cursor pela chave da
+ultima linha entregue.
+
+Total de linhas, contadores de acao e de criticidade saem de consultas
+agregadas (count_action_board_rows), sem montar as linhas.
+"""
+
+from django.conf import settings
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Concat, Lower, Trim
+
+from allocations.models import LineAllocation
+from core.services.number_search_service import (
+    normalize_number_search,
+    number_search_q,
+)
+from employees.models import Employee
+from pendencies.models import AllocationPendency
+
+# Mesma ordem de DAILY_USER_CRITICALITY_META (dashboard.views).
+CRITICALITY_SORT = {"high": 0, "medium": 1, "low": 2}
+
+# Colunas do admin ordenadas no banco; as demais ordenam linhas de alocacao.
+ACTION_BOARD_EMPLOYEE_SORT_KEYS = ("pa", "usuario", "carteira", "criticidade")
+
+ACTION_BOARD_SORT_KEY = "action_board_sort_key"
+
+
+def get_action_board_page_size():
+    return max(getattr(settings, "DASHBOARD_ACTION_BOARD_PAGE_SIZE", 50), 1)
+
+
+def prefilter_action_board_employees(
+    employees_qs, user_filter="", line_filter="", technical_filter=""
+):
+    """
+    Descarta no banco os funcionarios que nao podem gerar linhas no filtro.
+
+    Mantem todas as alocacoes dos funcionarios restantes, entao a criticidade
+    (calculada por funcionario) nao muda; o filtro fino por linha continua em
+    filter_daily_user_action_rows. Ordena por (full_name, pk), a chave do
+    keyset das paginas.
+    """
+    if user_filter:
+        employees_qs = employees_qs.filter(full_name__icontains=user_filter)
+    line_condition = number_search_q(line_filter, "phone_line__phone_number")
+    if line_condition is not None:
+        employees_qs = employees_qs.filter(
+            Exists(
+                LineAllocation.objects.filter(
+                    line_condition,
+                    employee_id=OuterRef("pk"),
+                    is_active=True,
+                    phone_line__is_deleted=False,
+                    phone_line__sim_card__is_deleted=False,
+                )
+            )
+        )
+    if technical_filter:
+        employees_qs = employees_qs.filter(
+            Exists(
+                AllocationPendency.objects.annotate(
+                    technical_name=Concat(
+                        "technical_responsible__first_name",
+                        Value(" "),
+                        "technical_responsible__last_name",
+                    )
+                ).filter(
+                    Q(technical_name__icontains=technical_filter)
+                    | Q(technical_responsible__email__icontains=technical_filter),
+                    employee_id=OuterRef("pk"),
+                )
+            )
+        )
+    return employees_qs.order_by("full_name", "pk")
+
+
+def get_row_cursor(row):
+    allocation = row.get("allocation")
+    return f"{row['employee'].id}:{allocation.id if allocation else 0}"
+
+
+def paginate_action_board_rows(rows, cursor="", page_size=None):
+    """
+    Retorna (linhas da pagina, cursor da proxima pagina, has_more).
+
+    Usado quando a tabela esta ordenada por coluna. O cursor identifica a
+    ultima linha entregue. Se ela saiu do filtro entre duas requisicoes,
+    devolve pagina vazia com cursor None para o cliente recarregar a tabela
+    em vez de repetir linhas.
+    """
+    page_size = page_size or get_action_board_page_size()
+    start = 0
+    if cursor:
+        positions = {get_row_cursor(row): index for index, row in enumerate(rows)}
+        if cursor not in positions:
+            return [], None, False
+        start = positions[cursor] + 1
+
+    page = rows[start : start + page_size + 1]
+    has_more = len(page) > page_size
+    page = page[:page_size]
+    next_cursor = get_row_cursor(page[-1]) if has_more else ""
+    return page, next_cursor, has_more
+
+
+def take_action_board_page(rows, page_size=None):
+    """
+    Corta a primeira pagina sem dividir as linhas de um funcionario.
+
+    Retorna (linhas da pagina, cursor da proxima pagina, has_more); o cursor
+    e o pk do ultimo funcionario da pagina.
+    """
+    page_size = page_size or get_action_board_page_size()
+    end = min(page_size, len(rows))
+    while (
+        0 < end < len(rows) and rows[end]["employee"].id == rows[end - 1]["employee"].id
+    ):
+        end += 1
+    page = rows[:end]
+    has_more = end < len(rows)
+    next_cursor = str(page[-1]["employee"].id) if has_more else ""
+    return page, next_cursor, has_more
+
+
+def visible_active_allocations():
+    return LineAllocation.objects.filter(
+        is_active=True,
+        phone_line__is_deleted=False,
+        phone_line__sim_card__is_deleted=False,
+    )
+
+
+def annotate_action_board_criticality(employees_qs):
+    """
+    Anota criticality_sort (0 alto, 1 medio, 2 baixo) por funcionario.
+
+    Mesma regra de _resolve_daily_user_criticality: conta as linhas ativas
+    visiveis e quantas delas tem pendencia diferente de "sem acao".
+    """
+    allocations = visible_active_allocations().filter(employee_id=OuterRef("pk"))
+    pending_allocations = allocations.filter(
+        Exists(
+            AllocationPendency.objects.filter(
+                allocation_id=OuterRef("pk"),
+                employee_id=OuterRef("employee_id"),
+            ).exclude(action=AllocationPendency.ActionType.NO_ACTION)
+        )
+    )
+    return employees_qs.annotate(
+        board_line_count=_count_subquery(allocations),
+        board_pending_count=_count_subquery(pending_allocations),
+    ).annotate(
+        criticality_sort=Case(
+            When(board_line_count=0, then=Value(CRITICALITY_SORT["high"])),
+            When(
+                board_pending_count=F("board_line_count"),
+                then=Value(CRITICALITY_SORT["high"]),
+            ),
+            When(
+                board_line_count=2,
+                board_pending_count=1,
+                then=Value(CRITICALITY_SORT["medium"]),
+            ),
+            When(board_line_count__gte=2, then=Value(CRITICALITY_SORT["low"])),
+            default=Value(CRITICALITY_SORT["high"]),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def _count_subquery(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values("employee_id")
+            .annotate(total=Count("pk"))
+            .values("total")[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def order_action_board_employees(employees_qs, sort_col="", sort_order="asc"):
+    """
+    Retorna (queryset ordenado, keyset) para a ordenacao pedida.
+
+    keyset lista (campo, descendente) na ordem do order_by. Empates na coluna
+    seguem (full_name, pk), como a ordenacao estavel das linhas montadas.
+    """
+    keyset = [("full_name", False), ("pk", False)]
+    if sort_col not in ACTION_BOARD_EMPLOYEE_SORT_KEYS:
+        return employees_qs.order_by("full_name", "pk"), keyset
+
+    if sort_col == "criticidade":
+        employees_qs = annotate_action_board_criticality(employees_qs)
+        sort_expression = F("criticality_sort")
+    else:
+        field = {"pa": "pa", "usuario": "full_name", "carteira": "employee_id"}
+        sort_expression = Lower(Coalesce(field[sort_col], Value("")))
+    descending = sort_order == "desc"
+    employees_qs = employees_qs.annotate(**{ACTION_BOARD_SORT_KEY: sort_expression})
+    sort_field = F(ACTION_BOARD_SORT_KEY)
+    return (
+        employees_qs.order_by(
+            sort_field.desc() if descending else sort_field.asc(), "full_name", "pk"
+        ),
+        [(ACTION_BOARD_SORT_KEY, descending), *keyset],
+    )
+
+
+def _keyset_after(anchor, keyset):
+    condition = Q()
+    equal = {}
+    for field, descending in keyset:
+        lookup = "lt" if descending else "gt"
+        condition |= Q(**equal, **{f"{field}__{lookup}": anchor[field]})
+        equal[field] = anchor[field]
+    return condition
+
+
+def fetch_action_board_page(
+    employees_qs, build_rows, cursor="", page_size=None, sort=("", "asc")
+):
+    """
+    Pagina por keyset, montando linhas so dos funcionarios da pagina.
+
+    employees_qs deve vir de prefilter_action_board_employees; build_rows
+    recebe uma lista de funcionarios e devolve as linhas ja filtradas.
+    sort e (coluna, "asc"|"desc"); aceita as colunas de
+    ACTION_BOARD_EMPLOYEE_SORT_KEYS e as demais mantem a ordem por nome.
+    Funcionarios sao lidos em blocos de page_size ate completar a pagina.
+    Cursor invalido ou de funcionario inexistente devolve cursor None para o
+    cliente recarregar a tabela.
+    """
+    page_size = page_size or get_action_board_page_size()
+    employees_qs, keyset = order_action_board_employees(employees_qs, *sort)
+    if cursor:
+        try:
+            after_pk = int(cursor)
+        except ValueError:
+            return [], None, False
+        anchor_qs, _ = order_action_board_employees(
+            Employee.all_objects.filter(pk=after_pk), *sort
+        )
+        anchor = anchor_qs.values(*(field for field, _ in keyset)).first()
+        if anchor is None:
+            return [], None, False
+        employees_qs = employees_qs.filter(_keyset_after(anchor, keyset))
+
+    rows = []
+    offset = 0
+    while True:
+        chunk = list(employees_qs[offset : offset + page_size])
+        offset += len(chunk)
+        rows.extend(build_rows(chunk))
+        page, next_cursor, has_more = take_action_board_page(rows, page_size)
+        if has_more or len(chunk) < page_size:
+            return page, next_cursor, has_more
+
+
+def _pendency_subquery(field, **lookups):
+    return Subquery(
+        AllocationPendency.objects.filter(**lookups)
+        .annotate(
+            technical_full_name=Trim(
+                Concat(
+                    "technical_responsible__first_name",
+                    Value(" "),
+                    "technical_responsible__last_name",
+                )
+            )
+        )
+        .annotate(
+            technical_name=Case(
+                When(
+                    technical_full_name="",
+                    then=Coalesce("technical_responsible__email", Value("")),
+                ),
+                default=F("technical_full_name"),
+            )
+        )
+        .order_by("-pk")
+        .values(field)[:1]
+    )
+
+
+def _annotate_board_row(queryset, line_status_field, **pendency_lookups):
+    return queryset.annotate(
+        row_pendency_action=Coalesce(
+            _pendency_subquery("action", **pendency_lookups),
+            Value(AllocationPendency.ActionType.NO_ACTION),
+        ),
+        row_technical_name=Coalesce(
+            _pendency_subquery("technical_name", **pendency_lookups), Value("")
+        ),
+        row_line_status=F(line_status_field),
+    )
+
+
+def _filter_board_rows(rows_qs, technical_filter, hide_active_without_action):
+    if technical_filter:
+        rows_qs = rows_qs.filter(row_technical_name__icontains=technical_filter)
+    if hide_active_without_action:
+        rows_qs = rows_qs.exclude(
+            row_line_status=LineAllocation.LineStatus.ACTIVE,
+            row_pendency_action=AllocationPendency.ActionType.NO_ACTION,
+        )
+    return rows_qs
+
+
+def get_action_board_row_querysets(
+    employees_qs,
+    line_filter="",
+    technical_filter="",
+    hide_active_without_action=False,
+):
+    """
+    Linhas da tabela como querysets: (linhas com alocacao, linhas sem linha).
+
+    Espelha build_daily_user_action_rows + filter_daily_user_action_rows:
+    uma linha por alocacao ativa visivel, ou uma linha do funcionario quando
+    ele nao tem nenhuma. hide_active_without_action aplica a regra de
+    visibilidade do admin (should_hide_row_for_admin).
+    """
+    employee_ids = employees_qs.order_by().values("pk")
+    allocation_rows = _annotate_board_row(
+        visible_active_allocations().filter(employee_id__in=employee_ids),
+        "line_status",
+        allocation_id=OuterRef("pk"),
+        employee_id=OuterRef("employee_id"),
+    )
+    line_condition = number_search_q(line_filter, "phone_line__phone_number")
+    if line_condition is not None:
+        allocation_rows = allocation_rows.filter(line_condition)
+    allocation_rows = _filter_board_rows(
+        allocation_rows, technical_filter, hide_active_without_action
+    )
+
+    employee_rows = _annotate_board_row(
+        employees_qs.order_by().exclude(
+            Exists(visible_active_allocations().filter(employee_id=OuterRef("pk")))
+        ),
+        "line_status",
+        employee_id=OuterRef("pk"),
+        allocation__isnull=True,
+    )
+    employee_rows = _filter_board_rows(
+        employee_rows, technical_filter, hide_active_without_action
+    )
+    if normalize_number_search(line_filter):
+        # Sem linha ativa nao ha numero para casar com o filtro.
+        employee_rows = employee_rows.none()
+    return allocation_rows, employee_rows
+
+
+def _aggregate_board_rows(rows_qs):
+    action_type = AllocationPendency.ActionType
+    return rows_qs.aggregate(
+        total=Count("pk"),
+        new_number=Count("pk", filter=Q(row_pendency_action=action_type.NEW_NUMBER)),
+        reconnect_whatsapp=Count(
+            "pk", filter=Q(row_pendency_action=action_type.RECONNECT_WHATSAPP)
+        ),
+        pending=Count("pk", filter=Q(row_pendency_action=action_type.PENDING)),
+        line_status_issues=Count(
+            "pk", filter=~Q(row_line_status=LineAllocation.LineStatus.ACTIVE)
+        ),
+    )
+
+
+def count_action_board_rows(
+    employees_qs,
+    line_filter="",
+    technical_filter="",
+    hide_active_without_action=False,
+):
+    """
+    Totais da tabela de Acoes do Dia em consultas agregadas.
+
+    Retorna (total de linhas, contadores de acao no formato de
+    count_visible_pending_actions, funcionarios listados por criticidade),
+    sem montar as linhas.
+    """
+    allocation_rows, employee_rows = get_action_board_row_querysets(
+        employees_qs,
+        line_filter=line_filter,
+        technical_filter=technical_filter,
+        hide_active_without_action=hide_active_without_action,
+    )
+    totals = {
+        key: allocation_value + employee_value
+        for (key, allocation_value), employee_value in zip(
+            _aggregate_board_rows(allocation_rows).items(),
+            _aggregate_board_rows(employee_rows).values(),
+            strict=True,
+        )
+    }
+    action_counts = {
+        "new_number": totals["new_number"],
+        "reconnect_whatsapp": totals["reconnect_whatsapp"],
+        "pending": totals["pending"],
+        "total": totals["new_number"]
+        + totals["reconnect_whatsapp"]
+        + totals["pending"],
+        "line_status_issues": totals["line_status_issues"],
+    }
+
+    listed_employees = annotate_action_board_criticality(
+        employees_qs.order_by().filter(
+            Q(pk__in=allocation_rows.values("employee_id"))
+            | Q(pk__in=employee_rows.values("pk"))
+        )
+    ).aggregate(
+        **{
+            level: Count("pk", filter=Q(criticality_sort=sort))
+            for level, sort in CRITICALITY_SORT.items()
+        }
+    )
+    return totals["total"], action_counts, listed_employees
@@ -0,0 +1,159 @@
+"""
+Contadores incrementais dos indicadores de eventos do dashboard.
+
+Numeros entregues, reconectados e novos sao eventos: cada alocacao, cadastro
+de linha (post_save) ou resolucao de pendencia/acao do dia soma (ou subtrai)
+uma unidade no contador do dia para cada escopo que enxerga o funcionario.
+Metricas de estado (pessoas logadas, descobertos, disponiveis) continuam no
+motor de intervalo.
+
+A leitura pelos indicadores so e ligada com DASHBOARD_EVENT_COUNTERS_ENABLED,
+depois de popular a tabela com o comando rebuild_dashboard_counters.
+"""
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard.models import DashboardDailyCounter
+from dashboard.services.indicator_cache_service import (
+    GLOBAL_DASHBOARD_SCOPE,
+    get_employee_scope_keys,
+)
+
+Metric = DashboardDailyCounter.Metric
+
+METRIC_INDICATOR_KEYS = {
+    Metric.DELIVERED: "numeros_entregues",
+    Metric.RECONNECTED: "reconectados",
+    Metric.NEW: "novos",
+}
+# Novos e uma metrica global: os escopos reaproveitam o valor global.
+SCOPED_METRICS = (Metric.DELIVERED, Metric.RECONNECTED)
+
+
+def event_counters_enabled():
+    return getattr(settings, "DASHBOARD_EVENT_COUNTERS_ENABLED", False)
+
+
+def increment_counter(day, scope_keys, metric, delta=1):
+    now = timezone.now()
+    for scope_key in scope_keys:
+        counters = DashboardDailyCounter.objects.filter(
+            date=day,
+            scope_key=scope_key,
+            metric=metric,
+        )
+        if counters.update(value=F("value") + delta, updated_at=now):
+            continue
+        if delta < 0:
+            # Nada a descontar: o dia ainda nao foi contabilizado.
+            continue
+        try:
+            with transaction.atomic():
+                DashboardDailyCounter.objects.create(
+                    date=day,
+                    scope_key=scope_key,
+                    metric=metric,
+                    value=delta,
+                )
+        except IntegrityError:
+            counters.update(value=F("value") + delta, updated_at=now)
+
+
+def record_line_allocated(allocation):
+    """Conta a entrega e, se a linha volta ao mesmo funcionario, a reconexao."""
+    day = timezone.localtime(allocation.allocated_at).date()
+    scope_keys = get_employee_scope_keys(allocation.employee)
+    increment_counter(day, scope_keys, Metric.DELIVERED)
+
+    was_reconnected = (
+        LineAllocation.objects.filter(
+            phone_line_id=allocation.phone_line_id,
+            employee_id=allocation.employee_id,
+            released_at__isnull=False,
+            released_at__lt=allocation.allocated_at,
+        )
+        .exclude(pk=allocation.pk)
+        .exists()
+    )
+    if was_reconnected:
+        increment_counter(day, scope_keys, Metric.RECONNECTED)
+
+
+def record_phone_line_created(phone_line):
+    day = timezone.localtime(phone_line.created_at).date()
+    increment_counter(day, [GLOBAL_DASHBOARD_SCOPE], Metric.NEW)
+
+
+def record_reconnect_day_change(employee, previous_day, current_day):
+    """
+    Ajusta o contador de reconectados apos uma resolucao manual mudar.
+
+    previous_day/current_day sao os dias em que o registro contava como
+    reconexao antes e depois da alteracao (None quando nao contava).
+    """
+    if previous_day == current_day:
+        return
+    scope_keys = get_employee_scope_keys(employee)
+    if previous_day is not None:
+        increment_counter(previous_day, scope_keys, Metric.RECONNECTED, delta=-1)
+    if current_day is not None:
+        increment_counter(current_day, scope_keys, Metric.RECONNECTED)
+
+
+def record_pendency_reconnect_change(pendency, previous_day, current_day):
+    """Reconexao resolvida ou reaberta via pendencia."""
+    record_reconnect_day_change(pendency.employee, previous_day, current_day)
+
+
+def get_counter_indicator_values(start_day, end_day, scope_key):
+    """
+    Retorna {dia: {chave_do_indicador: valor}} lendo apenas os contadores.
+
+    Dias sem contador valem zero.
+    """
+    scope_keys = {GLOBAL_DASHBOARD_SCOPE, scope_key}
+    counters = DashboardDailyCounter.objects.filter(
+        date__range=(start_day, end_day),
+        scope_key__in=scope_keys,
+    ).values_list("date", "scope_key", "metric", "value")
+
+    values = defaultdict(lambda: dict.fromkeys(METRIC_INDICATOR_KEYS.values(), 0))
+    for day, row_scope_key, metric, value in counters:
+        if metric == Metric.NEW:
+            if row_scope_key != GLOBAL_DASHBOARD_SCOPE:
+                continue
+        elif row_scope_key != scope_key:
+            continue
+        values[day][METRIC_INDICATOR_KEYS[metric]] = value
+    return values
+
+
+def build_counters_from_indicators(scope_key, indicators):
+    metrics = (
+        METRIC_INDICATOR_KEYS if scope_key == GLOBAL_DASHBOARD_SCOPE else SCOPED_METRICS
+    )
+    return [
+        DashboardDailyCounter(
+            date=day,
+            scope_key=scope_key,
+            metric=metric,
+            value=int(indicator[METRIC_INDICATOR_KEYS[metric]]),
+        )
+        for day, indicator in indicators.items()
+        for metric in metrics
+    ]
+
+
+@transaction.atomic
+def replace_counters(start_day, end_day, scope_key, counters):
+    DashboardDailyCounter.objects.filter(
+        date__range=(start_day, end_day),
+        scope_key=scope_key,
+    ).delete()
+    DashboardDailyCounter.objects.bulk_create(counters)
@@ -0,0 +1,84 @@
+"""Cache de leitura dos indicadores do dia corrente do dashboard."""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.lookups import email_iexact
+from core.services.version_stamp_service import (
+    bump_version_stamp,
+    get_version_stamp,
+)
+from users.models import SystemUser
+
+TODAY_INDICATOR_CACHE_PREFIX = "dashboard:today-indicator"
+DASHBOARD_INDICATOR_VERSION_NAMESPACE = "dashboard-indicators"
+GLOBAL_DASHBOARD_SCOPE = "global"
+
+
+def get_today_indicator_cache_timeout():
+    return getattr(settings, "DASHBOARD_TODAY_INDICATOR_CACHE_TTL", 30)
+
+
+def get_dashboard_scope_key(user=None):
+    """
+    Identifica o escopo de dados do usuario no dashboard.
+
+    Supervisor e backoffice compartilham o escopo do supervisor efetivo;
+    gerente usa o proprio email. Demais perfis enxergam o escopo global.
+    """
+    role = getattr(user, "role", None)
+    if role in SystemUser.SUPERVISOR_SCOPE_ROLES:
+        supervisor_email = (user.get_effective_supervisor_email() or "").lower()
+        return f"supervisor:{supervisor_email}"
+    if role == SystemUser.Role.GERENTE:
+        return f"manager:{(user.email or '').lower()}"
+    return GLOBAL_DASHBOARD_SCOPE
+
+
+def get_employee_scope_keys(employee):
+    """
+    Escopos de dashboard que enxergam o funcionario, incluindo o global.
+
+    Inverso de SystemUser.scope_employee_queryset: supervisor pelo
+    corporate_email, gerente pelo manager_email do funcionario ou do
+    supervisor.
+    """
+    supervisor_email = (employee.corporate_email or "").lower()
+    scope_keys = [GLOBAL_DASHBOARD_SCOPE, f"supervisor:{supervisor_email}"]
+    manager_emails = {(employee.manager_email or "").lower()}
+    manager_emails.update(
+        (email or "").lower()
+        for email in SystemUser.objects.filter(
+            email_iexact("email", supervisor_email),
+            role=SystemUser.Role.SUPER,
+        ).values_list("manager_email", flat=True)
+    )
+    scope_keys.extend(f"manager:{email}" for email in sorted(manager_emails) if email)
+    return scope_keys
+
+
+def get_today_indicator_generation():
+    return get_version_stamp(DASHBOARD_INDICATOR_VERSION_NAMESPACE)
+
+
+def invalidate_today_indicator_cache():
+    """Descarta todos os indicadores do dia em cache, de todos os escopos."""
+    bump_version_stamp(DASHBOARD_INDICATOR_VERSION_NAMESPACE)
+
+
+def get_or_build_today_indicator(day, scope_key, builder):
+    """
+    Retorna o indicador do dia em cache ou calcula via builder e armazena.
+
+    A chave inclui a geracao atual: qualquer invalidacao torna as entradas
+    antigas inalcancaveis sem precisar enumerar os escopos.
+    """
+    cache_key = (
+        f"{TODAY_INDICATOR_CACHE_PREFIX}:{get_today_indicator_generation()}:"
+        f"{day.isoformat()}:{scope_key}"
+    )
+    indicator = cache.get(cache_key)
+    if indicator is None:
+        indicator = builder()
+        cache.set(cache_key, indicator, get_today_indicator_cache_timeout())
+    return dict(indicator)
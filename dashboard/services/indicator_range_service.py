@@ -0,0 +1,306 @@
+"""
+Calculo em lote dos indicadores diarios do dashboard para um intervalo de dias.
+
+Cada metrica e resolvida por uma unica query com uma contagem condicional por
+dia (COUNT ... FILTER), em vez de uma bateria de COUNT/EXISTS por dia. O custo
+em round trips fica constante para periodos de 7, 15 ou 30 dias.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from core.constants import B2B_PORTFOLIO_NAMES, B2C_PORTFOLIO_NAMES
+from core.services.daily_indicator_service import DailyIndicatorService
+from dashboard.services.event_counter_service import (
+    event_counters_enabled,
+    get_counter_indicator_values,
+)
+from dashboard.services.indicator_cache_service import (
+    GLOBAL_DASHBOARD_SCOPE,
+    get_dashboard_scope_key,
+)
+from dashboard.services.query_service import uses_scoped_dashboard_metrics
+from employees.models import Employee
+from telecom.models import PhoneLine
+
+
+def get_day_bounds(day):
+    start_of_day = timezone.make_aware(datetime.combine(day, time.min))
+    end_of_day = timezone.make_aware(datetime.combine(day, time.max))
+    return start_of_day, end_of_day
+
+
+def iter_days(start_day, end_day):
+    day = start_day
+    while day <= end_day:
+        yield day
+        day += timedelta(days=1)
+
+
+def phone_line_visible_at_reference_q(reference_field, prefix=""):
+    return (
+        Q(**{f"{prefix}is_deleted": False})
+        | Q(**{f"{prefix}updated_at__gt": F(reference_field)})
+    ) & (
+        Q(**{f"{prefix}sim_card__is_deleted": False})
+        | Q(**{f"{prefix}sim_card__updated_at__gt": F(reference_field)})
+    )
+
+
+def employee_visible_at_q(end_of_day, prefix=""):
+    return Q(**{f"{prefix}created_at__lte": end_of_day}) & (
+        Q(**{f"{prefix}is_deleted": False})
+        | Q(**{f"{prefix}updated_at__gt": end_of_day})
+    )
+
+
+def allocation_active_at_q(reference_time, prefix=""):
+    return Q(**{f"{prefix}allocated_at__lte": reference_time}) & (
+        Q(**{f"{prefix}released_at__isnull": True})
+        | Q(**{f"{prefix}released_at__gt": reference_time})
+    )
+
+
+def _count_key(metric, index):
+    return f"{metric}_{index}"
+
+
+def get_scoped_employees_for_range(start_day, end_day, user=None):
+    """Funcionarios do escopo que existiram em algum momento do intervalo."""
+    _, start_end_of_day = get_day_bounds(start_day)
+    _, range_end_of_day = get_day_bounds(end_day)
+    employees = Employee.all_objects.filter(created_at__lte=range_end_of_day).filter(
+        Q(is_deleted=False) | Q(updated_at__gt=start_end_of_day)
+    )
+    if uses_scoped_dashboard_metrics(user):
+        employees = user.scope_employee_queryset(employees)
+    return employees
+
+
+def _count_employee_coverage_by_day(days, employees, today):
+    """
+    Conta pessoas logadas e descobertos (sem alocacao ativa) por carteira e dia.
+
+    Dias historicos tratam qualquer funcionario existente como ativo; o dia
+    corrente respeita o status atual, como em build_indicator_for_day.
+    """
+    aggregates = {}
+    for index, day in enumerate(days):
+        _, end_of_day = get_day_bounds(day)
+        logged_q = employee_visible_at_q(end_of_day)
+        if day >= today:
+            logged_q &= Q(status=Employee.Status.ACTIVE)
+        has_active_allocation = Exists(
+            LineAllocation.objects.filter(employee_id=OuterRef("pk"))
+            .filter(allocation_active_at_q(end_of_day))
+            .filter(
+                DailyIndicatorService.build_visible_phone_line_q(
+                    end_of_day, prefix="phone_line__"
+                )
+            )
+        )
+        aggregates[_count_key("logged", index)] = Count("id", filter=logged_q)
+        aggregates[_count_key("uncovered", index)] = Count(
+            "id", filter=logged_q & ~has_active_allocation
+        )
+
+    return list(employees.order_by().values("employee_id").annotate(**aggregates))
+
+
+def _count_available_lines_by_day(days):
+    _, start_end_of_day = get_day_bounds(days[0])
+    _, range_end_of_day = get_day_bounds(days[-1])
+    lines = PhoneLine.all_objects.filter(
+        status=PhoneLine.Status.AVAILABLE,
+        created_at__lte=range_end_of_day,
+    ).filter(DailyIndicatorService.build_visible_phone_line_q(start_end_of_day))
+
+    aggregates = {}
+    for index, day in enumerate(days):
+        _, end_of_day = get_day_bounds(day)
+        is_allocated = Exists(
+            LineAllocation.objects.filter(phone_line_id=OuterRef("pk")).filter(
+                allocation_active_at_q(end_of_day)
+            )
+        )
+        visible_q = Q(created_at__lte=end_of_day) & (
+            DailyIndicatorService.build_visible_phone_line_q(end_of_day)
+        )
+        aggregates[_count_key("available", index)] = Count(
+            "id", filter=visible_q & ~is_allocated
+        )
+    return lines.aggregate(**aggregates)
+
+
+def _count_allocations_by_day(days, allocations, metric, employees=None, today=None):
+    aggregates = {}
+    for index, day in enumerate(days):
+        start_of_day, end_of_day = get_day_bounds(day)
+        day_q = Q(allocated_at__range=(start_of_day, end_of_day))
+        if employees is not None:
+            day_q &= employee_visible_at_q(end_of_day, prefix="employee__")
+        if today is not None and day >= today:
+            day_q &= Q(
+                phone_line__is_deleted=False,
+                phone_line__sim_card__is_deleted=False,
+            )
+        aggregates[_count_key(metric, index)] = Count("id", filter=day_q)
+    return allocations.aggregate(**aggregates)
+
+
+def _get_allocations_for_range(days, employees=None):
+    start_of_range, _ = get_day_bounds(days[0])
+    _, end_of_range = get_day_bounds(days[-1])
+    allocations = LineAllocation.objects.filter(
+        allocated_at__range=(start_of_range, end_of_range)
+    ).filter(phone_line_visible_at_reference_q("allocated_at", prefix="phone_line__"))
+    if employees is not None:
+        allocations = allocations.filter(employee_id__in=employees.values("id"))
+    return allocations
+
+
+def _count_new_lines_by_day(days):
+    start_of_range, _ = get_day_bounds(days[0])
+    _, end_of_range = get_day_bounds(days[-1])
+    lines = PhoneLine.all_objects.filter(
+        created_at__range=(start_of_range, end_of_range)
+    ).filter(phone_line_visible_at_reference_q("created_at"))
+
+    aggregates = {}
+    for index, day in enumerate(days):
+        start_of_day, end_of_day = get_day_bounds(day)
+        aggregates[_count_key("new", index)] = Count(
+            "id", filter=Q(created_at__range=(start_of_day, end_of_day))
+        )
+    return lines.aggregate(**aggregates)
+
+
+def _count_events_by_day(days, user, employees, today):
+    """Entregues, reconectados e novos calculados a partir das linhas brutas."""
+    # Import local evita ciclo: dashboard.views importa este servico.
+    from dashboard.views import (
+        count_admin_resolved_reconnect_numbers_by_day,
+        count_pendency_resolved_reconnect_numbers_by_day,
+    )
+
+    scoped_employees = employees if uses_scoped_dashboard_metrics(user) else None
+    allocations = _get_allocations_for_range(days, scoped_employees)
+    delivered_counts = _count_allocations_by_day(
+        days, allocations, "delivered", scoped_employees
+    )
+    reconnected_allocations = allocations.annotate(
+        was_reconnected_to_same_employee=Exists(
+            LineAllocation.objects.filter(
+                phone_line_id=OuterRef("phone_line_id"),
+                employee_id=OuterRef("employee_id"),
+                released_at__isnull=False,
+                released_at__lt=OuterRef("allocated_at"),
+            )
+        )
+    ).filter(was_reconnected_to_same_employee=True)
+    reconnected_counts = _count_allocations_by_day(
+        days, reconnected_allocations, "reconnected", scoped_employees, today
+    )
+    admin_reconnected_by_day = count_admin_resolved_reconnect_numbers_by_day(
+        days[0], days[-1], scoped_employees
+    )
+    pendency_reconnected_by_day = count_pendency_resolved_reconnect_numbers_by_day(
+        days[0], days[-1], scoped_employees
+    )
+    new_counts = _count_new_lines_by_day(days)
+
+    return {
+        day: {
+            "numeros_entregues": delivered_counts[_count_key("delivered", index)],
+            "reconectados": (
+                reconnected_counts[_count_key("reconnected", index)]
+                + admin_reconnected_by_day.get(day, 0)
+                + pendency_reconnected_by_day.get(day, 0)
+            ),
+            "novos": new_counts[_count_key("new", index)],
+        }
+        for index, day in enumerate(days)
+    }
+
+
+def build_indicators_for_range(start_day, end_day, user=None, use_counters=None):
+    """
+    Calcula os indicadores resumidos de cada dia entre start_day e end_day.
+
+    Retorna um dict {dia: indicador} com as mesmas chaves do resumo produzido
+    por build_indicator_for_day (sem listas de detalhe). Com os contadores de
+    eventos habilitados, entregues/reconectados/novos vem da tabela de
+    contadores em vez das alocacoes.
+    """
+    # Import local evita ciclo: dashboard.views importa este servico.
+    from dashboard.views import normalize_portfolio_name
+
+    days = list(iter_days(start_day, end_day))
+    if not days:
+        return {}
+
+    today = timezone.localdate()
+    employees = get_scoped_employees_for_range(start_day, end_day, user)
+
+    coverage_rows = _count_employee_coverage_by_day(days, employees, today)
+    available_counts = _count_available_lines_by_day(days)
+    if use_counters is None:
+        use_counters = event_counters_enabled()
+    if use_counters:
+        scope_key = (
+            get_dashboard_scope_key(user)
+            if uses_scoped_dashboard_metrics(user)
+            else GLOBAL_DASHBOARD_SCOPE
+        )
+        event_counts = get_counter_indicator_values(start_day, end_day, scope_key)
+    else:
+        event_counts = _count_events_by_day(days, user, employees, today)
+
+    segment_by_portfolio = {}
+    for row in coverage_rows:
+        normalized = normalize_portfolio_name(row["employee_id"])
+        if normalized in B2B_PORTFOLIO_NAMES:
+            segment_by_portfolio[row["employee_id"]] = "B2B"
+        elif normalized in B2C_PORTFOLIO_NAMES:
+            segment_by_portfolio[row["employee_id"]] = "B2C"
+
+    indicators = {}
+    for index, day in enumerate(days):
+        logged_key = _count_key("logged", index)
+        uncovered_key = _count_key("uncovered", index)
+        total_negociadores = sum(row[logged_key] for row in coverage_rows)
+        sem_whats = sum(row[uncovered_key] for row in coverage_rows)
+        b2b_sem_whats = sum(
+            row[uncovered_key]
+            for row in coverage_rows
+            if segment_by_portfolio.get(row["employee_id"]) == "B2B"
+        )
+        b2c_sem_whats = sum(
+            row[uncovered_key]
+            for row in coverage_rows
+            if segment_by_portfolio.get(row["employee_id"]) == "B2C"
+        )
+        perc_sem_whats = (
+            (sem_whats / total_negociadores * 100) if total_negociadores else 0
+        )
+
+        indicators[day] = {
+            "data": day,
+            "pessoas_logadas": total_negociadores,
+            "perc_sem_whats": perc_sem_whats,
+            "b2b_sem_whats": b2b_sem_whats,
+            "b2c_sem_whats": b2c_sem_whats,
+            "numeros_disponiveis": available_counts[_count_key("available", index)],
+            "numeros_entregues": event_counts[day]["numeros_entregues"],
+            "reconectados": event_counts[day]["reconectados"],
+            "novos": event_counts[day]["novos"],
+            "total_descoberto_dia": sem_whats,
+            "available_numbers": [],
+            "delivered_numbers": [],
+            "reconnected_numbers": [],
+            "new_numbers": [],
+        }
+    return indicators
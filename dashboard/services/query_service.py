@@ -6,6 +6,9 @@ from allocations.models import LineAllocation
 from employees.models import Employee
 from pendencies.models import AllocationPendency
 from telecom.models import PhoneLine, SIMcard
+from telecom.services.inventory_counters_service import (
+    get_cached_inventory_counters,
+)
 from users.models import SystemUser
 
 
@@ -52,6 +55,12 @@ def get_scoped_phone_lines_queryset_for_dashboard(user):
 
 
 def build_dashboard_overview_counts(user):
+    return get_cached_inventory_counters(
+        "dashboard_overview", user, lambda: _build_dashboard_overview_counts(user)
+    )
+
+
+def _build_dashboard_overview_counts(user):
     scoped_active_employees = get_supervised_employees_queryset(user).filter(
         status=Employee.Status.ACTIVE,
         is_deleted=False,
@@ -73,6 +82,12 @@ def build_dashboard_overview_counts(user):
 
 
 def build_dashboard_status_counts(user):
+    return get_cached_inventory_counters(
+        "dashboard_status", user, lambda: _build_dashboard_status_counts(user)
+    )
+
+
+def _build_dashboard_status_counts(user):
     sim_counts = defaultdict(int)
     line_counts = defaultdict(int)
 
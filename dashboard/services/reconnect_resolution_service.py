@@ -0,0 +1,242 @@
+"""
+Reconexoes resolvidas manualmente: DailyUserAction (legado) e AllocationPendency.
+
+A linha de cada resolucao e determinada dentro da propria query. Quando a acao
+ou a pendencia nao aponta para uma alocacao, usa-se a unica alocacao ativa e
+visivel do funcionario no instante da resolucao, obtida por subquery
+correlacionada (o equivalente ORM de um LEFT JOIN LATERAL). Contagem e
+detalhamento leem as mesmas linhas, para um dia ou um intervalo.
+"""
+
+from collections import Counter
+
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard.models import DailyUserAction
+from dashboard.services.indicator_range_service import (
+    get_day_bounds,
+    phone_line_visible_at_reference_q,
+)
+from pendencies.models import AllocationPendency
+from users.models import SystemUser
+
+ROW_FIELDS = (
+    "resolved_day",
+    "reconnected_number",
+    "employee__full_name",
+    "employee__employee_id",
+    "employee__created_at",
+    "employee__is_deleted",
+    "employee__updated_at",
+)
+
+
+def _phone_line_visible_at_outer_q(reference_field):
+    return (
+        Q(phone_line__is_deleted=False)
+        | Q(phone_line__updated_at__gt=OuterRef(reference_field))
+    ) & (
+        Q(phone_line__sim_card__is_deleted=False)
+        | Q(phone_line__sim_card__updated_at__gt=OuterRef(reference_field))
+    )
+
+
+def _visible_active_allocations_at(reference_field):
+    return (
+        LineAllocation.objects.filter(
+            employee_id=OuterRef("employee_id"),
+            allocated_at__lte=OuterRef(reference_field),
+        )
+        .filter(
+            Q(released_at__isnull=True) | Q(released_at__gt=OuterRef(reference_field))
+        )
+        .filter(_phone_line_visible_at_outer_q(reference_field))
+        .order_by()
+    )
+
+
+def annotate_resolved_allocation(queryset, reference_field):
+    """
+    Anota resolved_allocation_id: a alocacao informada ou, na falta dela, a
+    unica alocacao visivel ativa do funcionario em reference_field.
+    """
+    fallback = _visible_active_allocations_at(reference_field)
+    fallback_count = fallback.values("employee_id").annotate(total=Count("id"))
+    return queryset.annotate(
+        fallback_allocation_count=Subquery(
+            fallback_count.values("total")[:1], output_field=IntegerField()
+        ),
+    ).annotate(
+        resolved_allocation_id=Coalesce(
+            "allocation_id",
+            Case(
+                When(
+                    fallback_allocation_count=1,
+                    then=Subquery(fallback.values("id")[:1]),
+                ),
+                output_field=IntegerField(),
+            ),
+        ),
+    )
+
+
+def _annotate_reconnected_number(queryset, visibility_q):
+    return queryset.annotate(
+        reconnected_number=Subquery(
+            LineAllocation.objects.filter(pk=OuterRef("resolved_allocation_id"))
+            .filter(visibility_q)
+            .values("phone_line__phone_number")[:1]
+        )
+    ).filter(reconnected_number__isnull=False)
+
+
+def get_admin_resolved_reconnect_actions_range_queryset(
+    start_day, end_day, employee_ids=None
+):
+    queryset = DailyUserAction.objects.filter(
+        day__range=(start_day, end_day),
+        action_type=DailyUserAction.ActionType.RECONNECT_WHATSAPP,
+        is_resolved=True,
+        updated_by__role=SystemUser.Role.ADMIN,
+        updated_at__date=F("day"),
+    ).select_related("employee", "allocation__phone_line__sim_card")
+
+    if employee_ids is not None:
+        queryset = queryset.filter(employee_id__in=employee_ids)
+
+    return queryset.order_by("-updated_at", "-id")
+
+
+def _employee_in_scope(row, employee_ids):
+    if employee_ids is None:
+        return True
+    _, end_of_day = get_day_bounds(row["resolved_day"])
+    return row["employee__created_at"] <= end_of_day and (
+        not row["employee__is_deleted"] or row["employee__updated_at"] > end_of_day
+    )
+
+
+def _to_detail(row):
+    return {
+        "numero": row["reconnected_number"],
+        "usuario": row["employee__full_name"],
+        "carteira": row["employee__employee_id"],
+    }
+
+
+def get_admin_resolved_reconnect_rows(start_day, end_day, employee_ids=None):
+    """
+    Reconexoes resolvidas por admin via DailyUserAction no intervalo.
+
+    A visibilidade da linha e avaliada no momento da resolucao (updated_at).
+    """
+    actions = annotate_resolved_allocation(
+        get_admin_resolved_reconnect_actions_range_queryset(
+            start_day, end_day, employee_ids
+        ).select_related(None),
+        "updated_at",
+    )
+    actions = _annotate_reconnected_number(
+        actions, _phone_line_visible_at_outer_q("updated_at")
+    ).annotate(resolved_day=F("day"))
+    return [
+        row
+        for row in actions.values(*ROW_FIELDS)
+        if _employee_in_scope(row, employee_ids)
+    ]
+
+
+def _resolved_reconnect_pendencies(pendencies):
+    pendencies = pendencies.filter(
+        last_submitted_action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
+    )
+    pendencies = annotate_resolved_allocation(pendencies, "resolved_at")
+    return _annotate_reconnected_number(
+        pendencies,
+        phone_line_visible_at_reference_q("allocated_at", prefix="phone_line__"),
+    )
+
+
+def get_pendency_resolved_reconnect_rows(start_day, end_day, employee_ids=None):
+    """
+    Reconexoes resolvidas via AllocationPendency no intervalo.
+
+    A visibilidade da linha e avaliada no momento da alocacao, como no fluxo
+    de pendencias.
+    """
+    start_of_range, _ = get_day_bounds(start_day)
+    _, end_of_range = get_day_bounds(end_day)
+    pendencies = AllocationPendency.objects.filter(
+        resolved_at__range=(start_of_range, end_of_range),
+    )
+    if employee_ids is not None:
+        pendencies = pendencies.filter(employee_id__in=employee_ids)
+
+    pendencies = _resolved_reconnect_pendencies(pendencies).order_by(
+        "resolved_at", "id"
+    )
+
+    rows = []
+    for row in pendencies.values("resolved_at", *ROW_FIELDS[1:]):
+        row["resolved_day"] = timezone.localtime(row.pop("resolved_at")).date()
+        if _employee_in_scope(row, employee_ids):
+            rows.append(row)
+    return rows
+
+
+def get_pendency_reconnect_day(pendency_id):
+    """Dia em que a pendencia conta como reconexao resolvida, ou None."""
+    resolved_at = (
+        _resolved_reconnect_pendencies(
+            AllocationPendency.objects.filter(
+                pk=pendency_id,
+                resolved_at__isnull=False,
+            )
+        )
+        .values_list("resolved_at", flat=True)
+        .first()
+    )
+    if resolved_at is None:
+        return None
+    return timezone.localtime(resolved_at).date()
+
+
+def get_admin_action_reconnect_day(action_id):
+    """Dia em que a acao conta como reconexao resolvida por admin, ou None."""
+    actions = annotate_resolved_allocation(
+        DailyUserAction.objects.filter(
+            pk=action_id,
+            action_type=DailyUserAction.ActionType.RECONNECT_WHATSAPP,
+            is_resolved=True,
+            updated_by__role=SystemUser.Role.ADMIN,
+            updated_at__date=F("day"),
+        ),
+        "updated_at",
+    )
+    return (
+        _annotate_reconnected_number(
+            actions, _phone_line_visible_at_outer_q("updated_at")
+        )
+        .values_list("day", flat=True)
+        .first()
+    )
+
+
+def count_rows_by_day(rows):
+    return dict(Counter(row["resolved_day"] for row in rows))
+
+
+def build_details(rows):
+    return [_to_detail(row) for row in rows]
@@ -0,0 +1,150 @@
+"""
+Recalculo em lote dos snapshots historicos do dashboard (global e por escopo).
+
+Usado pelo comando backfill_dashboard_snapshots. As funcoes de trabalho
+recebem apenas tipos simples (ids e datas) para poderem rodar em processos
+separados, cada um com a propria conexao de banco.
+"""
+
+from datetime import timedelta
+
+from django.db import close_old_connections, connections
+
+from dashboard.models import DashboardDailySnapshot, DashboardScopedDailySnapshot
+from dashboard.services.indicator_cache_service import get_dashboard_scope_key
+from dashboard.services.indicator_range_service import (
+    build_indicators_for_range,
+    iter_days,
+)
+from users.models import SystemUser
+
+# Percentuais sao exibidos com duas casas; diferencas menores que meio
+# centesimo nao contam como divergencia no --force/--dry-run.
+PERCENT_TOLERANCE = 0.005
+
+
+def get_scope_users():
+    """Um usuario representante por escopo de supervisor/gerente."""
+    scope_users = {}
+    users = SystemUser.objects.filter(
+        role__in=[SystemUser.Role.SUPER, SystemUser.Role.GERENTE],
+        is_active=True,
+    ).order_by("email")
+    for user in users:
+        scope_users.setdefault(get_dashboard_scope_key(user), user)
+    return scope_users
+
+
+def get_existing_snapshots(start_day, end_day, scope_key=None):
+    if scope_key is None:
+        queryset = DashboardDailySnapshot.objects.filter(
+            date__range=(start_day, end_day)
+        )
+    else:
+        queryset = DashboardScopedDailySnapshot.objects.filter(
+            scope_key=scope_key,
+            date__range=(start_day, end_day),
+        )
+    return {snapshot.date: snapshot for snapshot in queryset}
+
+
+def get_days_to_recompute(start_day, end_day, snapshots, current_version, force=False):
+    """Dias sem snapshot ou com versao antiga; com force, todos os dias."""
+    return [
+        day
+        for day in iter_days(start_day, end_day)
+        if force
+        or day not in snapshots
+        or snapshots[day].calculation_version < current_version
+    ]
+
+
+def split_into_chunks(days, chunk_size):
+    """Agrupa dias consecutivos em blocos de no maximo chunk_size dias."""
+    chunks = []
+    for day in days:
+        if (
+            chunks
+            and len(chunks[-1]) < chunk_size
+            and chunks[-1][-1] + timedelta(days=1) == day
+        ):
+            chunks[-1].append(day)
+        else:
+            chunks.append([day])
+    return [(chunk[0], chunk[-1]) for chunk in chunks]
+
+
+def init_worker():
+    """Descarta conexoes herdadas do processo pai; cada worker abre a sua."""
+    connections.close_all()
+
+
+def recompute_snapshot_chunk(scope_user_id, start_day, end_day, persist=True):
+    """
+    Recalcula os indicadores de start_day..end_day e, se persist, grava.
+
+    scope_user_id None recalcula o snapshot global; caso contrario, o snapshot
+    do escopo do usuario informado. Retorna apenas as metricas de cada dia,
+    sem as listas de detalhe, para reduzir o trafego entre processos.
+    """
+    # Import local evita ciclo: dashboard.views importa os servicos.
+    from dashboard.views import (
+        persist_dashboard_snapshots,
+        persist_scoped_dashboard_snapshots,
+    )
+
+    close_old_connections()
+    user = None
+    if scope_user_id is not None:
+        user = SystemUser.objects.get(pk=scope_user_id)
+
+    indicators = build_indicators_for_range(start_day, end_day, user=user)
+    ordered = [indicators[day] for day in iter_days(start_day, end_day)]
+    if persist:
+        if user is None:
+            persist_dashboard_snapshots(ordered)
+        else:
+            persist_scoped_dashboard_snapshots(get_dashboard_scope_key(user), ordered)
+
+    metric_keys = get_snapshot_metric_keys(scoped=user is not None)
+    return {
+        indicator["data"]: {key: indicator[key] for key in metric_keys}
+        for indicator in ordered
+    }
+
+
+def get_snapshot_metric_keys(scoped=False):
+    from dashboard.views import SCOPED_DASHBOARD_METRIC_KEYS
+
+    if scoped:
+        return SCOPED_DASHBOARD_METRIC_KEYS
+    return (*SCOPED_DASHBOARD_METRIC_KEYS, "numeros_disponiveis", "novos")
+
+
+def diff_snapshot_metrics(snapshot, metrics):
+    """
+    Lista (metrica, valor gravado, valor calculado) das metricas que mudariam.
+
+    Sem snapshot gravado, todas as metricas aparecem com valor gravado None.
+    """
+    from dashboard.views import (
+        _serialize_scoped_snapshot_indicator,
+        _serialize_snapshot_indicator,
+    )
+
+    if snapshot is None:
+        return [(key, None, value) for key, value in metrics.items()]
+    if isinstance(snapshot, DashboardScopedDailySnapshot):
+        stored = _serialize_scoped_snapshot_indicator(snapshot)
+    else:
+        stored = _serialize_snapshot_indicator(snapshot)
+
+    changes = []
+    for key, value in metrics.items():
+        if isinstance(value, float):
+            unchanged = abs(float(stored[key]) - value) < PERCENT_TOLERANCE
+        else:
+            unchanged = stored[key] == value
+        if not unchanged:
+            changes.append((key, stored[key], value))
+    return changes
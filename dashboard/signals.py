@@ -0,0 +1,91 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from allocations.models import LineAllocation
+from dashboard.services.event_counter_service import (
+    record_phone_line_created,
+    record_reconnect_day_change,
+)
+from dashboard.services.indicator_cache_service import (
+    invalidate_today_indicator_cache,
+)
+from dashboard.services.reconnect_resolution_service import (
+    get_admin_action_reconnect_day,
+)
+from employees.models import Employee
+from pendencies.models import AllocationPendency
+from telecom.models import PhoneLine, SIMcard
+
+from .models import DailyUserAction
+
+INDICATOR_SOURCE_MODELS = (
+    LineAllocation,
+    PhoneLine,
+    SIMcard,
+    Employee,
+    AllocationPendency,
+    DailyUserAction,
+)
+
+
+def invalidate_today_indicator_on_write(sender, **kwargs):
+    """Invalida o indicador do dia quando uma tabela de origem e alterada."""
+    # Apos o commit: invalidar antes deixaria um leitor concorrente regravar o
+    # cache com o estado anterior a transacao.
+    transaction.on_commit(invalidate_today_indicator_cache)
+
+
+for model in INDICATOR_SOURCE_MODELS:
+    post_save.connect(invalidate_today_indicator_on_write, sender=model)
+    post_delete.connect(invalidate_today_indicator_on_write, sender=model)
+
+
+@receiver(post_save, sender=PhoneLine)
+def count_new_phone_line(sender, instance, created, raw=False, **kwargs):
+    """Soma a linha em "novos" em qualquer caminho de cadastro (upload, admin)."""
+    if created and not raw:
+        record_phone_line_created(instance)
+
+
+def _counts_as_resolved_reconnect(action_type, is_resolved):
+    return is_resolved and action_type == DailyUserAction.ActionType.RECONNECT_WHATSAPP
+
+
+def _stored_reconnect_day(instance):
+    """Dia de reconexao do registro salvo; so consulta se ele pode contar."""
+    if not instance.pk:
+        return None
+    previous = instance.get_previous_values()
+    if previous is None or not _counts_as_resolved_reconnect(
+        previous["action_type"], previous["is_resolved"]
+    ):
+        return None
+    return get_admin_action_reconnect_day(instance.pk)
+
+
+@receiver(pre_save, sender=DailyUserAction)
+def remember_admin_reconnect_day(sender, instance, raw=False, **kwargs):
+    instance._previous_reconnect_day = None if raw else _stored_reconnect_day(instance)
+
+
+@receiver(post_save, sender=DailyUserAction)
+def count_admin_reconnect_resolution(sender, instance, raw=False, **kwargs):
+    """Resolver, reabrir ou editar a acao ajusta "reconectados" do dia."""
+    if raw:
+        return
+    current_day = None
+    if _counts_as_resolved_reconnect(instance.action_type, instance.is_resolved):
+        current_day = get_admin_action_reconnect_day(instance.pk)
+    record_reconnect_day_change(
+        instance.employee,
+        getattr(instance, "_previous_reconnect_day", None),
+        current_day,
+    )
+
+
+@receiver(pre_delete, sender=DailyUserAction)
+def discount_deleted_admin_reconnect(sender, instance, **kwargs):
+    record_reconnect_day_change(
+        instance.employee, _stored_reconnect_day(instance), None
+    )
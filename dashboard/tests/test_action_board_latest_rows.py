@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard.models import DailyUserAction
+from dashboard.views import (
+    get_latest_status_history_by_phone_line,
+    get_unresolved_action_maps,
+)
+from employees.models import Employee
+from telecom.models import PhoneLine, PhoneLineHistory, SIMcard
+from users.models import SystemUser
+
+
+class ActionBoardLatestRowsTest(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.admin = SystemUser.objects.create_user(
+            email="latest.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.employee = Employee.objects.create(
+            full_name="Latest User",
+            corporate_email="latest.super@test.com",
+            employee_id="Natura",
+            teams="Joinville",
+            status=Employee.Status.ACTIVE,
+        )
+        self.phone_line = self._create_line("8900000000000088001", "+5511988888001")
+        self.deleted_line = self._create_line("8900000000000088002", "+5511988888002")
+        self.allocation = LineAllocation.objects.create(
+            employee=self.employee,
+            phone_line=self.phone_line,
+            allocated_by=self.admin,
+        )
+        self.deleted_allocation = LineAllocation.objects.create(
+            employee=self.employee,
+            phone_line=self.deleted_line,
+            allocated_by=self.admin,
+        )
+        PhoneLine.objects.filter(pk=self.deleted_line.pk).update(is_deleted=True)
+
+    def _create_line(self, iccid, phone_number):
+        sim_card = SIMcard.objects.create(
+            iccid=iccid,
+            carrier="CarrierLatest",
+            status=SIMcard.Status.AVAILABLE,
+        )
+        return PhoneLine.objects.create(
+            phone_number=phone_number,
+            sim_card=sim_card,
+            status=PhoneLine.Status.ALLOCATED,
+        )
+
+    def _action(self, day_offset, allocation=None, resolved=False):
+        return DailyUserAction.objects.create(
+            day=self.today - timedelta(days=day_offset),
+            employee=self.employee,
+            allocation=allocation,
+            action_type=DailyUserAction.ActionType.RECONNECT_WHATSAPP,
+            is_resolved=resolved,
+        )
+
+    def test_keeps_latest_unresolved_action_per_visible_allocation(self):
+        self._action(3, self.allocation)
+        latest_line_action = self._action(2, self.allocation)
+        self._action(0, self.allocation, resolved=True)
+        self._action(5)
+        latest_employee_action = self._action(1, self.deleted_allocation)
+
+        actions_by_allocation, latest_by_employee = get_unresolved_action_maps(
+            [self.employee.id]
+        )
+
+        self.assertEqual(
+            actions_by_allocation,
+            {
+                (self.employee.id, self.allocation.id): latest_line_action,
+                (self.employee.id, None): latest_employee_action,
+            },
+        )
+        self.assertEqual(latest_by_employee[self.employee.id], latest_employee_action)
+
+    def test_latest_status_history_per_phone_line(self):
+        now = timezone.now()
+        histories = [
+            PhoneLineHistory.objects.create(
+                phone_line=self.phone_line,
+                action=PhoneLineHistory.ActionType.STATUS_CHANGED,
+                changed_by=self.admin,
+            )
+            for _ in range(3)
+        ]
+        for offset, history in enumerate(histories):
+            PhoneLineHistory.objects.filter(pk=history.pk).update(
+                changed_at=now - timedelta(hours=offset)
+            )
+
+        latest = get_latest_status_history_by_phone_line([self.phone_line.id])
+
+        self.assertEqual(list(latest), [self.phone_line.id])
+        self.assertEqual(latest[self.phone_line.id].pk, histories[0].pk)
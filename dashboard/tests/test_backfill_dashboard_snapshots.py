@@ -0,0 +1,95 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from dashboard.models import DashboardDailySnapshot, DashboardScopedDailySnapshot
+from dashboard.services.snapshot_backfill_service import split_into_chunks
+from dashboard.views import CURRENT_DASHBOARD_SNAPSHOT_VERSION
+from users.models import SystemUser
+
+
+class BackfillDashboardSnapshotsCommandTest(TestCase):
+    def setUp(self):
+        self.end_day = timezone.localdate() - timedelta(days=1)
+        self.start_day = self.end_day - timedelta(days=2)
+        self.supervisor = SystemUser.objects.create_user(
+            email="backfill.super@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+        )
+
+    def _call(self, *args):
+        output = StringIO()
+        call_command(
+            "backfill_dashboard_snapshots",
+            "--start",
+            self.start_day.isoformat(),
+            "--end",
+            self.end_day.isoformat(),
+            *args,
+            stdout=output,
+        )
+        return output.getvalue()
+
+    def test_backfills_global_and_scoped_snapshots(self):
+        output = self._call("--chunk-days", "2")
+
+        self.assertIn("[1/4] global", output)
+        self.assertEqual(DashboardDailySnapshot.objects.count(), 3)
+        self.assertEqual(
+            DashboardScopedDailySnapshot.objects.filter(
+                scope_key=f"supervisor:{self.supervisor.email}"
+            ).count(),
+            3,
+        )
+
+    def test_skips_days_already_at_current_version(self):
+        self._call("--skip-scopes")
+        DashboardDailySnapshot.objects.filter(date=self.start_day).update(
+            calculation_version=CURRENT_DASHBOARD_SNAPSHOT_VERSION - 1
+        )
+
+        output = self._call("--skip-scopes")
+
+        self.assertIn("1 snapshot(s) recalculado(s)", output)
+        self.assertIn("ja estao atualizados", self._call("--skip-scopes"))
+
+    def test_dry_run_reports_changes_without_writing(self):
+        self._call("--skip-scopes")
+        DashboardDailySnapshot.objects.filter(date=self.end_day).update(
+            numbers_available=9
+        )
+
+        output = self._call("--skip-scopes", "--force", "--dry-run")
+
+        self.assertIn("numeros_disponiveis: 9 -> 0", output)
+        self.assertIn("Dry-run: 1 de 3 dia(s) mudariam", output)
+        self.assertEqual(
+            DashboardDailySnapshot.objects.get(date=self.end_day).numbers_available,
+            9,
+        )
+
+    def test_rejects_current_day(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "backfill_dashboard_snapshots",
+                "--end",
+                timezone.localdate().isoformat(),
+                stdout=StringIO(),
+            )
+
+    def test_split_into_chunks_breaks_on_gaps_and_size(self):
+        days = [self.start_day + timedelta(days=offset) for offset in (0, 1, 2, 4)]
+
+        self.assertEqual(
+            split_into_chunks(days, 2),
+            [
+                (days[0], days[1]),
+                (days[2], days[2]),
+                (days[3], days[3]),
+            ],
+        )
@@ -0,0 +1,298 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from allocations.models import LineAllocation
+from dashboard import views as dashboard_views
+from employees.models import Employee
+from pendencies.models import AllocationPendency
+from telecom.models import PhoneLine, SIMcard
+from users.models import SystemUser
+
+
+@override_settings(DASHBOARD_ACTION_BOARD_PAGE_SIZE=2)
+class DailyUserActionPaginationTest(TestCase):
+    def setUp(self):
+        self.supervisor = SystemUser.objects.create_user(
+            email="pagination.super@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+        )
+        self.client.force_login(self.supervisor)
+        self.employees = {}
+        for name in ("Eva", "Daniel", "Carla", "Bruno", "Ana"):
+            self.employees[name] = Employee.objects.create(
+                full_name=f"{name} Paginacao",
+                corporate_email=self.supervisor.email,
+                employee_id="Natura",
+                teams="Joinville",
+                status=Employee.Status.ACTIVE,
+            )
+
+    def _names(self, html):
+        return [
+            name
+            for name in ("Ana", "Bruno", "Carla", "Daniel", "Eva")
+            if f"{name} Paginacao" in html
+        ]
+
+    def test_board_renders_first_page_with_cursor(self):
+        response = self.client.get(reverse("daily_user_action_board"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["rows"]), 2)
+        self.assertEqual(response.context["total_rows"], 5)
+        self.assertTrue(response.context["has_more_rows"])
+        self.assertNotIn("form", response.context["rows"][0])
+        self.assertContains(response, "Carregar mais")
+
+    def test_rows_endpoint_walks_pages_by_cursor(self):
+        first_page = self.client.get(reverse("daily_user_action_board"))
+        cursor = first_page.context["next_cursor"]
+        names = self._names(first_page.content.decode())
+
+        while cursor:
+            response = self.client.get(
+                reverse("daily_user_action_rows"), {"cursor": cursor}
+            )
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            names.extend(self._names(payload["html"]))
+            cursor = payload["next_cursor"]
+
+        self.assertEqual(names, ["Ana", "Bruno", "Carla", "Daniel", "Eva"])
+
+    def test_user_filter_is_applied_before_building_rows(self):
+        response = self.client.get(
+            reverse("daily_user_action_board"), {"user": "carla"}
+        )
+
+        self.assertEqual(response.context["total_rows"], 1)
+        self.assertFalse(response.context["has_more_rows"])
+
+    def test_unknown_cursor_asks_client_to_reload(self):
+        for cursor in ("999999", "abc"):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    reverse("daily_user_action_rows"), {"cursor": cursor}
+                )
+
+                self.assertIsNone(response.json()["next_cursor"])
+                self.assertEqual(response.json()["count"], 0)
+
+    def test_next_page_builds_rows_only_for_page_employees(self):
+        first_page = self.client.get(reverse("daily_user_action_board"))
+
+        with patch.object(
+            dashboard_views,
+            "build_daily_user_action_rows",
+            wraps=dashboard_views.build_daily_user_action_rows,
+        ) as build_rows:
+            response = self.client.get(
+                reverse("daily_user_action_rows"),
+                {"cursor": first_page.context["next_cursor"]},
+            )
+
+        built_names = [
+            employee.full_name.split()[0]
+            for call in build_rows.call_args_list
+            for employee in call.args[0]
+        ]
+        # Ana e Bruno (pagina anterior) nao sao remontados; Eva vem no bloco
+        # lido para saber se ha proxima pagina.
+        self.assertEqual(built_names, ["Carla", "Daniel", "Eva"])
+        self.assertEqual(self._names(response.json()["html"]), ["Carla", "Daniel"])
+        self.assertTrue(response.json()["has_more"])
+
+    def test_page_keeps_all_lines_of_an_employee_together(self):
+        admin = SystemUser.objects.create_user(
+            email="pagination.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        for suffix in ("1", "2"):
+            sim = SIMcard.objects.create(
+                iccid=f"890000000000007700{suffix}",
+                carrier="CarrierPagination",
+            )
+            line = PhoneLine.objects.create(
+                phone_number=f"+551199997700{suffix}", sim_card=sim
+            )
+            LineAllocation.objects.create(
+                employee=self.employees["Bruno"],
+                phone_line=line,
+                allocated_by=admin,
+                is_active=True,
+            )
+
+        response = self.client.get(reverse("daily_user_action_board"))
+
+        self.assertEqual(
+            [row["employee"].full_name for row in response.context["rows"]],
+            ["Ana Paginacao", "Bruno Paginacao", "Bruno Paginacao"],
+        )
+        self.assertEqual(
+            response.context["next_cursor"], str(self.employees["Bruno"].pk)
+        )
+
+
+@override_settings(DASHBOARD_ACTION_BOARD_PAGE_SIZE=2)
+class DailyUserActionBoardTotalsTest(TestCase):
+    def setUp(self):
+        self.admin = SystemUser.objects.create_user(
+            email="totals.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.technician = SystemUser.objects.create_user(
+            email="totals.tech@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+            first_name="Tecnico",
+            last_name="Totais",
+        )
+        self.client.force_login(self.admin)
+        self.filters = {
+            "supervisor": "",
+            "user": "",
+            "line": "",
+            "technical": "",
+            "sort": "",
+            "order": "asc",
+        }
+        self.employees = {
+            name: Employee.objects.create(
+                full_name=f"{name} Totais",
+                corporate_email="totals.super@test.com",
+                employee_id=portfolio,
+                pa=pa,
+                teams="Joinville",
+                status=Employee.Status.ACTIVE,
+                line_status=line_status,
+            )
+            for name, portfolio, pa, line_status in (
+                ("Ana", "Natura", "03", Employee.LineStatus.ACTIVE),
+                ("Bruno", "Avon", "01", Employee.LineStatus.RESTRICTED),
+                ("Carla", "Claro", None, Employee.LineStatus.ACTIVE),
+                ("Daniel", "Vivo", "02", Employee.LineStatus.ACTIVE),
+                ("Eva", "Avon", "01", Employee.LineStatus.ACTIVE),
+            )
+        }
+        self._allocate("Ana", "01", AllocationPendency.ActionType.NEW_NUMBER)
+        self._allocate("Ana", "02")
+        self._allocate(
+            "Carla",
+            "03",
+            AllocationPendency.ActionType.PENDING,
+            line_status=LineAllocation.LineStatus.RESTRICTED,
+        )
+        self._allocate("Daniel", "04", AllocationPendency.ActionType.RECONNECT_WHATSAPP)
+        self._allocate("Daniel", "05", AllocationPendency.ActionType.NEW_NUMBER)
+        self._allocate("Eva", "06")
+        AllocationPendency.objects.create(
+            employee=self.employees["Bruno"],
+            action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
+        )
+
+    def _allocate(self, name, suffix, action=None, line_status=None):
+        sim = SIMcard.objects.create(
+            iccid=f"890000000000007800{suffix}", carrier="CarrierTotals"
+        )
+        line = PhoneLine.objects.create(
+            phone_number=f"+551199997800{suffix}", sim_card=sim
+        )
+        allocation = LineAllocation.objects.create(
+            employee=self.employees[name],
+            phone_line=line,
+            allocated_by=self.admin,
+            is_active=True,
+            line_status=line_status or LineAllocation.LineStatus.ACTIVE,
+        )
+        if action:
+            AllocationPendency.objects.create(
+                employee=self.employees[name],
+                allocation=allocation,
+                action=action,
+                technical_responsible=self.technician,
+            )
+        return allocation
+
+    def _python_totals(self, filters):
+        rows = dashboard_views.build_daily_user_action_board_rows(self.admin, filters)
+        employee_levels = {row["employee"].id: row["criticality_level"] for row in rows}
+        criticality = {"high": 0, "medium": 0, "low": 0}
+        for level in employee_levels.values():
+            criticality[level] += 1
+        return (
+            len(rows),
+            dashboard_views.count_visible_pending_actions(rows),
+            criticality,
+        )
+
+    def test_aggregate_totals_match_built_rows(self):
+        for extra in ({}, {"line": "780003"}, {"technical": "tecnico"}):
+            filters = {**self.filters, **extra}
+            with self.subTest(filters=extra):
+                self.assertEqual(
+                    dashboard_views.count_daily_user_action_board_rows(
+                        self.admin, filters
+                    ),
+                    self._python_totals(filters),
+                )
+
+    def test_first_page_builds_rows_only_for_page_employees(self):
+        with patch.object(
+            dashboard_views,
+            "build_daily_user_action_rows",
+            wraps=dashboard_views.build_daily_user_action_rows,
+        ) as build_rows:
+            response = self.client.get(reverse("daily_user_action_board"))
+
+        built = sum(len(call.args[0]) for call in build_rows.call_args_list)
+        self.assertLess(built, len(self.employees))
+        self.assertEqual(response.context["total_rows"], 5)
+        self.assertEqual(response.context["action_counts"]["total"], 5)
+
+    def _names_in_order(self, html):
+        positions = {
+            name: html.find(f"{name} Totais")
+            for name in self.employees
+            if f"{name} Totais" in html
+        }
+        return sorted(positions, key=positions.get)
+
+    def test_employee_column_sort_pages_by_keyset(self):
+        for sort, order in (
+            ("pa", "asc"),
+            ("carteira", "desc"),
+            ("usuario", "desc"),
+            ("criticidade", "asc"),
+        ):
+            with self.subTest(sort=sort, order=order):
+                params = {"sort": sort, "order": order}
+                response = self.client.get(reverse("daily_user_action_board"), params)
+                names = [
+                    row["employee"].full_name.split()[0]
+                    for row in response.context["rows"]
+                ]
+                cursor = response.context["next_cursor"]
+                while cursor:
+                    payload = self.client.get(
+                        reverse("daily_user_action_rows"),
+                        {**params, "cursor": cursor},
+                    ).json()
+                    names.extend(self._names_in_order(payload["html"]))
+                    cursor = payload["next_cursor"]
+
+                expected = dashboard_views.build_daily_user_action_board_rows(
+                    self.admin, {**self.filters, **params}
+                )
+                self.assertEqual(
+                    list(dict.fromkeys(names)),
+                    list(
+                        dict.fromkeys(
+                            row["employee"].full_name.split()[0] for row in expected
+                        )
+                    ),
+                )
@@ -87,7 +87,7 @@ class DashboardCountsPerformanceTest(TestCase):
             side_effect=AssertionError("snapshot path must not build reconnect details"),
         )
         with detail_patch, reconnect_patch:
-            indicator = dashboard_views.get_dashboard_indicator_for_day(
+            indicator = dashboard_views.persist_dashboard_snapshot_for_day(
                 timezone.localdate()
             )
 
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 
 from allocations.models import LineAllocation
@@ -6,6 +7,7 @@ from telecom.models import PhoneLine, SIMcard
 from users.models import SystemUser
 
 from dashboard.services.query_service import (
+    build_dashboard_overview_counts,
     build_dashboard_status_counts,
     get_pending_action_counts_for_user,
 )
@@ -13,6 +15,7 @@ from dashboard.services.query_service import (
 
 class DashboardQueryServiceScopeTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.admin = SystemUser.objects.create_user(
             email="query.admin@test.com",
             password="StrongPass123",
@@ -110,3 +113,43 @@ class DashboardQueryServiceScopeTests(TestCase):
         """
         with self.assertNumQueries(1):
             get_pending_action_counts_for_user(self.admin)
+
+    def test_status_counts_are_cached_until_inventory_changes(self):
+        line = self._create_allocated_line(
+            suffix="301",
+            employee=self.employee_a,
+            status=PhoneLine.Status.SUSPENDED,
+        )
+        build_dashboard_status_counts(self.supervisor_a)
+
+        with self.assertNumQueries(0):
+            cached = build_dashboard_status_counts(self.supervisor_a)
+        cached_counts = {
+            item["value"]: item["count"] for item in cached["line_status_counts"]
+        }
+        self.assertEqual(cached_counts.get(PhoneLine.Status.SUSPENDED), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            line.status = PhoneLine.Status.CANCELLED
+            line.save(update_fields=["status"])
+
+        result = build_dashboard_status_counts(self.supervisor_a)
+        line_status_counts = {
+            item["value"]: item["count"] for item in result["line_status_counts"]
+        }
+        self.assertEqual(line_status_counts.get(PhoneLine.Status.SUSPENDED), 0)
+        self.assertEqual(line_status_counts.get(PhoneLine.Status.CANCELLED), 1)
+
+    def test_overview_counts_are_cached_per_scope(self):
+        self._create_allocated_line(
+            suffix="401",
+            employee=self.employee_a,
+            status=PhoneLine.Status.ALLOCATED,
+        )
+        admin_counts = build_dashboard_overview_counts(self.admin)
+        supervisor_counts = build_dashboard_overview_counts(self.supervisor_b)
+
+        self.assertEqual(admin_counts["allocated_lines"], 1)
+        self.assertEqual(supervisor_counts["allocated_lines"], 0)
+        with self.assertNumQueries(0):
+            self.assertEqual(build_dashboard_overview_counts(self.admin), admin_counts)
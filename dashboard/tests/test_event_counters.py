@@ -0,0 +1,239 @@
+import json
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.services.allocation_service import AllocationService
+from core.services.upload_service import process_upload_file
+from dashboard.models import DailyUserAction, DashboardDailyCounter
+from dashboard.services.indicator_range_service import build_indicators_for_range
+from employees.models import Employee
+from pendencies.models import AllocationPendency
+from telecom.models import PhoneLine, SIMcard
+from users.models import SystemUser
+
+Metric = DashboardDailyCounter.Metric
+
+
+class DashboardEventCounterTest(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.admin = SystemUser.objects.create_user(
+            email="counter.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.manager = SystemUser.objects.create_user(
+            email="counter.manager@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.GERENTE,
+        )
+        self.supervisor = SystemUser.objects.create_user(
+            email="counter.super@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+            manager_email=self.manager.email,
+        )
+        self.employee = Employee.objects.create(
+            full_name="Counter User",
+            corporate_email=self.supervisor.email,
+            employee_id="Natura",
+            teams="Joinville",
+            status=Employee.Status.ACTIVE,
+        )
+        sim_card = SIMcard.objects.create(
+            iccid="8900000000000066001",
+            carrier="CarrierCounter",
+            status=SIMcard.Status.AVAILABLE,
+        )
+        self.phone_line = PhoneLine.create_or_reuse(
+            phone_number="+5511966666001",
+            sim_card=sim_card,
+            status=PhoneLine.Status.AVAILABLE,
+        )
+
+    def _value(self, scope_key, metric):
+        counter = DashboardDailyCounter.objects.filter(
+            date=self.today, scope_key=scope_key, metric=metric
+        ).first()
+        return counter.value if counter else 0
+
+    def test_new_line_increments_global_counter(self):
+        self.assertEqual(self._value("global", Metric.NEW), 1)
+
+    def test_allocation_increments_every_scope_of_the_employee(self):
+        AllocationService.allocate_line(self.employee, self.phone_line, self.admin)
+
+        for scope_key in (
+            "global",
+            f"supervisor:{self.supervisor.email}",
+            f"manager:{self.manager.email}",
+        ):
+            self.assertEqual(self._value(scope_key, Metric.DELIVERED), 1)
+            self.assertEqual(self._value(scope_key, Metric.RECONNECTED), 0)
+
+    def test_reallocation_to_same_employee_counts_as_reconnection(self):
+        allocation = AllocationService.allocate_line(
+            self.employee, self.phone_line, self.admin
+        )
+        AllocationService.release_line(allocation, self.admin)
+        self.phone_line.refresh_from_db()
+
+        AllocationService.allocate_line(self.employee, self.phone_line, self.admin)
+
+        self.assertEqual(self._value("global", Metric.DELIVERED), 2)
+        self.assertEqual(self._value("global", Metric.RECONNECTED), 1)
+
+    def test_pendency_resolution_and_reopen_adjust_reconnected(self):
+        allocation = AllocationService.allocate_line(
+            self.employee, self.phone_line, self.admin
+        )
+        pendency = AllocationPendency.objects.create(
+            employee=self.employee,
+            allocation=allocation,
+            action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
+        )
+        self.client.force_login(self.admin)
+
+        def post_action(action):
+            response = self.client.post(
+                reverse("pendencies:update"),
+                data=json.dumps({"pendency_id": pendency.pk, "action": action}),
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 200)
+
+        post_action(AllocationPendency.ActionType.NO_ACTION)
+        self.assertEqual(self._value("global", Metric.RECONNECTED), 1)
+
+        post_action(AllocationPendency.ActionType.NEW_NUMBER)
+        self.assertEqual(self._value("global", Metric.RECONNECTED), 0)
+
+    def test_counters_match_live_computation_when_enabled(self):
+        AllocationService.allocate_line(self.employee, self.phone_line, self.admin)
+        live = build_indicators_for_range(self.today, self.today, self.supervisor)
+
+        with override_settings(DASHBOARD_EVENT_COUNTERS_ENABLED=True):
+            from_counters = build_indicators_for_range(
+                self.today, self.today, self.supervisor
+            )
+
+        self.assertEqual(from_counters, live)
+
+    def _assert_counters_match_live(self, user=None):
+        live = build_indicators_for_range(self.today, self.today, user)
+        with override_settings(DASHBOARD_EVENT_COUNTERS_ENABLED=True):
+            from_counters = build_indicators_for_range(self.today, self.today, user)
+        self.assertEqual(from_counters, live)
+
+    def test_uploaded_and_revived_lines_match_live_new_count(self):
+        revived_sim = SIMcard.objects.create(
+            iccid="8900000000000066002",
+            carrier="CarrierCounter",
+            status=SIMcard.Status.AVAILABLE,
+        )
+        revived_line = PhoneLine.create_or_reuse(
+            phone_number="+5511966666002",
+            sim_card=revived_sim,
+            status=PhoneLine.Status.AVAILABLE,
+        )
+        revived_line.delete()
+        PhoneLine.create_or_reuse(
+            phone_number=revived_line.phone_number,
+            sim_card=revived_sim,
+            status=PhoneLine.Status.AVAILABLE,
+        )
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(lambda: shutil.rmtree(temp_dir, ignore_errors=True))
+        upload_path = temp_dir / "lines.csv"
+        upload_path.write_text(
+            "type,iccid,carrier,phone_number,origem\n"
+            "simcard,8900000000000066003,Carrier A,+5511966666003,SRVMEMU-01\n",
+            encoding="utf-8",
+        )
+
+        summary = process_upload_file(upload_path)
+
+        self.assertFalse(summary.errors)
+        self.assertEqual(self._value("global", Metric.NEW), 3)
+        self._assert_counters_match_live()
+
+    def test_admin_resolution_of_daily_action_matches_live_reconnected(self):
+        allocation = AllocationService.allocate_line(
+            self.employee, self.phone_line, self.admin
+        )
+        action = DailyUserAction.objects.create(
+            day=self.today,
+            employee=self.employee,
+            allocation=allocation,
+            action_type=DailyUserAction.ActionType.RECONNECT_WHATSAPP,
+            supervisor=self.supervisor,
+            created_by=self.supervisor,
+            updated_by=self.supervisor,
+        )
+        self.client.force_login(self.admin)
+
+        response = self.client.post(
+            reverse("daily_user_action_board"),
+            data={
+                "day": self.today.isoformat(),
+                "employee_id": self.employee.pk,
+                "allocation_id": str(allocation.pk),
+                "action_type": "",
+                "note": "",
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        action.refresh_from_db()
+        self.assertTrue(action.is_resolved)
+        self.assertEqual(
+            self._value(f"supervisor:{self.supervisor.email}", Metric.RECONNECTED), 1
+        )
+        self._assert_counters_match_live()
+        self._assert_counters_match_live(self.supervisor)
+
+        action.delete()
+        self.assertEqual(self._value("global", Metric.RECONNECTED), 0)
+        self._assert_counters_match_live()
+
+    def test_unresolved_or_other_actions_skip_reconnect_lookup(self):
+        with patch("dashboard.signals.get_admin_action_reconnect_day") as reconnect_day:
+            action = DailyUserAction.objects.create(
+                day=self.today,
+                employee=self.employee,
+                action_type=DailyUserAction.ActionType.PENDING,
+                supervisor=self.supervisor,
+                created_by=self.supervisor,
+                updated_by=self.supervisor,
+            )
+            action.is_resolved = True
+            action.save()
+            action.action_type = DailyUserAction.ActionType.RECONNECT_WHATSAPP
+            action.is_resolved = False
+            action.save()
+            action.delete()
+
+        reconnect_day.assert_not_called()
+
+    def test_rebuild_command_reports_and_fixes_divergences(self):
+        AllocationService.allocate_line(self.employee, self.phone_line, self.admin)
+        DashboardDailyCounter.objects.filter(metric=Metric.DELIVERED).update(value=7)
+
+        output = StringIO()
+        call_command("rebuild_dashboard_counters", "--dry-run", stdout=output)
+        self.assertIn("contador=7 calculado=1", output.getvalue())
+        self.assertEqual(self._value("global", Metric.DELIVERED), 7)
+
+        call_command("rebuild_dashboard_counters", stdout=StringIO())
+        self.assertEqual(self._value("global", Metric.DELIVERED), 1)
+        self.assertEqual(
+            self._value(f"supervisor:{self.supervisor.email}", Metric.DELIVERED), 1
+        )
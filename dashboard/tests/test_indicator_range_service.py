@@ -0,0 +1,206 @@
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard import views as dashboard_views
+from dashboard.models import DashboardScopedDailySnapshot
+from dashboard.services.indicator_range_service import build_indicators_for_range
+from employees.models import Employee
+from pendencies.models import AllocationPendency
+from telecom.models import PhoneLine, SIMcard
+from users.models import SystemUser
+
+SUMMARY_KEYS = (
+    "pessoas_logadas",
+    "perc_sem_whats",
+    "b2b_sem_whats",
+    "b2c_sem_whats",
+    "numeros_disponiveis",
+    "numeros_entregues",
+    "reconectados",
+    "novos",
+    "total_descoberto_dia",
+)
+
+
+def _at(day, hour):
+    return timezone.make_aware(datetime.combine(day, time(hour, 0)))
+
+
+class IndicatorRangeFixtureMixin:
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.start_day = self.today - timedelta(days=4)
+        self.admin = SystemUser.objects.create_user(
+            email="range.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.supervisor = SystemUser.objects.create_user(
+            email="range.super@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+        )
+        self.scoped_employee = self._make_employee(
+            "Range Scoped", self.supervisor.email, "Natura", self.start_day
+        )
+        self.other_employee = self._make_employee(
+            "Range Other", "other.super@test.com", "Alimentos", self.start_day
+        )
+        self.late_employee = self._make_employee(
+            "Range Late", self.supervisor.email, "Alimentos", self.today
+        )
+
+        self.line_1 = self._make_line("+5511966660001", self.start_day)
+        self.line_2 = self._make_line("+5511966660002", self.start_day)
+        self.line_3 = self._make_line("+5511966660003", self.today - timedelta(days=2))
+
+        self._make_allocation(
+            self.scoped_employee,
+            self.line_1,
+            _at(self.start_day, 9),
+            _at(self.start_day, 10),
+        )
+        self._make_allocation(
+            self.scoped_employee, self.line_1, _at(self.today - timedelta(days=2), 9)
+        )
+        self._make_allocation(
+            self.other_employee, self.line_2, _at(self.today - timedelta(days=1), 11)
+        )
+
+        late_allocation = self._make_allocation(
+            self.late_employee, self.line_3, _at(self.today, 7)
+        )
+        pendency = AllocationPendency.objects.create(
+            employee=self.late_employee,
+            allocation=late_allocation,
+        )
+        AllocationPendency.objects.filter(pk=pendency.pk).update(
+            last_submitted_action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
+            resolved_at=_at(self.today, 8),
+        )
+
+    def _make_employee(self, name, supervisor_email, portfolio, created_day):
+        employee = Employee.objects.create(
+            full_name=name,
+            corporate_email=supervisor_email,
+            employee_id=portfolio,
+            teams="Joinville",
+            status=Employee.Status.ACTIVE,
+        )
+        Employee.all_objects.filter(pk=employee.pk).update(
+            created_at=_at(created_day, 7),
+            updated_at=_at(created_day, 7),
+        )
+        return employee
+
+    def _make_line(self, number, created_day):
+        sim_card = SIMcard.objects.create(
+            iccid=f"89000000{number[-8:]}",
+            carrier="CarrierRange",
+            status=SIMcard.Status.AVAILABLE,
+        )
+        line = PhoneLine.objects.create(
+            phone_number=number,
+            sim_card=sim_card,
+            status=PhoneLine.Status.AVAILABLE,
+        )
+        PhoneLine.all_objects.filter(pk=line.pk).update(
+            created_at=_at(created_day, 6),
+            updated_at=_at(created_day, 6),
+        )
+        return line
+
+    def _make_allocation(self, employee, phone_line, allocated_at, released_at=None):
+        allocation = LineAllocation.objects.create(
+            employee=employee,
+            phone_line=phone_line,
+            allocated_by=self.admin,
+            is_active=True,
+        )
+        update_kwargs = {"allocated_at": allocated_at}
+        if released_at:
+            update_kwargs.update(released_at=released_at, is_active=False)
+        LineAllocation.objects.filter(pk=allocation.pk).update(**update_kwargs)
+        return allocation
+
+
+class IndicatorRangeServiceTest(IndicatorRangeFixtureMixin, TestCase):
+    def _assert_matches_detail_path(self, user):
+        indicators = build_indicators_for_range(self.start_day, self.today, user=user)
+
+        self.assertEqual(len(indicators), 5)
+        for day, indicator in indicators.items():
+            detailed = dashboard_views.build_indicator_for_day(
+                day, include_users=True, user=user
+            )
+            for key in SUMMARY_KEYS:
+                self.assertEqual(indicator[key], detailed[key], f"{day} {key}")
+
+    def test_range_matches_per_day_detail_path_for_global_scope(self):
+        self._assert_matches_detail_path(self.admin)
+
+    def test_range_matches_per_day_detail_path_for_supervisor_scope(self):
+        self._assert_matches_detail_path(self.supervisor)
+
+    def test_range_counts_reconnections_and_deliveries_on_their_day(self):
+        indicators = build_indicators_for_range(self.start_day, self.today)
+
+        reconnect_day = indicators[self.today - timedelta(days=2)]
+        self.assertEqual(reconnect_day["numeros_entregues"], 1)
+        self.assertEqual(reconnect_day["reconectados"], 1)
+        self.assertEqual(reconnect_day["novos"], 1)
+        self.assertEqual(indicators[self.today]["reconectados"], 1)
+        self.assertEqual(indicators[self.start_day]["pessoas_logadas"], 2)
+        self.assertEqual(indicators[self.today]["pessoas_logadas"], 3)
+
+    def test_query_count_does_not_grow_with_range_length(self):
+        with CaptureQueriesContext(connection) as short_range:
+            build_indicators_for_range(self.today - timedelta(days=6), self.today)
+        with CaptureQueriesContext(connection) as long_range:
+            build_indicators_for_range(self.today - timedelta(days=29), self.today)
+
+        self.assertEqual(len(short_range), len(long_range))
+
+
+class ScopedDashboardSnapshotTest(IndicatorRangeFixtureMixin, TestCase):
+    def test_historical_scoped_indicators_are_materialized_per_scope(self):
+        yesterday = self.today - timedelta(days=1)
+        first = dashboard_views.get_dashboard_indicators_for_user_range(
+            self.start_day, yesterday, self.supervisor
+        )
+
+        self.assertEqual(
+            DashboardScopedDailySnapshot.objects.filter(
+                scope_key=f"supervisor:{self.supervisor.email}"
+            ).count(),
+            4,
+        )
+        with self.assertNumQueries(2):
+            second = dashboard_views.get_dashboard_indicators_for_user_range(
+                self.start_day, yesterday, self.supervisor
+            )
+        self.assertEqual(first, second)
+
+    def test_stale_scoped_snapshot_is_recomputed(self):
+        yesterday = self.today - timedelta(days=1)
+        dashboard_views.get_dashboard_indicators_for_user_range(
+            yesterday, yesterday, self.supervisor
+        )
+        DashboardScopedDailySnapshot.objects.update(
+            calculation_version=1, people_logged_in=99
+        )
+
+        (indicator,) = dashboard_views.get_dashboard_indicators_for_user_range(
+            yesterday, yesterday, self.supervisor
+        )
+
+        self.assertEqual(indicator["pessoas_logadas"], 1)
+        self.assertEqual(
+            DashboardScopedDailySnapshot.objects.get().calculation_version,
+            dashboard_views.CURRENT_DASHBOARD_SNAPSHOT_VERSION,
+        )
@@ -0,0 +1,134 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard.models import DailyUserAction
+from dashboard.services.reconnect_resolution_service import (
+    build_details,
+    count_rows_by_day,
+    get_admin_resolved_reconnect_rows,
+    get_pendency_resolved_reconnect_rows,
+)
+from employees.models import Employee
+from pendencies.models import AllocationPendency
+from telecom.models import PhoneLine, SIMcard
+from users.models import SystemUser
+
+
+class ReconnectResolutionServiceTest(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.admin = SystemUser.objects.create_user(
+            email="reconnect.resolution.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.sequence = 0
+
+    def _make_line(self):
+        self.sequence += 1
+        sim_card = SIMcard.objects.create(
+            iccid=f"89000000000055{self.sequence:05d}",
+            carrier="CarrierResolution",
+        )
+        return PhoneLine.objects.create(
+            phone_number=f"+55119555{self.sequence:05d}",
+            sim_card=sim_card,
+        )
+
+    def _make_employee_with_lines(self, lines=1):
+        self.sequence += 1
+        employee = Employee.objects.create(
+            full_name=f"Resolution User {self.sequence}",
+            corporate_email="resolution.super@test.com",
+            employee_id="Natura",
+        )
+        phone_lines = []
+        for _ in range(lines):
+            phone_line = self._make_line()
+            LineAllocation.objects.create(
+                employee=employee,
+                phone_line=phone_line,
+                allocated_by=self.admin,
+                is_active=True,
+            )
+            phone_lines.append(phone_line)
+        return employee, phone_lines
+
+    def _resolve_pendency_without_allocation(self, employee):
+        return AllocationPendency.objects.create(
+            employee=employee,
+            allocation=None,
+            last_submitted_action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
+            resolved_at=timezone.now(),
+        )
+
+    def test_pendency_without_allocation_uses_single_active_allocation(self):
+        employee, (phone_line,) = self._make_employee_with_lines()
+        self._resolve_pendency_without_allocation(employee)
+
+        rows = get_pendency_resolved_reconnect_rows(self.today, self.today)
+
+        self.assertEqual(
+            build_details(rows),
+            [
+                {
+                    "numero": phone_line.phone_number,
+                    "usuario": employee.full_name,
+                    "carteira": employee.employee_id,
+                }
+            ],
+        )
+        self.assertEqual(count_rows_by_day(rows), {self.today: 1})
+
+    def test_pendency_with_ambiguous_allocations_is_not_counted(self):
+        employee, _ = self._make_employee_with_lines(lines=2)
+        self._resolve_pendency_without_allocation(employee)
+
+        rows = get_pendency_resolved_reconnect_rows(self.today, self.today)
+
+        self.assertEqual(rows, [])
+
+    def test_pendency_with_deleted_line_is_not_counted(self):
+        employee, (phone_line,) = self._make_employee_with_lines()
+        pendency = self._resolve_pendency_without_allocation(employee)
+        PhoneLine.all_objects.filter(pk=phone_line.pk).update(
+            is_deleted=True,
+            updated_at=pendency.resolved_at,
+        )
+
+        rows = get_pendency_resolved_reconnect_rows(self.today, self.today)
+
+        self.assertEqual(rows, [])
+
+    def test_admin_action_without_allocation_uses_single_active_allocation(self):
+        employee, (phone_line,) = self._make_employee_with_lines()
+        DailyUserAction.objects.create(
+            day=self.today,
+            employee=employee,
+            action_type=DailyUserAction.ActionType.RECONNECT_WHATSAPP,
+            is_resolved=True,
+            updated_by=self.admin,
+        )
+
+        rows = get_admin_resolved_reconnect_rows(self.today, self.today)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["reconnected_number"], phone_line.phone_number)
+
+    def test_query_count_does_not_grow_with_resolved_rows(self):
+        employee, _ = self._make_employee_with_lines()
+        self._resolve_pendency_without_allocation(employee)
+        with CaptureQueriesContext(connection) as single_row:
+            get_pendency_resolved_reconnect_rows(self.today, self.today)
+
+        for _ in range(5):
+            employee, _ = self._make_employee_with_lines()
+            self._resolve_pendency_without_allocation(employee)
+        with CaptureQueriesContext(connection) as many_rows:
+            rows = get_pendency_resolved_reconnect_rows(self.today, self.today)
+
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len(single_row), len(many_rows))
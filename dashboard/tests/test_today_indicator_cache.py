@@ -0,0 +1,144 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from allocations.models import LineAllocation
+from dashboard import views as dashboard_views
+from dashboard.models import DashboardDailySnapshot
+from employees.models import Employee
+from telecom.models import PhoneLine, SIMcard
+from users.models import SystemUser
+
+
+class TodayIndicatorCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = SystemUser.objects.create_user(
+            email="today.cache.admin@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.supervisor = SystemUser.objects.create_user(
+            email="today.cache.super@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+        )
+        self.employee = Employee.objects.create(
+            full_name="Today Cache User",
+            corporate_email=self.supervisor.email,
+            employee_id="Natura",
+            teams="Joinville",
+            status=Employee.Status.ACTIVE,
+        )
+        sim_card = SIMcard.objects.create(
+            iccid="8900000000000077001",
+            carrier="CarrierCache",
+            status=SIMcard.Status.AVAILABLE,
+        )
+        self.phone_line = PhoneLine.objects.create(
+            phone_number="+5511977777001",
+            sim_card=sim_card,
+            status=PhoneLine.Status.AVAILABLE,
+        )
+
+    def test_live_poll_does_not_persist_today_snapshot(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse("daily_indicators_live"), {"period": 7})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            DashboardDailySnapshot.objects.filter(date=timezone.localdate()).exists()
+        )
+
+    def test_repeated_polls_reuse_cached_today_indicator(self):
+        today = timezone.localdate()
+        dashboard_views.get_dashboard_indicator_for_day(today)
+
+        with self.assertNumQueries(0):
+            indicator = dashboard_views.get_dashboard_indicator_for_day(today)
+
+        self.assertEqual(indicator["numeros_disponiveis"], 1)
+
+    def test_allocation_write_invalidates_cached_indicator(self):
+        today = timezone.localdate()
+        before = dashboard_views.get_dashboard_indicator_for_day(today)
+        self.assertEqual(before["numeros_entregues"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LineAllocation.objects.create(
+                employee=self.employee,
+                phone_line=self.phone_line,
+                allocated_by=self.admin,
+                is_active=True,
+            )
+
+        after = dashboard_views.get_dashboard_indicator_for_day(today)
+        self.assertEqual(after["numeros_entregues"], 1)
+
+    def test_write_keeps_cached_indicator_until_commit(self):
+        today = timezone.localdate()
+        dashboard_views.get_dashboard_indicator_for_day(today)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            LineAllocation.objects.create(
+                employee=self.employee,
+                phone_line=self.phone_line,
+                allocated_by=self.admin,
+                is_active=True,
+            )
+            pending = dashboard_views.get_dashboard_indicator_for_day(today)
+
+        self.assertEqual(pending["numeros_entregues"], 0)
+        self.assertTrue(callbacks)
+
+    def test_scoped_indicator_is_cached_per_scope(self):
+        today = timezone.localdate()
+        dashboard_views.get_dashboard_indicator_for_user_day(today, self.supervisor)
+
+        with self.assertNumQueries(0):
+            indicator = dashboard_views.get_dashboard_indicator_for_user_day(
+                today, self.supervisor
+            )
+
+        self.assertEqual(indicator["pessoas_logadas"], 1)
+        self.assertEqual(indicator["total_descoberto_dia"], 1)
+
+    def test_close_dashboard_day_command_persists_snapshot(self):
+        output = StringIO()
+
+        call_command("close_dashboard_day", stdout=output)
+
+        snapshot = DashboardDailySnapshot.objects.get(date=timezone.localdate())
+        self.assertEqual(snapshot.people_logged_in, 1)
+        self.assertEqual(snapshot.numbers_available, 1)
+        self.assertIn("Snapshot de", output.getvalue())
+
+    @override_settings(CONDITIONAL_GET_MAX_AGE=10**9)
+    def test_live_poll_returns_not_modified_until_source_tables_change(self):
+        self.client.force_login(self.admin)
+        url = reverse("daily_indicators_live")
+        first = self.client.get(url, {"period": 7})
+        etag = first["ETag"]
+
+        # Apenas sessao e usuario autenticado; nenhuma query de dados.
+        with self.assertNumQueries(2):
+            unchanged = self.client.get(url, {"period": 7}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(unchanged.status_code, 304)
+
+        other_period = self.client.get(url, {"period": 15}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(other_period.status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LineAllocation.objects.create(
+                employee=self.employee,
+                phone_line=self.phone_line,
+                allocated_by=self.admin,
+                is_active=True,
+            )
+        changed = self.client.get(url, {"period": 7}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
@@ -8,6 +8,7 @@ from .views import (
     daily_indicator_legacy_redirect,
     daily_indicators_live,
     daily_user_action_board,
+    daily_user_action_rows,
     pendency_metrics,
 )
 
@@ -23,6 +24,11 @@ urlpatterns = [
         daily_user_action_board,
         name="daily_user_action_board",
     ),
+    path(
+        "indicadores/acoes-dia/linhas/",
+        daily_user_action_rows,
+        name="daily_user_action_rows",
+    ),
     path("indicadores/live/", daily_indicators_live, name="daily_indicators_live"),
     path(
         "indicadores/snapshot/export/",
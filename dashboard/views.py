@@ -2,15 +2,19 @@ import hashlib
 import unicodedata
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta
+from functools import partial
 from urllib.parse import urlencode
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, F, Q
+from django.db.models import Case, Count, F, IntegerField, Q, When
 from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
 from django.views.generic import TemplateView
 
 from allocations.models import LineAllocation
@@ -20,9 +24,30 @@ from core.constants import (
     B2C_PORTFOLIO_NAMES,
     B2C_PORTFOLIOS,
 )
+from core.lookups import email_iexact
 from core.mixins import AuthenticadView, RoleRequiredMixin, roles_required
 from core.services.daily_indicator_service import DailyIndicatorService
+from core.services.latest_row_service import latest_per_key
+from core.services.number_search_service import normalize_number_search
+from core.services.version_stamp_service import build_etag
+from dashboard.services.action_board_service import (
+    ACTION_BOARD_EMPLOYEE_SORT_KEYS,
+    count_action_board_rows,
+    fetch_action_board_page,
+    paginate_action_board_rows,
+    prefilter_action_board_employees,
+)
 from dashboard.services.context_service import get_pending_action_counts_cached
+from dashboard.services.indicator_cache_service import (
+    get_dashboard_scope_key,
+    get_or_build_today_indicator,
+    get_today_indicator_generation,
+)
+from dashboard.services.indicator_range_service import (
+    build_indicators_for_range,
+    iter_days,
+    phone_line_visible_at_reference_q as _phone_line_visible_at_reference_q,
+)
 from dashboard.services.insight_service import build_dashboard_exception_cards
 from dashboard.services.metrics_service import build_pendency_metrics
 from dashboard.services.query_service import (
@@ -32,6 +57,13 @@ from dashboard.services.query_service import (
     get_supervised_employees_queryset as query_get_supervised_employees_queryset,
     uses_scoped_dashboard_metrics as query_uses_scoped_dashboard_metrics,
 )
+from dashboard.services.reconnect_resolution_service import (
+    build_details as build_reconnect_resolution_details,
+    count_rows_by_day as count_reconnect_resolution_rows_by_day,
+    get_admin_resolved_reconnect_actions_range_queryset,
+    get_admin_resolved_reconnect_rows,
+    get_pendency_resolved_reconnect_rows,
+)
 from employees.models import Employee, EmployeeHistory
 from telecom.models import PhoneLine, PhoneLineHistory, SIMcard
 from users.models import SystemUser
@@ -46,7 +78,12 @@ from .forms import (
 )
 from pendencies.models import AllocationPendency
 
-from .models import DashboardDailySnapshot, DailyIndicator, DailyUserAction
+from .models import (
+    DashboardDailySnapshot,
+    DashboardScopedDailySnapshot,
+    DailyIndicator,
+    DailyUserAction,
+)
 
 PERCENT_CRITICAL_THRESHOLD = 20
 PERCENT_WARNING_THRESHOLD = 10
@@ -106,7 +143,7 @@ def get_daily_indicators_queryset(user):
         supervisor_email = user.get_effective_supervisor_email()
         query = Q(created_by=user) | Q(updated_by=user)
         if supervisor_email:
-            query |= Q(supervisor__iexact=supervisor_email)
+            query |= Q(email_iexact("supervisor", supervisor_email))
         indicators = indicators.filter(query)
     elif user.role == SystemUser.Role.GERENTE:
         supervisor_emails = user.get_managed_supervisor_emails()
@@ -118,57 +155,56 @@ def get_daily_indicators_queryset(user):
     return indicators
 
 
-def get_latest_unresolved_actions_queryset(user):
-    employees_qs = get_supervised_employees_queryset(user).filter(
-        status=Employee.Status.ACTIVE,
-        is_deleted=False,
+def _annotate_visible_allocation_key(actions):
+    """
+    Chave de agrupamento das acoes: a alocacao, se a linha ainda estiver
+    visivel, ou None (acao no nivel do funcionario).
+    """
+    return actions.annotate(
+        visible_allocation_id=Case(
+            When(
+                allocation__phone_line__is_deleted=False,
+                allocation__phone_line__sim_card__is_deleted=False,
+                then=F("allocation_id"),
+            ),
+            default=None,
+            output_field=IntegerField(),
+        )
     )
-    employee_ids = employees_qs.values_list("id", flat=True)
-    actions = (
+
+
+def _latest_unresolved_actions(employee_ids):
+    actions = _annotate_visible_allocation_key(
         DailyUserAction.objects.filter(
             employee_id__in=employee_ids,
             is_resolved=False,
         )
-        .select_related("employee", "allocation__phone_line__sim_card")
-        .order_by("employee_id", "-day", "-id", "allocation_id")
+    )
+    return latest_per_key(
+        actions,
+        ("employee_id", "visible_allocation_id"),
+        ("-day", "-id"),
     )
 
-    latest_by_key = {}
-    for action in actions:
-        allocation_id = (
-            action.allocation_id
-            if action.allocation and allocation_is_currently_visible(action.allocation)
-            else None
-        )
-        key = (action.employee_id, allocation_id)
-        if key not in latest_by_key:
-            latest_by_key[key] = action
 
-    return list(latest_by_key.values())
+def get_latest_unresolved_actions_queryset(user):
+    employees_qs = get_supervised_employees_queryset(user).filter(
+        status=Employee.Status.ACTIVE,
+        is_deleted=False,
+    )
+    employee_ids = employees_qs.values_list("id", flat=True)
+    return list(_latest_unresolved_actions(employee_ids).select_related("employee"))
 
 
 def get_unresolved_action_maps(employee_ids):
-    all_actions = (
-        DailyUserAction.objects.filter(
-            employee_id__in=employee_ids,
-            is_resolved=False,
-        )
-        .select_related("employee", "allocation__phone_line__sim_card")
-        .order_by("employee_id", "-day", "-id", "allocation_id")
-    )
-
     actions_by_allocation = {}
     latest_action_by_employee = {}
-    for action in all_actions:
-        allocation_id = (
-            action.allocation_id
-            if action.allocation and allocation_is_currently_visible(action.allocation)
-            else None
+    for action in _latest_unresolved_actions(employee_ids):
+        actions_by_allocation[(action.employee_id, action.visible_allocation_id)] = (
+            action
         )
-        key = (action.employee_id, allocation_id)
-        if key not in actions_by_allocation:
-            actions_by_allocation[key] = action
-        if action.employee_id not in latest_action_by_employee:
+        latest = latest_action_by_employee.get(action.employee_id)
+        if latest is None or (action.day, action.id) > (latest.day, latest.id):
             latest_action_by_employee[action.employee_id] = action
 
     return actions_by_allocation, latest_action_by_employee
@@ -233,63 +269,34 @@ def get_scoped_phone_lines_queryset_for_dashboard(user):
     return query_get_scoped_phone_lines_queryset_for_dashboard(user)
 
 
-def get_latest_admin_status_history_by_phone_line(phone_line_ids):
-    if not phone_line_ids:
-        return {}
-
-    histories = (
-        PhoneLineHistory.objects.filter(
-            phone_line_id__in=phone_line_ids,
-            action=PhoneLineHistory.ActionType.STATUS_CHANGED,
-            changed_by__role=SystemUser.Role.ADMIN,
-        )
-        .select_related("changed_by")
-        .order_by("phone_line_id", "-changed_at", "-id")
-    )
-
-    latest_by_phone_line = {}
-    for history in histories:
-        if history.phone_line_id not in latest_by_phone_line:
-            latest_by_phone_line[history.phone_line_id] = history
-    return latest_by_phone_line
-
-
 def get_latest_status_history_by_phone_line(phone_line_ids):
     if not phone_line_ids:
         return {}
 
-    histories = (
+    histories = latest_per_key(
         PhoneLineHistory.objects.filter(
             phone_line_id__in=phone_line_ids,
             action=PhoneLineHistory.ActionType.STATUS_CHANGED,
-        )
-        .order_by("phone_line_id", "-changed_at", "-id")
+        ).only("id", "phone_line_id", "changed_at"),
+        ("phone_line_id",),
+        ("-changed_at", "-id"),
     )
-
-    latest_by_phone_line = {}
-    for history in histories:
-        if history.phone_line_id not in latest_by_phone_line:
-            latest_by_phone_line[history.phone_line_id] = history
-    return latest_by_phone_line
+    return {history.phone_line_id: history for history in histories}
 
 
 def get_latest_status_history_by_employee(employee_ids):
     if not employee_ids:
         return {}
 
-    histories = (
+    histories = latest_per_key(
         EmployeeHistory.objects.filter(
             employee_id__in=employee_ids,
             action=EmployeeHistory.ActionType.STATUS_CHANGED,
-        )
-        .order_by("employee_id", "-changed_at", "-id")
+        ).only("id", "employee_id", "changed_at"),
+        ("employee_id",),
+        ("-changed_at", "-id"),
     )
-
-    latest_by_employee = {}
-    for history in histories:
-        if history.employee_id not in latest_by_employee:
-            latest_by_employee[history.employee_id] = history
-    return latest_by_employee
+    return {history.employee_id: history for history in histories}
 
 
 def get_user_display_name(user):
@@ -370,9 +377,6 @@ def build_daily_user_action_rows(
         for allocation in allocations
         if allocation.phone_line_id
     ]
-    latest_admin_status_history_by_phone_line = get_latest_admin_status_history_by_phone_line(
-        visible_phone_line_ids
-    )
     latest_status_history_by_phone_line = get_latest_status_history_by_phone_line(
         visible_phone_line_ids
     )
@@ -478,7 +482,7 @@ def filter_daily_user_action_rows(
     technical_filter="",
 ):
     normalized_user_filter = user_filter.lower()
-    normalized_line_filter = line_filter.lower()
+    normalized_line_filter = normalize_number_search(line_filter).lower()
     normalized_technical_filter = technical_filter.lower()
 
     filtered_rows = []
@@ -581,22 +585,6 @@ def apply_daily_user_action_criticality(rows):
     return rows
 
 
-def count_daily_user_action_criticality(rows):
-    counts = {"high": 0, "medium": 0, "low": 0}
-    seen_employee_ids = set()
-
-    for row in rows:
-        employee_id = row["employee"].id
-        if employee_id in seen_employee_ids:
-            continue
-        seen_employee_ids.add(employee_id)
-        level = row.get("criticality_level")
-        if level in counts:
-            counts[level] += 1
-
-    return counts
-
-
 def sort_daily_user_action_rows(rows, sort_col, sort_order):
     """Ordena as linhas da tabela de ações do dia por coluna e direção.
 
@@ -687,69 +675,13 @@ def count_admin_resolved_reconnect_actions(user):
 
 
 def get_admin_resolved_reconnect_actions_queryset(day, employee_ids=None):
-    queryset = DailyUserAction.objects.filter(
-        day=day,
-        action_type=DailyUserAction.ActionType.RECONNECT_WHATSAPP,
-        is_resolved=True,
-        updated_by__role=SystemUser.Role.ADMIN,
-        updated_at__date=day,
-    ).select_related("employee", "allocation__phone_line__sim_card")
-
-    if employee_ids is not None:
-        queryset = queryset.filter(employee_id__in=employee_ids)
-
-    return queryset.order_by("-updated_at", "-id")
+    return get_admin_resolved_reconnect_actions_range_queryset(day, day, employee_ids)
 
 
 def build_admin_resolved_reconnect_numbers_for_day(day, employee_ids=None):
-    actions = list(get_admin_resolved_reconnect_actions_queryset(day, employee_ids))
-    details = []
-
-    for action in actions:
-        action_reference_time = action.updated_at or timezone.make_aware(
-            datetime.combine(day, time.min)
-        )
-        allocation = action.allocation
-        if not allocation:
-            active_allocations = list(
-                LineAllocation.objects.filter(
-                    employee=action.employee,
-                    allocated_at__lte=action_reference_time,
-                )
-                .filter(
-                    Q(released_at__isnull=True) | Q(released_at__gt=action_reference_time)
-                )
-                .select_related("phone_line__sim_card")
-                .order_by("-allocated_at")[:2]
-            )
-            active_allocations = [
-                item
-                for item in active_allocations
-                if phone_line_is_visible_for_day(
-                    item.phone_line, day, action_reference_time
-                )
-            ]
-            if len(active_allocations) == 1:
-                allocation = active_allocations[0]
-
-        if (
-            not allocation
-            or not allocation.phone_line
-            or not phone_line_is_visible_for_day(
-                allocation.phone_line, day, action_reference_time
-            )
-        ):
-            continue
-
-        details.append(
-            {
-                "numero": allocation.phone_line.phone_number,
-                "usuario": action.employee.full_name,
-                "carteira": action.employee.employee_id,
-            }
-        )
-
-    return details
+    return build_reconnect_resolution_details(
+        get_admin_resolved_reconnect_rows(day, day, employee_ids)
+    )
 
 
 def build_pendency_resolved_reconnect_numbers_for_day(day, employee_ids=None):
@@ -761,157 +693,37 @@ def build_pendency_resolved_reconnect_numbers_for_day(day, employee_ids=None):
     Substitui progressivamente build_admin_resolved_reconnect_numbers_for_day
     para pendências criadas após a introdução do AllocationPendency.
     """
-    from pendencies.models import AllocationPendency
-
-    qs = AllocationPendency.objects.filter(
-        resolved_at__date=day,
-        last_submitted_action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
-    ).select_related("employee", "allocation__phone_line__sim_card")
-
-    if employee_ids is not None:
-        qs = qs.filter(employee_id__in=employee_ids)
-
-    details = []
-    for pendency in qs:
-        allocation = pendency.allocation
-        reference_time = pendency.resolved_at or timezone.make_aware(
-            datetime.combine(day, time.min)
-        )
-
-        if not allocation or not allocation.phone_line:
-            # Fallback: busca a alocação ativa do funcionário no momento da resolução.
-            # Cobre casos onde allocation=None (funcionário sem linha cadastrada na
-            # pendência) ou onde a FK foi perdida.
-            active_allocations = list(
-                LineAllocation.objects.filter(
-                    employee=pendency.employee,
-                    allocated_at__lte=reference_time,
-                )
-                .filter(
-                    Q(released_at__isnull=True) | Q(released_at__gt=reference_time)
-                )
-                .select_related("phone_line__sim_card")
-                .order_by("-allocated_at")[:2]
-            )
-            active_allocations = [
-                item
-                for item in active_allocations
-                if item.phone_line
-                and phone_line_is_visible_for_day(
-                    item.phone_line, day, reference_time
-                )
-            ]
-            if len(active_allocations) == 1:
-                allocation = active_allocations[0]
-
-        if not allocation or not allocation.phone_line:
-            continue
-        if not phone_line_is_visible_for_day(
-            allocation.phone_line, day, allocation.allocated_at or reference_time
-        ):
-            continue
-        details.append(
-            {
-                "numero": allocation.phone_line.phone_number,
-                "usuario": pendency.employee.full_name,
-                "carteira": pendency.employee.employee_id,
-            }
-        )
-    return details
-
-
-def _phone_line_visible_at_reference_q(reference_field, prefix=""):
-    return (
-        Q(**{f"{prefix}is_deleted": False})
-        | Q(**{f"{prefix}updated_at__gt": F(reference_field)})
-    ) & (
-        Q(**{f"{prefix}sim_card__is_deleted": False})
-        | Q(**{f"{prefix}sim_card__updated_at__gt": F(reference_field)})
+    return build_reconnect_resolution_details(
+        get_pendency_resolved_reconnect_rows(day, day, employee_ids)
     )
 
 
-def _get_single_visible_allocation_for_employee_at(employee, day, reference_time):
-    active_allocations = list(
-        LineAllocation.objects.filter(
-            employee=employee,
-            allocated_at__lte=reference_time,
-        )
-        .filter(Q(released_at__isnull=True) | Q(released_at__gt=reference_time))
-        .select_related("phone_line__sim_card")
-        .order_by("-allocated_at")[:2]
+def count_admin_resolved_reconnect_numbers_by_day(
+    start_day, end_day, employee_ids=None
+):
+    return count_reconnect_resolution_rows_by_day(
+        get_admin_resolved_reconnect_rows(start_day, end_day, employee_ids)
     )
-    active_allocations = [
-        item
-        for item in active_allocations
-        if item.phone_line
-        and phone_line_is_visible_for_day(item.phone_line, day, reference_time)
-    ]
-    if len(active_allocations) == 1:
-        return active_allocations[0]
-    return None
 
 
 def count_admin_resolved_reconnect_numbers_for_day(day, employee_ids=None):
-    count = 0
-    actions = get_admin_resolved_reconnect_actions_queryset(day, employee_ids)
-    for action in actions:
-        reference_time = action.updated_at or timezone.make_aware(
-            datetime.combine(day, time.min)
-        )
-        allocation = action.allocation
-        if not allocation:
-            allocation = _get_single_visible_allocation_for_employee_at(
-                action.employee,
-                day,
-                reference_time,
-            )
-
-        if (
-            allocation
-            and allocation.phone_line
-            and phone_line_is_visible_for_day(
-                allocation.phone_line,
-                day,
-                reference_time,
-            )
-        ):
-            count += 1
-    return count
-
+    return count_admin_resolved_reconnect_numbers_by_day(
+        day, day, employee_ids
+    ).get(day, 0)
 
-def count_pendency_resolved_reconnect_numbers_for_day(day, employee_ids=None):
-    qs = AllocationPendency.objects.filter(
-        resolved_at__date=day,
-        last_submitted_action=AllocationPendency.ActionType.RECONNECT_WHATSAPP,
-    ).select_related("employee", "allocation__phone_line__sim_card")
 
-    if employee_ids is not None:
-        qs = qs.filter(employee_id__in=employee_ids)
+def count_pendency_resolved_reconnect_numbers_by_day(
+    start_day, end_day, employee_ids=None
+):
+    return count_reconnect_resolution_rows_by_day(
+        get_pendency_resolved_reconnect_rows(start_day, end_day, employee_ids)
+    )
 
-    count = 0
-    for pendency in qs:
-        reference_time = pendency.resolved_at or timezone.make_aware(
-            datetime.combine(day, time.min)
-        )
-        allocation = pendency.allocation
-        if not allocation or not allocation.phone_line:
-            allocation = _get_single_visible_allocation_for_employee_at(
-                pendency.employee,
-                day,
-                reference_time,
-            )
 
-        if (
-            allocation
-            and allocation.phone_line
-            and phone_line_is_visible_for_day(
-                allocation.phone_line,
-                day,
-                allocation.allocated_at or reference_time,
-            )
-        ):
-            count += 1
-    return count
+def count_pendency_resolved_reconnect_numbers_for_day(day, employee_ids=None):
+    return count_pendency_resolved_reconnect_numbers_by_day(
+        day, day, employee_ids
+    ).get(day, 0)
 
 
 def count_reconnected_numbers_for_day(day, employee_ids=None):
@@ -971,35 +783,6 @@ def build_reconnected_numbers_for_day(day, employee_ids=None):
     return reconnected_numbers
 
 
-def build_number_counts_for_day(
-    day: date, base_lines, allocated_line_ids, employee_ids=None
-) -> tuple[int, int, int, int]:
-    """Build number counts without materializing details for summary paths."""
-    start_of_day = timezone.make_aware(datetime.combine(day, time.min))
-    end_of_day = timezone.make_aware(datetime.combine(day, time.max))
-
-    available_count = base_lines.exclude(id__in=allocated_line_ids).count()
-
-    delivered_allocations = LineAllocation.objects.filter(
-        allocated_at__range=(start_of_day, end_of_day)
-    )
-    if employee_ids is not None:
-        delivered_allocations = delivered_allocations.filter(employee_id__in=employee_ids)
-    delivered_count = delivered_allocations.filter(
-        _phone_line_visible_at_reference_q("allocated_at", prefix="phone_line__")
-    ).count()
-
-    reconnected_count = count_reconnected_numbers_for_day(day, employee_ids)
-
-    new_count = (
-        PhoneLine.all_objects.filter(created_at__range=(start_of_day, end_of_day))
-        .filter(_phone_line_visible_at_reference_q("created_at"))
-        .count()
-    )
-
-    return available_count, delivered_count, reconnected_count, new_count
-
-
 def get_visible_phone_lines_for_day(day):
     queryset = PhoneLine.all_objects.filter(created_at__date__lte=day)
     if is_historical_day(day):
@@ -1185,6 +968,9 @@ def build_indicator_for_day(
     day: date, include_users: bool = False, user=None
 ) -> dict:
     """Calculate all indicators for a specific day from database state."""
+    if not include_users:
+        return build_indicators_for_range(day, day, user=user)[day]
+
     employees = get_scoped_visible_employees_for_day(day, user)
     # Para dias históricos não há rastreamento de status, então qualquer
     # employee que existia naquele dia é tratado como ativo — evita que
@@ -1232,46 +1018,25 @@ def build_indicator_for_day(
         elif normalized in B2C_PORTFOLIO_NAMES:
             b2c_sem_whats += 1
 
-    if include_users:
-        available_numbers, delivered_numbers, reconnected_numbers, new_numbers = (
-            build_number_details_for_day(
-                day,
-                base_lines,
-                allocated_line_ids,
-                scoped_employee_ids,
-            )
-        )
-        numeros_disponiveis = len(available_numbers)
-        numeros_entregues = len(delivered_numbers)
-        reconectados = len(reconnected_numbers)
-        novos = len(new_numbers)
-    else:
-        available_numbers = []
-        delivered_numbers = []
-        reconnected_numbers = []
-        new_numbers = []
-        (
-            numeros_disponiveis,
-            numeros_entregues,
-            reconectados,
-            novos,
-        ) = build_number_counts_for_day(
+    available_numbers, delivered_numbers, reconnected_numbers, new_numbers = (
+        build_number_details_for_day(
             day,
             base_lines,
             allocated_line_ids,
             scoped_employee_ids,
         )
+    )
 
     indicator = {
         "data": day,
-        "pessoas_logadas": active_employees.count(),
+        "pessoas_logadas": total_negociadores,
         "perc_sem_whats": perc_sem_whats,
         "b2b_sem_whats": b2b_sem_whats,
         "b2c_sem_whats": b2c_sem_whats,
-        "numeros_disponiveis": numeros_disponiveis,
-        "numeros_entregues": numeros_entregues,
-        "reconectados": reconectados,
-        "novos": novos,
+        "numeros_disponiveis": len(available_numbers),
+        "numeros_entregues": len(delivered_numbers),
+        "reconectados": len(reconnected_numbers),
+        "novos": len(new_numbers),
         "total_descoberto_dia": sem_whats,
         "available_numbers": available_numbers,
         "delivered_numbers": delivered_numbers,
@@ -1279,9 +1044,6 @@ def build_indicator_for_day(
         "new_numbers": new_numbers,
     }
 
-    if not include_users:
-        return indicator
-
     users, logged_users, users_with_line, users_without_line = (
         build_user_details_for_day(active_employees, active_allocations)
     )
@@ -1297,14 +1059,36 @@ def get_dashboard_indicator_for_user_day(day: date, user, include_users: bool =
     if include_users:
         return build_indicator_for_day(day, include_users=True, user=user)
 
+    return get_dashboard_indicators_for_user_range(day, day, user)[0]
+
+
+def get_dashboard_indicators_for_user_range(start_day: date, end_day: date, user):
+    indicators = get_dashboard_indicators_for_range(start_day, end_day)
     if not uses_scoped_dashboard_metrics(user):
-        return get_dashboard_indicator_for_day(day)
+        return indicators
 
-    indicator = get_dashboard_indicator_for_day(day)
-    scoped_indicator = build_indicator_for_day(day, user=user)
-    for key in SCOPED_DASHBOARD_METRIC_KEYS:
-        indicator[key] = scoped_indicator[key]
-    return indicator
+    today = timezone.localdate()
+    historical_end_day = min(end_day, today - timedelta(days=1))
+    scope_key = get_dashboard_scope_key(user)
+    scoped_indicators = {}
+    if start_day <= historical_end_day:
+        scoped_indicators.update(
+            get_historical_scoped_dashboard_indicators(
+                start_day, historical_end_day, user, scope_key
+            )
+        )
+    for day in iter_days(max(start_day, today), end_day):
+        scoped_indicators[day] = get_or_build_today_indicator(
+            day,
+            scope_key,
+            partial(build_indicator_for_day, day, user=user),
+        )
+
+    for indicator in indicators:
+        scoped_indicator = scoped_indicators[indicator["data"]]
+        for key in SCOPED_DASHBOARD_METRIC_KEYS:
+            indicator[key] = scoped_indicator[key]
+    return indicators
 
 
 def _serialize_snapshot_indicator(snapshot: DashboardDailySnapshot) -> dict:
@@ -1326,9 +1110,8 @@ def _serialize_snapshot_indicator(snapshot: DashboardDailySnapshot) -> dict:
     }
 
 
-def persist_dashboard_snapshot_for_day(day: date) -> dict:
-    indicator = build_indicator_for_day(day)
-    snapshot_defaults = {
+def _build_snapshot_defaults(indicator: dict) -> dict:
+    return {
         "people_logged_in": int(indicator["pessoas_logadas"]),
         "percentage_without_whatsapp": float(indicator["perc_sem_whats"]),
         "b2b_without_whatsapp": int(indicator["b2b_sem_whats"]),
@@ -1340,13 +1123,40 @@ def persist_dashboard_snapshot_for_day(day: date) -> dict:
         "total_uncovered_day": int(indicator["total_descoberto_dia"]),
         "calculation_version": CURRENT_DASHBOARD_SNAPSHOT_VERSION,
     }
+
+
+def persist_dashboard_snapshot_for_day(day: date) -> dict:
+    indicator = build_indicator_for_day(day)
     DashboardDailySnapshot.objects.update_or_create(
         date=day,
-        defaults=snapshot_defaults,
+        defaults=_build_snapshot_defaults(indicator),
     )
     return indicator
 
 
+def persist_dashboard_snapshots(indicators) -> list[DashboardDailySnapshot]:
+    """Grava (insert ou update) os snapshots de varios dias em um unico comando."""
+    snapshots = [
+        DashboardDailySnapshot(
+            date=indicator["data"],
+            **_build_snapshot_defaults(indicator),
+        )
+        for indicator in indicators
+    ]
+    if not snapshots:
+        return []
+    DashboardDailySnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=["date"],
+        update_fields=[
+            *_build_snapshot_defaults(indicators[0]).keys(),
+            "updated_at",
+        ],
+    )
+    return snapshots
+
+
 def get_or_create_dashboard_snapshot_for_day(day: date) -> DashboardDailySnapshot:
     if is_historical_day(day):
         snapshot = DashboardDailySnapshot.objects.filter(date=day).first()
@@ -1360,14 +1170,152 @@ def get_or_create_dashboard_snapshot_for_day(day: date) -> DashboardDailySnapsho
     return DashboardDailySnapshot.objects.get(date=day)
 
 
+def get_historical_dashboard_indicators(start_day: date, end_day: date) -> dict:
+    """
+    Le os snapshots historicos do intervalo em uma unica query.
+
+    Dias sem snapshot (ou com versao de calculo antiga) sao recalculados em
+    lote pelo motor de intervalo e gravados de uma vez.
+    """
+    snapshots = {
+        snapshot.date: snapshot
+        for snapshot in DashboardDailySnapshot.objects.filter(
+            date__range=(start_day, end_day)
+        )
+    }
+    stale_days = [
+        day
+        for day in iter_days(start_day, end_day)
+        if day not in snapshots
+        or snapshots[day].calculation_version < CURRENT_DASHBOARD_SNAPSHOT_VERSION
+    ]
+    if stale_days:
+        computed = build_indicators_for_range(stale_days[0], stale_days[-1])
+        for snapshot in persist_dashboard_snapshots(
+            [computed[day] for day in stale_days]
+        ):
+            snapshots[snapshot.date] = snapshot
+
+    return {
+        day: _serialize_snapshot_indicator(snapshot)
+        for day, snapshot in snapshots.items()
+    }
+
+
+def _serialize_scoped_snapshot_indicator(
+    snapshot: DashboardScopedDailySnapshot,
+) -> dict:
+    return {
+        "data": snapshot.date,
+        "pessoas_logadas": snapshot.people_logged_in,
+        "perc_sem_whats": snapshot.percentage_without_whatsapp,
+        "b2b_sem_whats": snapshot.b2b_without_whatsapp,
+        "b2c_sem_whats": snapshot.b2c_without_whatsapp,
+        "numeros_entregues": snapshot.numbers_delivered,
+        "reconectados": snapshot.numbers_reconnected,
+        "total_descoberto_dia": snapshot.total_uncovered_day,
+    }
+
+
+def _build_scoped_snapshot_defaults(indicator: dict) -> dict:
+    return {
+        "people_logged_in": int(indicator["pessoas_logadas"]),
+        "percentage_without_whatsapp": float(indicator["perc_sem_whats"]),
+        "b2b_without_whatsapp": int(indicator["b2b_sem_whats"]),
+        "b2c_without_whatsapp": int(indicator["b2c_sem_whats"]),
+        "numbers_delivered": int(indicator["numeros_entregues"]),
+        "numbers_reconnected": int(indicator["reconectados"]),
+        "total_uncovered_day": int(indicator["total_descoberto_dia"]),
+        "calculation_version": CURRENT_DASHBOARD_SNAPSHOT_VERSION,
+    }
+
+
+def persist_scoped_dashboard_snapshots(
+    scope_key: str, indicators
+) -> list[DashboardScopedDailySnapshot]:
+    snapshots = [
+        DashboardScopedDailySnapshot(
+            scope_key=scope_key,
+            date=indicator["data"],
+            **_build_scoped_snapshot_defaults(indicator),
+        )
+        for indicator in indicators
+    ]
+    if not snapshots:
+        return []
+    DashboardScopedDailySnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=["scope_key", "date"],
+        update_fields=[
+            *_build_scoped_snapshot_defaults(indicators[0]).keys(),
+            "updated_at",
+        ],
+    )
+    return snapshots
+
+
+def get_historical_scoped_dashboard_indicators(
+    start_day: date, end_day: date, user, scope_key: str | None = None
+) -> dict:
+    """
+    Metricas de escopo dos dias historicos, lidas dos snapshots por escopo.
+
+    Dias ausentes ou com versao antiga sao calculados em lote para o escopo do
+    usuario e gravados na primeira leitura.
+    """
+    scope_key = scope_key or get_dashboard_scope_key(user)
+    snapshots = {
+        snapshot.date: snapshot
+        for snapshot in DashboardScopedDailySnapshot.objects.filter(
+            scope_key=scope_key,
+            date__range=(start_day, end_day),
+        )
+    }
+    stale_days = [
+        day
+        for day in iter_days(start_day, end_day)
+        if day not in snapshots
+        or snapshots[day].calculation_version < CURRENT_DASHBOARD_SNAPSHOT_VERSION
+    ]
+    if stale_days:
+        computed = build_indicators_for_range(stale_days[0], stale_days[-1], user=user)
+        for snapshot in persist_scoped_dashboard_snapshots(
+            scope_key, [computed[day] for day in stale_days]
+        ):
+            snapshots[snapshot.date] = snapshot
+
+    return {
+        day: _serialize_scoped_snapshot_indicator(snapshot)
+        for day, snapshot in snapshots.items()
+    }
+
+
 def get_dashboard_indicator_for_day(day: date) -> dict:
     if is_historical_day(day):
         snapshot = get_or_create_dashboard_snapshot_for_day(day)
         return _serialize_snapshot_indicator(snapshot)
 
-    persist_dashboard_snapshot_for_day(day)
-    snapshot = DashboardDailySnapshot.objects.get(date=day)
-    return _serialize_snapshot_indicator(snapshot)
+    # O dia corrente e somente leitura: o snapshot e gravado no fechamento do
+    # dia (comando close_dashboard_day), nao a cada poll do dashboard.
+    return get_or_build_today_indicator(
+        day,
+        get_dashboard_scope_key(),
+        lambda: build_indicator_for_day(day),
+    )
+
+
+def get_dashboard_indicators_for_range(start_day: date, end_day: date) -> list[dict]:
+    today = timezone.localdate()
+    historical_end_day = min(end_day, today - timedelta(days=1))
+    indicators = {}
+    if start_day <= historical_end_day:
+        indicators.update(
+            get_historical_dashboard_indicators(start_day, historical_end_day)
+        )
+    for day in iter_days(max(start_day, today), end_day):
+        indicators[day] = get_dashboard_indicator_for_day(day)
+    return [indicators[day] for day in iter_days(start_day, end_day)]
 
 
 def serialize_daily_indicator(item):
@@ -1392,10 +1340,9 @@ def serialize_daily_indicator(item):
 
 def get_daily_indicators_payload(days, user):
     today = timezone.localdate()
-    daily = []
-    for offset in range(days - 1, -1, -1):
-        day = today - timedelta(days=offset)
-        daily.append(get_dashboard_indicator_for_user_day(day, user))
+    daily = get_dashboard_indicators_for_user_range(
+        today - timedelta(days=days - 1), today, user
+    )
     rows = [serialize_daily_indicator(item) for item in daily]
     base = "|".join(
         [",".join(str(row[key]) for key in sorted(row.keys())) for row in rows]
@@ -1569,16 +1516,9 @@ class DashboardView(AuthenticadView, TemplateView):
 
     def _build_daily_indicators(self, days: int):
         today = timezone.localdate()
-        indicators = []
-
-        for offset in range(days - 1, -1, -1):
-            day = today - timedelta(days=offset)
-            indicators.append(self._build_indicator_for_day(day))
-
-        return indicators
-
-    def _build_indicator_for_day(self, day):
-        return get_dashboard_indicator_for_user_day(day, self.request.user)
+        return get_dashboard_indicators_for_user_range(
+            today - timedelta(days=days - 1), today, self.request.user
+        )
 
     def _build_status_counts_legacy(self):
         sim_counts = defaultdict(int)
@@ -1900,20 +1840,109 @@ def daily_indicator_edit(request, pk):
     return render(request, "dashboard/daily_indicator_form.html", context)
 
 
-@login_required
-@roles_required(*DASHBOARD_ALLOWED_ROLES)
-def daily_user_action_board(request):  # noqa: PLR0912, PLR0915
-    supervisor_filter = (request.GET.get("supervisor") or "").strip()
-    user_filter = (request.GET.get("user") or "").strip()
-    line_filter = (request.GET.get("line") or "").strip()
+def get_daily_user_action_filters(request):
     is_admin_role = request.user.role == SystemUser.Role.ADMIN
-    technical_filter = (
-        (request.GET.get("technical") or "").strip() if is_admin_role else ""
-    )
-    sort_col = (request.GET.get("sort") or "").strip() if is_admin_role else ""
     sort_order = (request.GET.get("order") or "asc").strip().lower()
     if sort_order not in ("asc", "desc"):
         sort_order = "asc"
+    return {
+        "supervisor": (request.GET.get("supervisor") or "").strip(),
+        "user": (request.GET.get("user") or "").strip(),
+        "line": (request.GET.get("line") or "").strip(),
+        "technical": (
+            (request.GET.get("technical") or "").strip() if is_admin_role else ""
+        ),
+        "sort": (request.GET.get("sort") or "").strip() if is_admin_role else "",
+        "order": sort_order,
+    }
+
+
+def get_daily_user_action_board_employees(user, filters):
+    """Funcionarios da tabela de Acoes do Dia, pre-filtrados e em ordem de keyset."""
+    return prefilter_action_board_employees(
+        get_supervised_employees_queryset(user, filters["supervisor"]),
+        user_filter=filters["user"],
+        line_filter=filters["line"],
+        technical_filter=filters["technical"],
+    )
+
+
+def build_filtered_daily_user_action_rows(employees, user, filters):
+    rows = build_daily_user_action_rows(employees, user)
+    return filter_daily_user_action_rows(
+        rows,
+        user_filter=filters["user"],
+        line_filter=filters["line"],
+        technical_filter=filters["technical"],
+    )
+
+
+def build_daily_user_action_board_rows(user, filters):
+    """Todas as linhas filtradas e ordenadas da tabela de Acoes do Dia."""
+    rows = build_filtered_daily_user_action_rows(
+        get_daily_user_action_board_employees(user, filters), user, filters
+    )
+    if user.role == SystemUser.Role.ADMIN and filters["sort"]:
+        rows = sort_daily_user_action_rows(rows, filters["sort"], filters["order"])
+    return rows
+
+
+def sorts_daily_user_action_rows_in_python(filters):
+    """
+    Colunas que ordenam linhas de alocacao (linha, status, acao, responsavel
+    tecnico, envio da pendencia) ainda exigem todas as linhas montadas.
+    """
+    return (
+        filters["sort"] in _SORT_COLUMN_KEYS
+        and filters["sort"] not in ACTION_BOARD_EMPLOYEE_SORT_KEYS
+    )
+
+
+def fetch_daily_user_action_page(user, filters, cursor=""):
+    """Retorna (linhas da pagina, cursor da proxima pagina, has_more)."""
+    if sorts_daily_user_action_rows_in_python(filters):
+        rows = build_daily_user_action_board_rows(user, filters)
+        return paginate_action_board_rows(rows, cursor=cursor)
+    return fetch_action_board_page(
+        get_daily_user_action_board_employees(user, filters),
+        partial(build_filtered_daily_user_action_rows, user=user, filters=filters),
+        cursor=cursor,
+        sort=(filters["sort"], filters["order"]),
+    )
+
+
+def count_daily_user_action_board_rows(user, filters):
+    """Retorna (total de linhas, contadores de acao, contadores de criticidade)."""
+    return count_action_board_rows(
+        get_daily_user_action_board_employees(user, filters),
+        line_filter=filters["line"],
+        technical_filter=filters["technical"],
+        hide_active_without_action=user.role == SystemUser.Role.ADMIN,
+    )
+
+
+def get_employee_ids_with_unread_notifications(user):
+    from pendencies.models import PendencyObservationNotification
+
+    return set(
+        PendencyObservationNotification.objects.filter(
+            recipient=user,
+            is_read=False,
+        ).values_list("pendency__employee_id", flat=True)
+    )
+
+
+@login_required
+@roles_required(*DASHBOARD_ALLOWED_ROLES)
+def daily_user_action_board(request):  # noqa: PLR0912, PLR0915
+    filters = get_daily_user_action_filters(request)
+    supervisor_filter = filters["supervisor"]
+    user_filter = filters["user"]
+    line_filter = filters["line"]
+    is_admin_role = request.user.role == SystemUser.Role.ADMIN
+    technical_filter = filters["technical"]
+    sort_col = filters["sort"]
+    sort_order = filters["order"]
     employees_qs = get_supervised_employees_queryset(request.user, supervisor_filter)
 
     if request.method == "POST":
@@ -2131,35 +2160,19 @@ def daily_user_action_board(request):  # noqa: PLR0912, PLR0915
             redirect_url = f"{redirect_url}?{urlencode(query)}"
         return redirect(redirect_url)
 
-    rows = build_daily_user_action_rows(
-        employees_qs,
-        request.user,
-        include_forms=True,
-        form_day=timezone.localdate(),
-    )
-    rows = filter_daily_user_action_rows(
-        rows,
-        user_filter=user_filter,
-        line_filter=line_filter,
-        technical_filter=technical_filter,
+    page_rows, next_cursor, has_more_rows = fetch_daily_user_action_page(
+        request.user, filters
     )
-    if is_admin_role and sort_col:
-        rows = sort_daily_user_action_rows(rows, sort_col, sort_order)
-    action_counts = count_visible_pending_actions(rows)
-    criticality_counts = count_daily_user_action_criticality(rows)
-
-    from pendencies.models import PendencyObservationNotification
-
-    employee_ids_with_notifications = set(
-        PendencyObservationNotification.objects.filter(
-            recipient=request.user,
-            is_read=False,
-        ).values_list("pendency__employee_id", flat=True)
+    total_rows, action_counts, criticality_counts = (
+        count_daily_user_action_board_rows(request.user, filters)
     )
 
     context = {
         "title": "Ações do Dia",
-        "rows": rows,
+        "rows": page_rows,
+        "total_rows": total_rows,
+        "has_more_rows": has_more_rows,
+        "next_cursor": next_cursor,
         "action_counts": action_counts,
         "criticality_counts": criticality_counts,
         "supervisor_filter": supervisor_filter,
@@ -2168,7 +2181,9 @@ def daily_user_action_board(request):  # noqa: PLR0912, PLR0915
         "technical_filter": technical_filter,
         "sort_col": sort_col,
         "sort_order": sort_order,
-        "employee_ids_with_notifications": employee_ids_with_notifications,
+        "employee_ids_with_notifications": (
+            get_employee_ids_with_unread_notifications(request.user)
+        ),
         "sort_columns": [
             ("criticidade", "Criticidade"),
             ("pa", "PA"),
@@ -2189,10 +2204,64 @@ def daily_user_action_board(request):  # noqa: PLR0912, PLR0915
 
 @login_required
 @roles_required(*DASHBOARD_ALLOWED_ROLES)
+def daily_user_action_rows(request):
+    """
+    Proxima pagina da tabela de Acoes do Dia (HTML das linhas em JSON).
+
+    Fora das colunas ordenadas por linha de alocacao, a pagina vem por
+    keyset e so os funcionarios dela tem linhas montadas; totais e
+    contadores ficam na primeira renderizacao.
+    """
+    filters = get_daily_user_action_filters(request)
+    cursor = (request.GET.get("cursor") or "").strip()
+    page_rows, next_cursor, has_more = fetch_daily_user_action_page(
+        request.user, filters, cursor=cursor
+    )
+    html = render_to_string(
+        "dashboard/daily_user_action_rows.html",
+        {
+            "rows": page_rows,
+            "is_admin_role": request.user.role == SystemUser.Role.ADMIN,
+            "employee_ids_with_notifications": (
+                get_employee_ids_with_unread_notifications(request.user)
+            ),
+        },
+        request=request,
+    )
+    return JsonResponse(
+        {
+            "html": html,
+            "count": len(page_rows),
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def daily_indicators_live_etag(request):
+    """
+    ETag do poll de indicadores, calculado sem montar as linhas.
+
+    Dias historicos vem de snapshots imutaveis; o dia corrente muda apenas
+    quando a geracao do cache de indicadores e incrementada.
+    """
+    period = resolve_trend_period(request.GET.get("period", DEFAULT_TREND_PERIOD))
+    return build_etag(
+        "daily-indicators",
+        get_today_indicator_generation(),
+        timezone.localdate().isoformat(),
+        period,
+        get_dashboard_scope_key(request.user),
+    )
+
+
+@login_required
+@roles_required(*DASHBOARD_ALLOWED_ROLES)
+@condition(etag_func=daily_indicators_live_etag)
 def daily_indicators_live(request):
     period = resolve_trend_period(request.GET.get("period", DEFAULT_TREND_PERIOD))
     rows, fingerprint = get_daily_indicators_payload(days=period, user=request.user)
-    return JsonResponse(
+    response = JsonResponse(
         {
             "period": period,
             "rows": rows,
@@ -2200,6 +2269,8 @@ def daily_indicators_live(request):
             "generated_at": timezone.now().isoformat(),
         }
     )
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 @login_required
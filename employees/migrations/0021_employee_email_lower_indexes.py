@@ -0,0 +1,22 @@
+# Generated by Django 5.2.11 on 2026-10-17 15:24
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0020_rename_heineki_portfolio'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(django.db.models.functions.text.Lower('corporate_email'), name='employees_corp_email_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(django.db.models.functions.text.Lower('manager_email'), name='employees_mgr_email_lower_idx'),
+        ),
+    ]
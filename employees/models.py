@@ -4,6 +4,8 @@ from django.db.models import Q
 from django.db.models.functions import Lower
 from django.utils import timezone
 
+from core.change_tracking import ChangeTrackingMixin
+from core.lookups import email_iexact
 from core.normalization import (
     collapse_whitespace,
     normalize_email_address,
@@ -24,9 +26,20 @@ class EmployeeManager(models.Manager):
         return EmployeeQuerySet(self.model, using=self._db).filter(is_deleted=False)
 
 
-class Employee(models.Model):
+class Employee(ChangeTrackingMixin, models.Model):
     objects = EmployeeManager()
     all_objects = models.Manager()
+    tracked_fields = (
+        "is_deleted",
+        "status",
+        "full_name",
+        "email",
+        "corporate_email",
+        "manager_email",
+        "employee_id",
+        "pa",
+        "teams",
+    )
 
     class Status(models.TextChoices):
         ACTIVE = "active", "Ativo"
@@ -116,8 +129,8 @@ class Employee(models.Model):
             return False
 
         queryset = cls.all_objects.filter(
+            email_iexact("email", normalized_email),
             is_deleted=False,
-            email__iexact=normalized_email,
         )
         if exclude_id is not None:
             queryset = queryset.exclude(pk=exclude_id)
@@ -163,6 +176,12 @@ class Employee(models.Model):
             models.Index(fields=["email"]),
             models.Index(fields=["corporate_email"]),
             models.Index(fields=["manager_email"]),
+            models.Index(
+                Lower("corporate_email"), name="employees_corp_email_lower_idx"
+            ),
+            models.Index(
+                Lower("manager_email"), name="employees_mgr_email_lower_idx"
+            ),
             models.Index(fields=["status", "is_deleted"]),
         ]
 
@@ -1,7 +1,15 @@
-from django.db.models.signals import post_save, pre_save
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from core.current_user import get_current_user
+from core.services.role_scope_service import ROLE_SCOPE_VERSION_NAMESPACE
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    bump_version_stamp,
+)
 
 from .models import Employee, EmployeeHistory
 
@@ -37,35 +45,32 @@ def track_employee_changes(sender, instance, **kwargs):
     if not instance.pk:
         return
 
-    try:
-        old_instance = Employee.all_objects.get(pk=instance.pk)
-    except Employee.DoesNotExist:
+    previous = instance.get_previous_values()
+    if previous is None:
         return
 
     changed_by = _safe_current_user()
+    old_status_display = instance.get_previous_display("status", previous["status"])
 
-    if not old_instance.is_deleted and instance.is_deleted:
+    if not previous["is_deleted"] and instance.is_deleted:
         EmployeeHistory.objects.create(
             employee=instance,
             action=EmployeeHistory.ActionType.DELETED,
-            old_value=(
-                f"Nome: {old_instance.full_name}, "
-                f"Status: {old_instance.get_status_display()}"
-            ),
+            old_value=f"Nome: {previous['full_name']}, Status: {old_status_display}",
             changed_by=changed_by,
-            description=f"Usuario {old_instance.full_name} desativado",
+            description=f"Usuario {previous['full_name']} desativado",
         )
         return
 
-    if old_instance.status != instance.status:
+    if previous["status"] != instance.status:
         EmployeeHistory.objects.create(
             employee=instance,
             action=EmployeeHistory.ActionType.STATUS_CHANGED,
-            old_value=old_instance.get_status_display(),
+            old_value=old_status_display,
             new_value=instance.get_status_display(),
             changed_by=changed_by,
             description=(
-                f"Status alterado de {old_instance.get_status_display()} "
+                f"Status alterado de {old_status_display} "
                 f"para {instance.get_status_display()}"
             ),
         )
@@ -82,7 +87,7 @@ def track_employee_changes(sender, instance, **kwargs):
         "teams": "Equipe",
     }
     for field in field_labels:
-        old_value = getattr(old_instance, field)
+        old_value = previous[field]
         new_value = getattr(instance, field)
         if old_value != new_value:
             label = field_labels[field]
@@ -98,3 +103,17 @@ def track_employee_changes(sender, instance, **kwargs):
             changed_by=changed_by,
             description="Dados do usuario atualizados",
         )
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def bump_inventory_version(sender, **kwargs):
+    """Invalida os ETags das listagens de inventario apos o commit."""
+    transaction.on_commit(partial(bump_version_stamp, INVENTORY_VERSION_NAMESPACE))
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def bump_role_scope_version(sender, **kwargs):
+    """Invalida os escopos em cache apos o commit (supervisor/gerente mudaram)."""
+    transaction.on_commit(partial(bump_version_stamp, ROLE_SCOPE_VERSION_NAMESPACE))
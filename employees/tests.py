@@ -3,8 +3,9 @@ from unittest.mock import patch
 
 from django.apps import apps as django_apps
 from django.contrib import admin
-from django.db import IntegrityError
-from django.test import RequestFactory, TestCase
+from django.db import IntegrityError, connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from allocations.models import LineAllocation
@@ -234,6 +235,14 @@ class EmployeeListViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Aline Martins")
 
+    def test_admin_can_filter_by_formatted_line_digits(self) -> None:
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse("employees:employee_list"), {"line": "(11) 99999-9999"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Aline Martins")
+
     def test_employee_list_shows_line_column_with_linked_line(self) -> None:
         self.client.force_login(self.admin)
         response = self.client.get(reverse("employees:employee_list"))
@@ -268,6 +277,28 @@ class EmployeeListViewTest(TestCase):
         target = next(item for item in payload["data"] if item["id"] == self.employee.pk)
         self.assertEqual(target["email"], "aline.ajax@lineops.tech")
 
+    @override_settings(CONDITIONAL_GET_MAX_AGE=10**9)
+    def test_ajax_employee_list_returns_not_modified_until_employee_changes(
+        self,
+    ) -> None:
+        self.client.force_login(self.admin)
+        url = reverse("employees:employee_list")
+        headers = {"HTTP_X_REQUESTED_WITH": "XMLHttpRequest"}
+        first = self.client.get(url, {"offset": 0}, **headers)
+
+        unchanged = self.client.get(
+            url, {"offset": 0}, HTTP_IF_NONE_MATCH=first["ETag"], **headers
+        )
+        self.assertEqual(unchanged.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee.full_name = "Aline Martins Souza"
+            self.employee.save(update_fields=["full_name"])
+        changed = self.client.get(
+            url, {"offset": 0}, HTTP_IF_NONE_MATCH=first["ETag"], **headers
+        )
+        self.assertEqual(changed.status_code, 200)
+
     def test_ajax_employee_list_returns_empty_string_when_no_email(self) -> None:
         self.client.force_login(self.admin)
 
@@ -584,6 +615,27 @@ class EmployeeHistoryAuditTest(TestCase):
         self.assertFalse(allocation.is_active)
         self.assertEqual(line.status, PhoneLine.Status.AVAILABLE)
 
+    def test_update_history_uses_loaded_values_without_reloading(self) -> None:
+        employee = Employee.objects.get(pk=self.employee.pk)
+        employee.full_name = "Usuario Renomeado"
+        employee.pa = "PA-10"
+
+        with CaptureQueriesContext(connection) as queries:
+            employee.save(update_fields=["full_name", "pa"])
+
+        self.assertFalse(
+            any(
+                query["sql"].startswith("SELECT")
+                and "employees_employee" in query["sql"]
+                for query in queries.captured_queries
+            )
+        )
+        history = EmployeeHistory.objects.get(
+            employee=employee, action=EmployeeHistory.ActionType.UPDATED
+        )
+        self.assertEqual(history.old_value, "Nome: Usuario Historico, PA: None")
+        self.assertEqual(history.new_value, "Nome: Usuario Renomeado, PA: PA-10")
+
 
 class EmployeeFormPortfolioChoicesTest(TestCase):
     def test_form_sorts_supervisor_manager_and_portfolio_choices_alphabetically(
@@ -14,6 +14,13 @@ from core.integrity import (
 )
 from core.mixins import RoleRequiredMixin
 from core.services.allocation_service import AllocationService
+from core.services.number_search_service import number_search_q
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    build_request_etag,
+    get_not_modified_response,
+    set_conditional_headers,
+)
 from core.validation import parse_non_negative_int
 from users.models import SystemUser
 
@@ -38,6 +45,11 @@ class EmployeeListView(RoleRequiredMixin, ListView):
 
     def _handle_ajax_request(self, request):
         """Retorna dados em JSON para load more"""
+        etag = build_request_etag(request, INVENTORY_VERSION_NAMESPACE)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
         offset = parse_non_negative_int(request.GET.get("offset", 0), default=0)
         limit = max(
             parse_non_negative_int(request.GET.get("limit", self.paginate_by), 10), 1
@@ -67,8 +79,11 @@ class EmployeeListView(RoleRequiredMixin, ListView):
                 }
             )
 
-        return JsonResponse(
-            {"data": data, "has_more": has_more, "offset": offset + len(employees)}
+        return set_conditional_headers(
+            JsonResponse(
+                {"data": data, "has_more": has_more, "offset": offset + len(employees)}
+            ),
+            etag,
         )
 
     @staticmethod
@@ -98,11 +113,9 @@ class EmployeeListView(RoleRequiredMixin, ListView):
 
         if name:
             queryset = queryset.filter(full_name__icontains=name)
-        if line:
-            queryset = queryset.filter(
-                allocations__is_active=True,
-                allocations__phone_line__phone_number__icontains=line,
-            )
+        line_condition = number_search_q(line, "allocations__phone_line__phone_number")
+        if line_condition is not None:
+            queryset = queryset.filter(line_condition, allocations__is_active=True)
         if team:
             queryset = queryset.filter(teams__icontains=team)
         if teams:
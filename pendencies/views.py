@@ -2,6 +2,7 @@ import json
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -9,6 +10,12 @@ from django.views import View
 
 from allocations.models import LineAllocation
 from core.mixins import RoleRequiredMixin
+from dashboard.services.event_counter_service import (
+    record_pendency_reconnect_change,
+)
+from dashboard.services.reconnect_resolution_service import (
+    get_pendency_reconnect_day,
+)
 from employees.models import Employee
 from telecom.models import PhoneLineHistory
 from users.models import SystemUser
@@ -154,6 +161,20 @@ class PendencyDetailView(RoleRequiredMixin, View):
         return JsonResponse(_pendency_to_json(pendency, allocation))
 
 
+def _save_pendency(pendency, update_fields, previous_reconnect_day, updated_by):
+    """Salva a pendência e registra a mudança do dia de reconexão resolvida."""
+    pendency.updated_by = updated_by
+    update_fields = [*update_fields, "updated_by"]
+    with transaction.atomic():
+        pendency.save(update_fields=list(set(update_fields)))
+        if "action" in update_fields:
+            record_pendency_reconnect_change(
+                pendency,
+                previous_reconnect_day,
+                get_pendency_reconnect_day(pendency.pk),
+            )
+
+
 class PendencyUpdateView(RoleRequiredMixin, View):
     """POST: atualiza ação, observação e/ou status da linha."""
 
@@ -186,6 +207,7 @@ class PendencyUpdateView(RoleRequiredMixin, View):
         now = timezone.now()
         errors = []
         update_fields = []
+        previous_reconnect_day = None
 
         # --- Ação ---
         valid_actions = dict(AllocationPendency.ActionType.choices)
@@ -197,6 +219,7 @@ class PendencyUpdateView(RoleRequiredMixin, View):
             if not is_admin and new_action == AllocationPendency.ActionType.NO_ACTION:
                 errors.append("Somente admin pode definir ação como 'Sem Ação'.")
             else:
+                previous_reconnect_day = get_pendency_reconnect_day(pendency.pk)
                 pendency.record_action_change(
                     new_action, actor_role=request.user.role, now=now
                 )
@@ -267,9 +290,9 @@ class PendencyUpdateView(RoleRequiredMixin, View):
 
         # --- Salva pendência ---
         if update_fields:
-            pendency.updated_by = request.user
-            update_fields.append("updated_by")
-            pendency.save(update_fields=list(set(update_fields)))
+            _save_pendency(
+                pendency, update_fields, previous_reconnect_day, request.user
+            )
 
         # --- Notificação de observação ---
         notifications_sent = 0
@@ -107,7 +107,10 @@
 
         const syncDailyIndicators = () => {
             const url = `${dailyBody.dataset.liveUrl}?period=${encodeURIComponent(period)}`;
-            fetch(url, { headers: { "X-Requested-With": "XMLHttpRequest" } })
+            fetch(url, {
+                cache: "no-cache",
+                headers: { "X-Requested-With": "XMLHttpRequest" },
+            })
                 .then((response) => {
                     if (!response.ok) return null;
                     return response.json();
@@ -1,7 +1,8 @@
 from django import forms
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.db import transaction
 
+from core.exceptions.domain_exceptions import BusinessRuleException
 from core.normalization import normalize_carrier_name
 from core.validation import normalize_phone_number, validate_phone_number_format
 
@@ -78,6 +79,7 @@ class SIMcardAdmin(admin.ModelAdmin):
         "activated_at",
     )
     search_fields = ("iccid", "carrier", "phone_line__phone_number")
+    actions = ("reconnect_whatsapp_lines",)
     list_filter = (
         "status",
         "carrier",
@@ -111,15 +113,20 @@ class SIMcardAdmin(admin.ModelAdmin):
     def get_deleted_objects(self, objs, request):
         deleted_objects = []
         model_count = {}
+        active_line_numbers = dict(
+            PhoneLine.all_objects.filter(
+                sim_card__in=[sim_card.pk for sim_card in objs], is_deleted=False
+            ).values_list("sim_card_id", "phone_number")
+        )
 
         for sim_card in objs:
             deleted_objects.append(str(sim_card))
             model_count["simcards"] = model_count.get("simcards", 0) + 1
 
-            phone_line = PhoneLine.all_objects.filter(sim_card=sim_card).first()
-            if phone_line and not phone_line.is_deleted:
+            phone_number = active_line_numbers.get(sim_card.pk)
+            if phone_number:
                 deleted_objects.append(
-                    f"Linha vinculada (soft delete): {phone_line.phone_number}"
+                    f"Linha vinculada (soft delete): {phone_number}"
                 )
                 model_count["phone lines"] = model_count.get("phone lines", 0) + 1
 
@@ -160,14 +167,62 @@ class SIMcardAdmin(admin.ModelAdmin):
             canal=canal,
         )
 
+    @admin.action(description="Reconectar WhatsApp das linhas selecionadas")
+    def reconnect_whatsapp_lines(self, request, queryset):
+        from django.conf import settings
+
+        from telecom.services.reconnect_history_service import (
+            WhatsappReconnectHistoryService,
+        )
+        from telecom.services.reconnect_service import (
+            build_default_reconnect_service,
+        )
+
+        if not settings.RECONNECT_ENABLED:
+            self.message_user(
+                request,
+                "Reconexao via Mongo nao esta habilitada.",
+                level=messages.ERROR,
+            )
+            return
+
+        phone_lines = list(
+            PhoneLine.objects.filter(
+                sim_card__in=queryset,
+                is_deleted=False,
+                origem=PhoneLine.Origem.SRVMEMU_01,
+            ).order_by("pk")
+        )
+        try:
+            result = build_default_reconnect_service().start_for_lines(phone_lines)
+        except BusinessRuleException as exc:
+            self.message_user(request, str(exc), level=messages.ERROR)
+            return
+
+        WhatsappReconnectHistoryService.open_many(
+            entries=[
+                (phone_line, payload["session_id"])
+                for phone_line, payload in result["started"] + result["reused"]
+            ],
+            started_by=request.user,
+        )
+        ignored = queryset.count() - len(phone_lines) + len(result["skipped"])
+        self.message_user(
+            request,
+            f"{len(result['started'])} reconexao(oes) iniciada(s), "
+            f"{len(result['reused'])} ja em andamento, "
+            f"{ignored} linha(s) ignorada(s).",
+            level=messages.WARNING if ignored else messages.SUCCESS,
+        )
+
     @transaction.atomic
     def delete_model(self, request, obj):
         self._delete_with_related_phone_line(request, obj)
 
-    @transaction.atomic
     def delete_queryset(self, request, queryset):
-        for sim_card in queryset.select_related("phone_line"):
-            self._delete_with_related_phone_line(request, sim_card)
+        SIMcard.bulk_soft_delete(
+            queryset.values_list("pk", flat=True), released_by=request.user
+        )
 
 
 @admin.register(BlipConfiguration)
@@ -5,7 +5,8 @@ from django.core.management.base import BaseCommand, CommandError
 
 class Command(BaseCommand):
     help = (
-        "Cria o indice unico parcial em phone_number na collection reconnect_sessions. "
+        "Cria o indice unico parcial em phone_number e o indice parcial da fila "
+        "(target_server, created_at) na collection reconnect_sessions. "
         "Obrigatorio antes de habilitar RECONNECT_ENABLED=True em producao."
     )
 
@@ -31,17 +32,31 @@ class Command(BaseCommand):
                     f"Indice ja existe na collection: {collection_path}"
                 )
             )
-            return
+        else:
+            index_name = repo.collection.create_index(
+                [("phone_number", 1)],
+                unique=True,
+                partialFilterExpression={"active_lock": True},
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Indice criado com sucesso: {index_name}\n"
+                    f"Collection: {collection_path}"
+                )
+            )
 
-        index_name = repo.collection.create_index(
-            [("phone_number", 1)],
-            unique=True,
-            partialFilterExpression={"active_lock": True},
-        )
+        if repo.has_queued_sessions_index():
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Indice da fila ja existe na collection: {collection_path}"
+                )
+            )
+            return
 
+        queue_index_name = repo.create_queued_sessions_index()
         self.stdout.write(
             self.style.SUCCESS(
-                f"Indice criado com sucesso: {index_name}\n"
+                f"Indice da fila criado com sucesso: {queue_index_name}\n"
                 f"Collection: {collection_path}"
             )
         )
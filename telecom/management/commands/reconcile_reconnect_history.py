@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from telecom.services.reconnect_history_service import (
+    RECONCILE_CHUNK_SIZE,
+    WhatsappReconnectHistoryService,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fecha em lote as entradas abertas do historico de reconexao WhatsApp "
+        "conforme o status das sessoes no Mongo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=RECONCILE_CHUNK_SIZE,
+            help=(
+                "Entradas por lote; cada lote faz uma consulta ao Mongo "
+                f"(padrao: {RECONCILE_CHUNK_SIZE})."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+
+        if not getattr(settings, "RECONNECT_ENABLED", False):
+            raise CommandError(
+                "RECONNECT_ENABLED esta desabilitado. "
+                "Configure as variaveis de ambiente do Mongo antes de reconciliar."
+            )
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size deve ser maior que zero.")
+
+        from telecom.repositories.reconnect_sessions import (
+            MongoReconnectSessionRepository,
+        )
+
+        summary = WhatsappReconnectHistoryService.reconcile_open_entries(
+            repository=MongoReconnectSessionRepository.from_settings(),
+            chunk_size=chunk_size,
+        )
+
+        self.stdout.write(
+            f"Entradas abertas analisadas: {summary.scanned}\n"
+            f"Conectadas: {summary.connected}\n"
+            f"Falhas: {summary.failed}\n"
+            f"Canceladas: {summary.cancelled}\n"
+            f"Obsoletas (sem sessao no Mongo): {summary.stale}\n"
+            f"Ainda em andamento: {summary.still_open}\n"
+            f"Nao consultadas (erro no Mongo): {summary.errors}"
+        )
+        style = self.style.WARNING if summary.errors else self.style.SUCCESS
+        self.stdout.write(style(f"{summary.closed} entrada(s) fechada(s)."))
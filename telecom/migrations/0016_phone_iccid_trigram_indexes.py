@@ -0,0 +1,37 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TRIGRAM_INDEXES = (
+    ("telecom_phoneline_phone_trgm", "telecom_phoneline", "phone_number"),
+    ("telecom_simcard_iccid_trgm", "telecom_simcard", "iccid"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # GIN pg_trgm atende LIKE '%trecho%' (core.services.number_search_service);
+    # em outros bancos a busca segue sem indice.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} "
+            f"ON {table} USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("telecom", "0015_rename_telecom_wha_phone_l_started_idx_telecom_wha_phone_l_1edc23_idx_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
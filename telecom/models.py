@@ -2,10 +2,11 @@ from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
+from core.change_tracking import ChangeTrackingMixin
+from core.lookups import email_iexact
 from core.normalization import normalize_carrier_name
 
 
@@ -13,15 +14,12 @@ class SoftDeleteQuerySet(models.QuerySet):
     def active(self):
         return self.filter(is_deleted=False)
 
-    def delete(self):
-        deleted = 0
-        details = {self.model._meta.label: 0}
-        with transaction.atomic():
-            for instance in self:
-                instance.delete()
-                deleted += 1
-                details[self.model._meta.label] += 1
-        return deleted, details
+    def delete(self, released_by=None):
+        """Soft delete por conjunto, via bulk_soft_delete do model."""
+        deleted = self.model.bulk_soft_delete(
+            self.values_list("pk", flat=True), released_by=released_by
+        )
+        return deleted, {self.model._meta.label: deleted}
 
 
 class SoftDeleteManager(models.Manager):
@@ -63,6 +61,12 @@ class SIMcard(models.Model):
             Q(phone_line__isnull=True) | Q(phone_line__is_deleted=True)
         )
 
+    @classmethod
+    def bulk_soft_delete(cls, sim_card_ids, released_by=None):
+        from telecom.services.soft_delete_service import soft_delete_sim_cards
+
+        return soft_delete_sim_cards(sim_card_ids, released_by=released_by)
+
     def delete(self, using=None, keep_parents=False, released_by=None):
         phone_line = PhoneLine.all_objects.filter(sim_card=self).first()
         if phone_line and not phone_line.is_deleted:
@@ -86,9 +90,10 @@ class SIMcard(models.Model):
         ]
 
 
-class PhoneLine(models.Model):
+class PhoneLine(ChangeTrackingMixin, models.Model):
     objects = SoftDeleteManager()
     all_objects = models.Manager()
+    tracked_fields = ("status", "sim_card", "is_deleted")
 
     class Status(models.TextChoices):
         AVAILABLE = "AVAILABLE", "Disponível"
@@ -151,19 +156,16 @@ class PhoneLine(models.Model):
 
         if role in {"super", "backoffice", "gerente"}:
             allocation_model = apps.get_model("allocations", "LineAllocation")
-            employee_ids = user.scope_employee_queryset().values("pk")
-            queryset = queryset.filter(
-                pk__in=allocation_model.objects.filter(
-                    is_active=True,
-                    employee_id__in=employee_ids,
-                ).values("phone_line_id")
+            allocations = user.get_role_scope().filter_by_employee(
+                allocation_model.objects.filter(is_active=True)
             )
+            queryset = queryset.filter(pk__in=allocations.values("phone_line_id"))
         elif role == "operator":
             allocation_model = apps.get_model("allocations", "LineAllocation")
             queryset = queryset.filter(
                 pk__in=allocation_model.objects.filter(
+                    email_iexact("employee__email", user.email),
                     is_active=True,
-                    employee__email__iexact=user.email,
                     employee__is_deleted=False,
                 ).values("phone_line_id")
             )
@@ -222,6 +224,12 @@ class PhoneLine(models.Model):
             canal=canal,
         )
 
+    @classmethod
+    def bulk_soft_delete(cls, phone_line_ids, released_by=None):
+        from telecom.services.soft_delete_service import soft_delete_phone_lines
+
+        return soft_delete_phone_lines(phone_line_ids, released_by=released_by)
+
     def delete(self, using=None, keep_parents=False, released_by=None):
         if self.is_deleted:
             return
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+
+from telecom.exceptions import ActiveReconnectSessionConflict
+
+
+class SingleFlightTTLCache:
+    """
+    Cache em memoria do processo com expiracao curta e "single-flight".
+
+    Leituras concorrentes da mesma chave esperam a primeira busca em vez de
+    repetir a consulta; o resultado (inclusive None) vale por ttl segundos.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+        self._inflight: dict = {}
+
+    def get_or_load(self, key, loader):
+        if self.ttl <= 0:
+            return loader()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = {"event": threading.Event()}
+
+        if not leader:
+            flight["event"].wait()
+            if "error" in flight:
+                raise flight["error"]
+            return flight["value"]
+
+        try:
+            value = loader()
+        except Exception as exc:
+            flight["error"] = exc
+            raise
+        else:
+            flight["value"] = value
+            with self._lock:
+                # Uma invalidacao durante a busca descarta o resultado.
+                if self._inflight.get(key) is flight:
+                    self._entries[key] = (time.monotonic() + self.ttl, value)
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight["event"].set()
+        return value
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._inflight.pop(key, None)
+
+    def invalidate_matching(self, predicate):
+        """Remove as entradas para as quais predicate(chave, valor) e verdadeiro."""
+        with self._lock:
+            stale = [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(key, value)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._inflight.clear()
+
+
+def get_session_cache_ttl() -> float:
+    ttl_ms = getattr(
+        settings, "RECONNECT_SESSION_CACHE_TTL_MS", settings.RECONNECT_POLL_INTERVAL_MS
+    )
+    return max(ttl_ms, 0) / 1000
+
+
+@lru_cache(maxsize=1)
+def get_shared_session_cache() -> SingleFlightTTLCache:
+    return SingleFlightTTLCache(ttl=get_session_cache_ttl())
+
+
+class CachedReconnectSessionRepository:
+    """
+    Envolve o repositorio Mongo com o cache compartilhado do processo.
+
+    get_session e find_active_session_by_phone passam pelo cache; escritas
+    invalidam as entradas afetadas imediatamente. Os demais metodos sao
+    delegados sem alteracao.
+    """
+
+    def __init__(self, repository, *, cache: SingleFlightTTLCache | None = None):
+        self.repository = repository
+        self.cache = cache if cache is not None else get_shared_session_cache()
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    def get_session(self, session_id: str):
+        return self.cache.get_or_load(
+            ("session", session_id),
+            lambda: self.repository.get_session(session_id),
+        )
+
+    def find_active_session_by_phone(self, phone_number: str):
+        return self.cache.get_or_load(
+            ("active_by_phone", phone_number),
+            lambda: self.repository.find_active_session_by_phone(phone_number),
+        )
+
+    def get_queue_position(self, *, target_server: str, session_id: str):
+        """
+        Posicao (1-based) da sessao na fila do servidor, ou None se ausente.
+
+        A fila ordenada de cada target_server e lida uma vez por intervalo e
+        compartilhada por todas as sessoes e viewers daquele servidor.
+        """
+        if not hasattr(self.repository, "list_queued_session_ids"):
+            return None
+        snapshot = self.cache.get_or_load(
+            ("queue", target_server),
+            lambda: {
+                queued_id: position
+                for position, queued_id in enumerate(
+                    self.repository.list_queued_session_ids(target_server), start=1
+                )
+            },
+        )
+        return snapshot.get(session_id)
+
+    def create_session(self, document: dict):
+        phone_key = ("active_by_phone", document.get("phone_number"))
+        try:
+            created = self.repository.create_session(document)
+        except ActiveReconnectSessionConflict:
+            # Outro processo criou a sessao: a leitura seguinte precisa ir ao Mongo.
+            self.cache.invalidate(phone_key)
+            raise
+        self.cache.invalidate(
+            phone_key,
+            ("session", document.get("_id")),
+            ("queue", document.get("target_server")),
+        )
+        return created
+
+    def create_sessions(self, documents: list[dict]):
+        try:
+            return self.repository.create_sessions(documents)
+        finally:
+            keys = set()
+            for document in documents:
+                keys.update(
+                    (
+                        ("active_by_phone", document.get("phone_number")),
+                        ("session", document.get("_id")),
+                        ("queue", document.get("target_server")),
+                    )
+                )
+            self.cache.invalidate(*keys)
+
+    def submit_pair_code(self, *, session_id: str, **kwargs):
+        try:
+            return self.repository.submit_pair_code(session_id=session_id, **kwargs)
+        finally:
+            self._invalidate_session(session_id)
+
+    def cancel_session(self, *, session_id: str, **kwargs):
+        try:
+            return self.repository.cancel_session(session_id=session_id, **kwargs)
+        finally:
+            self._invalidate_session(session_id)
+
+    def _invalidate_session(self, session_id: str) -> None:
+        self.cache.invalidate(("session", session_id))
+        self.cache.invalidate_matching(
+            lambda key, value: key[0] == "queue"
+            or (isinstance(value, dict) and value.get("_id") == session_id)
+        )
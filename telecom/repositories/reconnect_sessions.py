@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import logging
 from functools import lru_cache
 
 from django.conf import settings
 
 from telecom.exceptions import ActiveReconnectSessionConflict
 
+logger = logging.getLogger(__name__)
+
+# Codigo de erro do MongoDB para violacao de indice unico.
+DUPLICATE_KEY_ERROR_CODE = 11000
+QUEUED_SESSIONS_INDEX_NAME = "queued_sessions_by_target_server"
+QUEUED_SESSIONS_INDEX_KEYS = [("target_server", 1), ("created_at", 1), ("_id", 1)]
+QUEUED_SESSIONS_FILTER = {"status": "QUEUED", "active_lock": True}
+
 
 @lru_cache(maxsize=4)
 def _build_mongo_client(uri: str):
@@ -36,6 +45,17 @@ class MongoReconnectSessionRepository:
             }
         )
 
+    def find_active_sessions_by_phones(self, phone_numbers) -> dict:
+        """Sessoes ativas por phone_number em uma unica consulta $in."""
+        cursor = self.collection.find(
+            {
+                "phone_number": {"$in": list(phone_numbers)},
+                "active_lock": True,
+                "status": {"$nin": ["CONNECTED", "FAILED", "CANCELLED"]},
+            }
+        )
+        return {document["phone_number"]: document for document in cursor}
+
     def find_recent_restricted_session_by_phone(self, phone_number: str):
         return self.collection.find_one(
             {
@@ -75,6 +95,49 @@ class MongoReconnectSessionRepository:
             raise ActiveReconnectSessionConflict from exc
         return self.collection.find_one({"_id": document["_id"]}) or document
 
+    def create_sessions(
+        self, documents: list[dict]
+    ) -> tuple[list[dict], list[str], list[str]]:
+        """
+        Insere varias sessoes com insert_many(ordered=False).
+
+        Retorna (documentos inseridos, phone_numbers em conflito com o indice
+        unico parcial, phone_numbers cuja gravacao falhou por outro motivo).
+        Com ordered=False os documentos sem erro ja foram gravados mesmo
+        quando outros falham, entao sempre voltam como inseridos.
+        """
+        from pymongo.errors import BulkWriteError
+
+        if not documents:
+            return [], [], []
+        try:
+            self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            errors_by_index = {
+                error["index"]: error for error in exc.details.get("writeErrors", [])
+            }
+            created = []
+            conflicted = []
+            failed = []
+            for index, document in enumerate(documents):
+                error = errors_by_index.get(index)
+                if error is None:
+                    created.append(document)
+                elif error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+                    conflicted.append(document["phone_number"])
+                else:
+                    logger.warning(
+                        "Reconnect session insert failed",
+                        extra={
+                            "phone_number": document["phone_number"],
+                            "code": error.get("code"),
+                            "error": error.get("errmsg", ""),
+                        },
+                    )
+                    failed.append(document["phone_number"])
+            return created, conflicted, failed
+        return list(documents), [], []
+
     def has_active_session_unique_index(self) -> bool:
         for index in self.collection.list_indexes():
             partial_filter = index.get("partialFilterExpression") or {}
@@ -102,10 +165,55 @@ class MongoReconnectSessionRepository:
             }
         )
 
+    def list_queued_session_ids(self, target_server: str) -> list[str]:
+        """_ids da fila do servidor em ordem de execucao (indice parcial da fila)."""
+        cursor = self.collection.find(
+            {"target_server": target_server, **QUEUED_SESSIONS_FILTER},
+            {"_id": 1},
+        ).sort([("created_at", 1), ("_id", 1)])
+        return [document["_id"] for document in cursor]
+
+    def has_queued_sessions_index(self) -> bool:
+        return any(
+            index.get("name") == QUEUED_SESSIONS_INDEX_NAME
+            for index in self.collection.list_indexes()
+        )
+
+    def create_queued_sessions_index(self) -> str:
+        return self.collection.create_index(
+            QUEUED_SESSIONS_INDEX_KEYS,
+            name=QUEUED_SESSIONS_INDEX_NAME,
+            partialFilterExpression=QUEUED_SESSIONS_FILTER,
+        )
+
     def get_session(self, session_id: str):
         return self.collection.find_one({"_id": session_id})
 
-    def submit_pair_code(self, *, session_id: str, attempt: int, pair_code: str, submitted_at):
+    def get_sessions_by_ids(self, session_ids) -> dict:
+        """Documentos por _id em uma unica consulta $in (ausentes ficam de fora)."""
+        cursor = self.collection.find(
+            {"_id": {"$in": list(session_ids)}},
+            {
+                "_id": 1,
+                "status": 1,
+                "attempt": 1,
+                "error_code": 1,
+                "error_message": 1,
+            },
+        )
+        return {document["_id"]: document for document in cursor}
+
+    def watch_session(self, session_id: str, max_await_time_ms: int = 1000):
+        """Change stream do documento; exige replica set (OperationFailure senao)."""
+        return self.collection.watch(
+            [{"$match": {"documentKey._id": session_id}}],
+            full_document="updateLookup",
+            max_await_time_ms=max_await_time_ms,
+        )
+
+    def submit_pair_code(
+        self, *, session_id: str, attempt: int, pair_code: str, submitted_at
+    ):
         result = self.collection.update_one(
             {
                 "_id": session_id,
@@ -0,0 +1,50 @@
+"""
+Contadores de inventario (linhas, SIMs, alocacoes) em cache por escopo.
+
+A chave inclui o carimbo de versao do namespace de inventario, incrementado
+pelos signals de PhoneLine, SIMcard, LineAllocation e Employee; qualquer
+escrita torna todas as chaves antigas inalcancaveis, sem varrer o cache. O
+TTL (INVENTORY_COUNTERS_CACHE_TTL) limita a defasagem de escritas que nao
+disparam signals, como queryset.update().
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    get_version_stamp,
+)
+from users.models import SystemUser
+
+INVENTORY_COUNTERS_PREFIX = "inventory-counters"
+GLOBAL_SCOPE_ROLES = frozenset({SystemUser.Role.ADMIN, SystemUser.Role.DEV})
+
+
+def get_inventory_counters_ttl():
+    return getattr(settings, "INVENTORY_COUNTERS_CACHE_TTL", 300)
+
+
+def get_inventory_scope_key(user):
+    """Admin e dev veem o inventario inteiro e compartilham o mesmo escopo."""
+    role = (getattr(user, "role", "") or "").lower()
+    if role in GLOBAL_SCOPE_ROLES:
+        return "all"
+    return f"{role}:{getattr(user, 'pk', '')}"
+
+
+def get_cached_inventory_counters(name, user, builder):
+    """Retorna os contadores `name` do escopo do usuario, calculando se preciso."""
+    key = ":".join(
+        (
+            INVENTORY_COUNTERS_PREFIX,
+            name,
+            str(get_version_stamp(INVENTORY_VERSION_NAMESPACE)),
+            get_inventory_scope_key(user),
+        )
+    )
+    counters = cache.get(key)
+    if counters is None:
+        counters = builder()
+        cache.set(key, counters, timeout=get_inventory_counters_ttl())
+    return counters
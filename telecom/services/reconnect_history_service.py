@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+import logging
+from dataclasses import dataclass
+
+from django.db.models import (
+    Case,
+    CharField,
+    F,
+    IntegerField,
+    TextField,
+    Value,
+    When,
+)
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
+RECONCILE_CHUNK_SIZE = 500
 _TERMINAL_STATUSES = frozenset({"CONNECTED", "FAILED", "CANCELLED"})
 _STATUS_ALIASES = {"SUCCESS": "CONNECTED", "SUCESS": "CONNECTED"}
 
@@ -11,6 +26,25 @@ def _normalize_mongo_status(raw) -> str:
     return _STATUS_ALIASES.get(normalized, normalized)
 
 
+@dataclass
+class ReconcileSummary:
+    scanned: int = 0
+    connected: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    stale: int = 0
+    still_open: int = 0
+    errors: int = 0
+
+    def increment(self, raw_status: str) -> None:
+        field_name = raw_status.lower()
+        setattr(self, field_name, getattr(self, field_name) + 1)
+
+    @property
+    def closed(self) -> int:
+        return self.connected + self.failed + self.cancelled + self.stale
+
+
 class WhatsappReconnectHistoryService:
     """Cria e fecha entradas de histórico de reconexão WhatsApp."""
 
@@ -28,6 +62,28 @@ class WhatsappReconnectHistoryService:
         )
         return entry
 
+    @staticmethod
+    def open_many(*, entries, started_by) -> None:
+        """
+        Registra o início de várias sessões com um único INSERT.
+
+        entries: pares (phone_line, session_id). Sessões já registradas são
+        ignoradas, como no get_or_create de open().
+        """
+        from telecom.models import WhatsappReconnectHistory
+
+        WhatsappReconnectHistory.objects.bulk_create(
+            [
+                WhatsappReconnectHistory(
+                    phone_line=phone_line,
+                    session_id=session_id,
+                    started_by=started_by,
+                )
+                for phone_line, session_id in entries
+            ],
+            ignore_conflicts=True,
+        )
+
     @staticmethod
     def close(
         *,
@@ -66,7 +122,7 @@ class WhatsappReconnectHistoryService:
         - Sessão Mongo não encontrada → fecha como CANCELLED com error_code='stale_session'.
         - Sessão Mongo ativa (não-terminal) → mantém como Em andamento.
 
-        Qualquer exceção de get_session é tratada como "não encontrada".
+        Qualquer exceção da consulta ao Mongo é tratada como "não encontrada".
         """
         from telecom.models import WhatsappReconnectHistory
 
@@ -74,43 +130,124 @@ class WhatsappReconnectHistoryService:
             WhatsappReconnectHistory.objects.filter(
                 phone_line=phone_line,
                 outcome__isnull=True,
-            )
+            ).values_list("pk", "session_id")
         )
         if not open_entries:
             return
 
-        outcome_map = {
-            "CONNECTED": WhatsappReconnectHistory.Outcome.CONNECTED,
-            "FAILED": WhatsappReconnectHistory.Outcome.FAILED,
-            "CANCELLED": WhatsappReconnectHistory.Outcome.CANCELLED,
-        }
+        try:
+            documents = _fetch_session_documents(
+                repository, [session_id for _, session_id in open_entries]
+            )
+        except Exception:
+            documents = {}
+        _close_reconciled_entries(open_entries, documents, ReconcileSummary())
 
-        for entry in open_entries:
+    @staticmethod
+    def reconcile_open_entries(
+        *, repository, chunk_size: int = RECONCILE_CHUNK_SIZE
+    ) -> ReconcileSummary:
+        """
+        Reconcilia todas as entradas abertas, em lotes por ordem de pk.
+
+        Cada lote faz uma única consulta $in ao Mongo e um único UPDATE. Se a
+        consulta de um lote falhar, o lote fica aberto (contado em errors) em
+        vez de ser fechado como stale.
+        """
+        from telecom.models import WhatsappReconnectHistory
+
+        summary = ReconcileSummary()
+        last_pk = 0
+        while True:
+            chunk = list(
+                WhatsappReconnectHistory.objects.filter(
+                    outcome__isnull=True, pk__gt=last_pk
+                )
+                .order_by("pk")
+                .values_list("pk", "session_id")[:chunk_size]
+            )
+            if not chunk:
+                return summary
+            last_pk = chunk[-1][0]
+            summary.scanned += len(chunk)
             try:
-                document = repository.get_session(entry.session_id)
+                documents = _fetch_session_documents(
+                    repository, [session_id for _, session_id in chunk]
+                )
             except Exception:
-                document = None
-
-            if document is None:
-                WhatsappReconnectHistoryService.close(
-                    session_id=entry.session_id,
-                    outcome=WhatsappReconnectHistory.Outcome.CANCELLED,
-                    error_code="stale_session",
-                    error_message="Sessao nao encontrada no Mongo ao consultar historico.",
-                    attempt_count=entry.attempt_count,
+                logger.warning(
+                    "Falha ao consultar lote de sessoes de reconexao no Mongo",
+                    extra={"first_pk": chunk[0][0], "last_pk": last_pk},
                 )
+                summary.errors += len(chunk)
                 continue
+            _close_reconciled_entries(chunk, documents, summary)
+
+
+def _fetch_session_documents(repository, session_ids) -> dict:
+    """Documentos por _id; uma consulta $in quando o repositório oferece."""
+    if hasattr(repository, "get_sessions_by_ids"):
+        return repository.get_sessions_by_ids(session_ids)
+    documents = {}
+    for session_id in session_ids:
+        document = repository.get_session(session_id)
+        if document is not None:
+            documents[session_id] = document
+    return documents
+
+
+def _close_reconciled_entries(entries, documents, summary) -> None:
+    """Fecha com um único UPDATE as entradas terminais ou ausentes no Mongo."""
+    from telecom.models import WhatsappReconnectHistory
+
+    closing = {}
+    for pk, session_id in entries:
+        document = documents.get(session_id)
+        if document is None:
+            closing[pk] = (
+                WhatsappReconnectHistory.Outcome.CANCELLED,
+                "stale_session",
+                "Sessao nao encontrada no Mongo ao consultar historico.",
+                None,
+            )
+            summary.stale += 1
+            continue
+
+        raw_status = _normalize_mongo_status(document.get("status"))
+        if raw_status not in _TERMINAL_STATUSES:
+            summary.still_open += 1
+            continue
+
+        closing[pk] = (
+            raw_status,
+            document.get("error_code") or "",
+            document.get("error_message") or "",
+            document.get("attempt") or 0,
+        )
+        summary.increment(raw_status)
+
+    if not closing:
+        return
+
+    def field_case(position, output_field, default=None):
+        whens = [
+            When(pk=pk, then=Value(values[position]))
+            for pk, values in closing.items()
+            if values[position] is not None
+        ]
+        return Case(
+            *whens,
+            default=default if default is not None else Value(""),
+            output_field=output_field,
+        )
 
-            raw_status = _normalize_mongo_status(document.get("status"))
-            if raw_status not in _TERMINAL_STATUSES:
-                continue
-
-            outcome = outcome_map.get(raw_status)
-            if outcome:
-                WhatsappReconnectHistoryService.close(
-                    session_id=entry.session_id,
-                    outcome=outcome,
-                    error_code=document.get("error_code") or "",
-                    error_message=document.get("error_message") or "",
-                    attempt_count=document.get("attempt") or 0,
-                )
+    # Filtra outcome nulo: quem fechou a entrada no meio do lote prevalece.
+    WhatsappReconnectHistory.objects.filter(
+        pk__in=list(closing), outcome__isnull=True
+    ).update(
+        outcome=field_case(0, CharField()),
+        error_code=field_case(1, CharField()),
+        error_message=field_case(2, TextField()),
+        attempt_count=field_case(3, IntegerField(), default=F("attempt_count")),
+        finished_at=timezone.now(),
+    )
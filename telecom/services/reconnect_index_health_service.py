@@ -0,0 +1,97 @@
+"""
+Verificacao em cache do indice unico parcial de sessoes de reconexao.
+
+list_indexes() e feito no maximo uma vez por intervalo em cada processo, em
+vez de a cada nova sessao. Resultado positivo vale por
+RECONNECT_INDEX_CHECK_INTERVAL_SECONDS; indice ausente ou erro de consulta
+sao reavaliados apos RECONNECT_INDEX_RETRY_SECONDS, para o inicio voltar a
+funcionar logo apos create_reconnect_indexes. O ultimo estado fica
+disponivel para o health check.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+INDEX_STATUS_UNKNOWN = "unknown"
+INDEX_STATUS_OK = "ok"
+INDEX_STATUS_MISSING = "missing"
+INDEX_STATUS_ERROR = "error"
+
+
+def get_index_check_interval() -> float:
+    return getattr(settings, "RECONNECT_INDEX_CHECK_INTERVAL_SECONDS", 300)
+
+
+def get_index_retry_interval() -> float:
+    return getattr(settings, "RECONNECT_INDEX_RETRY_SECONDS", 30)
+
+
+class ReconnectIndexHealth:
+    def __init__(self, *, check_interval=None, retry_interval=None):
+        self.check_interval = (
+            get_index_check_interval() if check_interval is None else check_interval
+        )
+        self.retry_interval = (
+            get_index_retry_interval() if retry_interval is None else retry_interval
+        )
+        self.status = INDEX_STATUS_UNKNOWN
+        self.checked_at = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def check(self, repository) -> str:
+        """Retorna o status do indice, consultando o Mongo so quando expirado."""
+        if time.monotonic() < self._expires_at:
+            return self.status
+
+        with self._lock:
+            if time.monotonic() < self._expires_at:
+                return self.status
+            try:
+                present = repository.has_active_session_unique_index()
+            except Exception:
+                logger.exception(
+                    "Falha ao verificar indices da collection de reconexao"
+                )
+                self._store(INDEX_STATUS_ERROR, self.retry_interval)
+            else:
+                if present:
+                    self._store(INDEX_STATUS_OK, self.check_interval)
+                else:
+                    logger.error(
+                        "Indice unico parcial de reconexao ausente; "
+                        "execute create_reconnect_indexes"
+                    )
+                    self._store(INDEX_STATUS_MISSING, self.retry_interval)
+        return self.status
+
+    def snapshot(self) -> dict:
+        return {
+            "status": self.status,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.status = INDEX_STATUS_UNKNOWN
+            self.checked_at = None
+            self._expires_at = 0.0
+
+    def _store(self, status, ttl) -> None:
+        self.status = status
+        self.checked_at = timezone.now()
+        self._expires_at = time.monotonic() + ttl
+
+
+@lru_cache(maxsize=1)
+def get_reconnect_index_health() -> ReconnectIndexHealth:
+    return ReconnectIndexHealth()
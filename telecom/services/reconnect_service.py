@@ -10,6 +10,10 @@ from django.utils import timezone
 from core.exceptions.domain_exceptions import BusinessRuleException
 from telecom.exceptions import ActiveReconnectSessionConflict
 from telecom.models import PhoneLine
+from telecom.services.reconnect_index_health_service import (
+    INDEX_STATUS_MISSING,
+    ReconnectIndexHealth,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -92,9 +96,18 @@ def _format_restriction_hms(value: Any) -> str | None:
 
 
 class ReconnectService:
-    def __init__(self, *, repository, target_server_by_origem: dict[str, str]):
+    def __init__(
+        self,
+        *,
+        repository,
+        target_server_by_origem: dict[str, str],
+        index_health: ReconnectIndexHealth | None = None,
+    ):
         self.repository = repository
         self.target_server_by_origem = target_server_by_origem
+        self.index_health = (
+            index_health if index_health is not None else ReconnectIndexHealth()
+        )
 
     def start_for_line(self, phone_line: PhoneLine) -> dict[str, Any]:
         self._ensure_line_is_eligible_for_reconnect(phone_line)
@@ -115,20 +128,12 @@ class ReconnectService:
             return serialized
         self._ensure_active_session_unique_index()
 
-        now = timezone.now()
-        document = {
-            "_id": f"manual_reconnect_{uuid4().hex}",
-            "phone_number": normalized_phone,
-            "vm_name": self._resolve_vm_name(phone_line),
-            "target_server": self._resolve_target_server(phone_line),
-            "assigned_server": None,
-            "status": "QUEUED",
-            "attempt": 0,
-            "active_lock": True,
-            "device_name": self._resolve_device_name(phone_line),
-            "created_at": now,
-            "updated_at": now,
-        }
+        document = self._build_session_document(
+            phone_line,
+            normalized_phone=normalized_phone,
+            device_name=self._resolve_device_name(phone_line),
+            now=timezone.now(),
+        )
 
         try:
             created = self.repository.create_session(document)
@@ -161,6 +166,103 @@ class ReconnectService:
         )
         return serialized
 
+    def start_for_lines(self, phone_lines) -> dict[str, list]:
+        """
+        Inicia a reconexao de varias linhas com poucas idas ao Mongo.
+
+        Uma consulta $in separa as linhas que ja tem sessao ativa (reusadas),
+        as novas sessoes sao gravadas com um unico insert_many e conflitos de
+        indice unico por documento viram reuso da sessao que venceu a corrida;
+        outras falhas de gravacao viram "skipped" sem descartar as sessoes
+        gravadas no mesmo lote. Retorna listas de (linha, payload) em
+        "started" e "reused" e de (linha, motivo) em "skipped".
+        """
+        result = {"started": [], "reused": [], "skipped": []}
+        candidates = {}
+        for phone_line in phone_lines:
+            try:
+                self._ensure_line_is_eligible_for_reconnect(phone_line)
+                self._resolve_target_server(phone_line)
+            except BusinessRuleException as exc:
+                result["skipped"].append((phone_line, str(exc)))
+                continue
+            normalized_phone = self._normalize_phone_number(phone_line.phone_number)
+            if normalized_phone in candidates:
+                result["skipped"].append(
+                    (
+                        phone_line,
+                        "Numero repetido no lote: a reconexao segue pela linha "
+                        f"{candidates[normalized_phone].pk}.",
+                    )
+                )
+                continue
+            candidates[normalized_phone] = phone_line
+        if not candidates:
+            return result
+
+        active_sessions = self.repository.find_active_sessions_by_phones(
+            list(candidates)
+        )
+        for normalized_phone, document in active_sessions.items():
+            phone_line = candidates.pop(normalized_phone, None)
+            if phone_line is not None:
+                result["reused"].append((phone_line, self._serialize_session(document)))
+        if not candidates:
+            return result
+
+        self._ensure_active_session_unique_index()
+        device_names = self._resolve_device_names(candidates.values())
+        now = timezone.now()
+        documents = [
+            self._build_session_document(
+                phone_line,
+                normalized_phone=normalized_phone,
+                device_name=device_names[phone_line.pk],
+                now=now,
+            )
+            for normalized_phone, phone_line in candidates.items()
+        ]
+        created, conflicted_phones, failed_phones = self.repository.create_sessions(
+            documents
+        )
+        for document in created:
+            phone_line = candidates[document["phone_number"]]
+            result["started"].append((phone_line, self._serialize_session(document)))
+        for normalized_phone in failed_phones:
+            result["skipped"].append(
+                (
+                    candidates[normalized_phone],
+                    "Nao foi possivel registrar a sessao de reconexao. "
+                    "Tente novamente.",
+                )
+            )
+
+        if conflicted_phones:
+            winners = self.repository.find_active_sessions_by_phones(conflicted_phones)
+            for normalized_phone in conflicted_phones:
+                phone_line = candidates[normalized_phone]
+                document = winners.get(normalized_phone)
+                if document is None:
+                    result["skipped"].append(
+                        (
+                            phone_line,
+                            "Ja existe uma sessao de reconexao ativa para este "
+                            "numero. Tente novamente.",
+                        )
+                    )
+                    continue
+                result["reused"].append((phone_line, self._serialize_session(document)))
+
+        logger.info(
+            "Reconnect sessions queued in bulk",
+            extra={
+                "started": len(result["started"]),
+                "reused": len(result["reused"]),
+                "skipped": len(result["skipped"]),
+            },
+        )
+        return result
+
     def get_active_for_line(self, phone_line: PhoneLine) -> dict[str, Any] | None:
         return self.get_status_for_line(phone_line)
 
@@ -306,7 +408,9 @@ class ReconnectService:
     def _ensure_active_session_unique_index(self) -> None:
         if not hasattr(self.repository, "has_active_session_unique_index"):
             return
-        if not self.repository.has_active_session_unique_index():
+        # Erro de consulta fica no health check; o indice, se existir, segue
+        # protegendo a insercao.
+        if self.index_health.check(self.repository) == INDEX_STATUS_MISSING:
             raise BusinessRuleException(
                 "A collection de reconexao precisa do indice unico parcial por "
                 "phone_number com active_lock=true antes de iniciar novas sessoes."
@@ -321,6 +425,23 @@ class ReconnectService:
             )
         return target_server
 
+    def _build_session_document(
+        self, phone_line: PhoneLine, *, normalized_phone: str, device_name: str, now
+    ) -> dict[str, Any]:
+        return {
+            "_id": f"manual_reconnect_{uuid4().hex}",
+            "phone_number": normalized_phone,
+            "vm_name": self._resolve_vm_name(phone_line),
+            "target_server": self._resolve_target_server(phone_line),
+            "assigned_server": None,
+            "status": "QUEUED",
+            "attempt": 0,
+            "active_lock": True,
+            "device_name": device_name,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def _resolve_vm_name(self, phone_line: PhoneLine) -> str:
         return self._normalize_phone_number(phone_line.phone_number)
 
@@ -330,10 +451,39 @@ class ReconnectService:
             .select_related("employee")
             .first()
         )
-        raw_device_name = (
+        return self._truncate_device_name(
+            phone_line,
             active_allocation.employee.full_name
             if active_allocation and active_allocation.employee
-            else self._normalize_phone_number(phone_line.phone_number)
+            else "",
+        )
+
+    def _resolve_device_names(self, phone_lines) -> dict[int, str]:
+        """Mesmo criterio de _resolve_device_name, com uma unica consulta."""
+        from allocations.models import LineAllocation
+
+        phone_lines = list(phone_lines)
+        employee_names = {}
+        for phone_line_id, full_name in (
+            LineAllocation.objects.filter(
+                phone_line__in=phone_lines,
+                is_active=True,
+                employee__isnull=False,
+            )
+            .order_by("phone_line_id", "-allocated_at")
+            .values_list("phone_line_id", "employee__full_name")
+        ):
+            employee_names.setdefault(phone_line_id, full_name)
+        return {
+            phone_line.pk: self._truncate_device_name(
+                phone_line, employee_names.get(phone_line.pk, "")
+            )
+            for phone_line in phone_lines
+        }
+
+    def _truncate_device_name(self, phone_line: PhoneLine, employee_name: str) -> str:
+        raw_device_name = employee_name or self._normalize_phone_number(
+            phone_line.phone_number
         )
         if len(raw_device_name) > 50:
             logger.warning(
@@ -414,13 +564,27 @@ class ReconnectService:
     def _resolve_queue_position(self, document: dict[str, Any], raw_status: str) -> int | None:
         if raw_status != "QUEUED":
             return None
-        if not hasattr(self.repository, "count_queued_before_session"):
-            return None
         target_server = document.get("target_server")
         created_at = document.get("created_at")
         session_id = document.get("_id")
         if not target_server or created_at is None or not session_id:
             return None
+        if hasattr(self.repository, "get_queue_position"):
+            try:
+                position = self.repository.get_queue_position(
+                    target_server=target_server,
+                    session_id=session_id,
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to load queue snapshot for target server %s",
+                    target_server,
+                )
+                position = None
+            if position is not None:
+                return position
+        if not hasattr(self.repository, "count_queued_before_session"):
+            return None
         try:
             count_before = self.repository.count_queued_before_session(
                 target_server=target_server,
@@ -435,6 +599,9 @@ class ReconnectService:
             )
             return None
 
+    def serialize_session(self, document: dict[str, Any]) -> dict[str, Any]:
+        return self._serialize_session(document)
+
     def _serialize_session(self, document: dict[str, Any]) -> dict[str, Any]:
         raw_status = _normalize_status(document.get("status"))
         cancel_requested = bool(document.get("cancel_requested_at")) and (
@@ -493,10 +660,19 @@ class ReconnectService:
 def build_default_reconnect_service() -> ReconnectService:
     from django.conf import settings
 
+    from telecom.repositories.cached_reconnect_sessions import (
+        CachedReconnectSessionRepository,
+    )
     from telecom.repositories.reconnect_sessions import MongoReconnectSessionRepository
+    from telecom.services.reconnect_index_health_service import (
+        get_reconnect_index_health,
+    )
 
-    repository = MongoReconnectSessionRepository.from_settings()
+    repository = CachedReconnectSessionRepository(
+        MongoReconnectSessionRepository.from_settings()
+    )
     return ReconnectService(
         repository=repository,
         target_server_by_origem=settings.RECONNECT_TARGET_SERVER_BY_ORIGEM,
+        index_health=get_reconnect_index_health(),
     )
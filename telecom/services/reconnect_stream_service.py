@@ -0,0 +1,153 @@
+"""
+Acompanhamento por push (SSE) dos documentos de sessao de reconexao.
+
+Um hub por processo mantem uma unica tarefa de observacao por session_id,
+compartilhada por todos os ouvintes daquela sessao. A tarefa usa change
+streams do Mongo quando o repositorio oferece watch_session e o servidor
+suporta (replica set); caso contrario faz polling no intervalo de
+RECONNECT_POLL_INTERVAL_MS. Cada ouvinte recebe apenas a versao mais recente
+do documento e somente quando ela muda.
+
+As chamadas ao pymongo sao sincronas e rodam em threads (asyncio.to_thread),
+entao o endpoint so faz sentido servido via ASGI (config.asgi).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+
+from telecom.services.reconnect_service import (
+    TERMINAL_RECONNECT_STATUSES,
+    _normalize_status,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_stream_poll_interval():
+    return max(settings.RECONNECT_POLL_INTERVAL_MS, 10) / 1000
+
+
+def format_sse_event(payload, event="status"):
+    data = json.dumps(payload, default=str)
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _is_terminal_document(document):
+    status = _normalize_status((document or {}).get("status"))
+    return status in TERMINAL_RECONNECT_STATUSES
+
+
+class _SessionChannel:
+    def __init__(self):
+        self.listeners: set[asyncio.Queue] = set()
+        self.latest = None
+        self.task: asyncio.Task | None = None
+
+    def publish(self, document):
+        if document is None or document == self.latest:
+            return
+        self.latest = document
+        for queue in self.listeners:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(document)
+
+
+class ReconnectSessionHub:
+    def __init__(self, repository, *, poll_interval=None):
+        self.repository = repository
+        self.poll_interval = poll_interval
+        self.change_streams_available = hasattr(repository, "watch_session")
+        self._channels: dict[str, _SessionChannel] = {}
+
+    async def subscribe(self, session_id, *, heartbeat_seconds=15.0):
+        """
+        Gerador assincrono com cada nova versao do documento da sessao.
+
+        Emite None a cada heartbeat_seconds sem mudancas, para o chamador
+        manter a conexao viva.
+        """
+        channel = self._channels.setdefault(session_id, _SessionChannel())
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        channel.listeners.add(queue)
+        if channel.latest is not None:
+            queue.put_nowait(channel.latest)
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(self._watch(session_id, channel))
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), heartbeat_seconds)
+                except TimeoutError:
+                    yield None
+        finally:
+            channel.listeners.discard(queue)
+            if not channel.listeners:
+                self._channels.pop(session_id, None)
+                if channel.task is not None:
+                    channel.task.cancel()
+
+    async def _watch(self, session_id, channel):
+        if self.change_streams_available:
+            try:
+                await self._watch_change_stream(session_id, channel)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Standalone sem replica set nao suporta change streams.
+                logger.info(
+                    "Change streams indisponiveis; usando polling compartilhado",
+                    extra={"session_id": session_id},
+                )
+                self.change_streams_available = False
+        await self._watch_polling(session_id, channel)
+
+    async def _watch_change_stream(self, session_id, channel):
+        stream = await asyncio.to_thread(self.repository.watch_session, session_id)
+        try:
+            # Leitura apos abrir o stream: nenhuma mudanca fica entre os dois.
+            channel.publish(
+                await asyncio.to_thread(self.repository.get_session, session_id)
+            )
+            while channel.listeners and not _is_terminal_document(channel.latest):
+                change = await asyncio.to_thread(stream.try_next)
+                if change is None:
+                    continue
+                document = change.get("fullDocument")
+                if document is None and change.get("operationType") != "delete":
+                    document = await asyncio.to_thread(
+                        self.repository.get_session, session_id
+                    )
+                channel.publish(document)
+        finally:
+            await asyncio.to_thread(stream.close)
+
+    async def _watch_polling(self, session_id, channel):
+        interval = self.poll_interval or get_stream_poll_interval()
+        while channel.listeners:
+            try:
+                channel.publish(
+                    await asyncio.to_thread(self.repository.get_session, session_id)
+                )
+            except Exception:
+                logger.warning(
+                    "Falha ao consultar sessao de reconexao no polling",
+                    extra={"session_id": session_id},
+                )
+            if _is_terminal_document(channel.latest):
+                return
+            await asyncio.sleep(interval)
+
+
+@lru_cache(maxsize=1)
+def get_reconnect_session_hub():
+    from telecom.repositories.reconnect_sessions import MongoReconnectSessionRepository
+
+    return ReconnectSessionHub(MongoReconnectSessionRepository.from_settings())
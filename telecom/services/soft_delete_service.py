@@ -0,0 +1,140 @@
+"""
+Soft delete em lote de linhas e SIMcards.
+
+Equivale a chamar delete() em cada instancia (libera a alocacao ativa, volta
+a linha para AVAILABLE, marca is_deleted e registra RELEASED/DELETED no
+historico), mas com consultas por conjunto: uma leitura das linhas, uma das
+alocacoes ativas, UPDATEs em lote e um bulk_create por tipo de historico.
+Como update() nao dispara signals, o carimbo do inventario e o indicador do
+dia sao invalidados uma vez ao final, apos o commit.
+"""
+
+import logging
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.current_user import get_current_user
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    bump_version_stamp,
+)
+from dashboard.services.indicator_cache_service import (
+    invalidate_today_indicator_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_current_user():
+    user = get_current_user()
+    return user if getattr(user, "is_authenticated", False) else None
+
+
+@transaction.atomic
+def soft_delete_phone_lines(phone_line_ids, *, released_by=None) -> int:
+    """
+    Exclui logicamente as linhas (lista de pks ou queryset de pks).
+
+    Retorna quantas linhas ainda ativas foram excluidas.
+    """
+    from allocations.models import LineAllocation
+    from telecom.models import PhoneLine, PhoneLineHistory
+
+    lines = list(
+        PhoneLine.all_objects.select_for_update(of=("self",))
+        .filter(pk__in=phone_line_ids, is_deleted=False)
+        .select_related("sim_card")
+        .order_by("pk")
+    )
+    if not lines:
+        return 0
+
+    line_ids = [line.pk for line in lines]
+    now = timezone.now()
+    changed_by = _safe_current_user()
+    allocations = list(
+        LineAllocation.objects.select_for_update(of=("self",))
+        .filter(phone_line_id__in=line_ids, is_active=True)
+        .select_related("employee")
+        .order_by("phone_line_id", "-allocated_at")
+    )
+    history_rows = []
+    released_line_ids = set()
+    if allocations:
+        LineAllocation.objects.filter(
+            pk__in=[allocation.pk for allocation in allocations]
+        ).update(is_active=False, released_at=now, released_by=released_by)
+        for allocation in allocations:
+            released_line_ids.add(allocation.phone_line_id)
+            employee_name = allocation.employee.full_name
+            history_rows.append(
+                PhoneLineHistory(
+                    phone_line_id=allocation.phone_line_id,
+                    action=PhoneLineHistory.ActionType.RELEASED,
+                    old_value=f"Usuário: {employee_name}",
+                    changed_by=released_by or changed_by,
+                    description=f"Linha liberada de {employee_name}",
+                )
+            )
+        PhoneLine.all_objects.filter(pk__in=released_line_ids).update(
+            status=PhoneLine.Status.AVAILABLE
+        )
+
+    PhoneLine.all_objects.filter(pk__in=line_ids).update(
+        is_deleted=True, updated_at=now
+    )
+    available_display = PhoneLine.Status.AVAILABLE.label
+    for line in lines:
+        status_display = (
+            available_display
+            if line.pk in released_line_ids
+            else line.get_status_display()
+        )
+        history_rows.append(
+            PhoneLineHistory(
+                phone_line=line,
+                action=PhoneLineHistory.ActionType.DELETED,
+                old_value=f"Status: {status_display}, SIM: {line.sim_card.iccid}",
+                changed_by=changed_by,
+                description=f"Linha {line.phone_number} excluída",
+            )
+        )
+    PhoneLineHistory.objects.bulk_create(history_rows)
+    transaction.on_commit(partial(bump_version_stamp, INVENTORY_VERSION_NAMESPACE))
+    transaction.on_commit(invalidate_today_indicator_cache)
+
+    if allocations:
+        # Equivale aos "Line released" do AllocationService.release_line.
+        logger.info(
+            "Lines released in bulk",
+            extra={
+                "allocation_ids": [allocation.pk for allocation in allocations],
+                "phone_line_ids": sorted(released_line_ids),
+                "released_by_id": getattr(released_by, "id", None),
+            },
+        )
+    return len(lines)
+
+
+@transaction.atomic
+def soft_delete_sim_cards(sim_card_ids, *, released_by=None) -> int:
+    """Exclui logicamente os SIMcards e as linhas vinculadas ainda ativas."""
+    from telecom.models import PhoneLine, SIMcard
+
+    # Materializa antes: o filtro de origem pode depender das linhas excluidas.
+    sim_card_ids = list(sim_card_ids)
+    soft_delete_phone_lines(
+        PhoneLine.all_objects.filter(
+            sim_card_id__in=sim_card_ids, is_deleted=False
+        ).values_list("pk", flat=True),
+        released_by=released_by,
+    )
+    deleted = SIMcard.all_objects.filter(pk__in=sim_card_ids, is_deleted=False).update(
+        is_deleted=True, updated_at=timezone.now()
+    )
+    if deleted:
+        transaction.on_commit(partial(bump_version_stamp, INVENTORY_VERSION_NAMESPACE))
+        transaction.on_commit(invalidate_today_indicator_cache)
+    return deleted
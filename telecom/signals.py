@@ -1,10 +1,18 @@
-from django.db.models.signals import post_save, pre_delete, pre_save
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from allocations.models import LineAllocation
 from core.current_user import get_current_user
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    bump_version_stamp,
+)
+from employees.models import Employee
 
-from .models import PhoneLine, PhoneLineHistory
+from .models import PhoneLine, PhoneLineHistory, SIMcard
 
 
 def _safe_current_user():
@@ -25,30 +33,54 @@ def track_phoneline_creation(sender, instance, created, **kwargs):
         )
 
 
+def _sim_card_iccid(instance, sim_card_id):
+    """ICCID do SIM informado, sem consulta quando e o SIM atual da instancia."""
+    if sim_card_id == instance.sim_card_id:
+        return instance.sim_card.iccid
+    return (
+        SIMcard._base_manager.filter(pk=sim_card_id)
+        .values_list("iccid", flat=True)
+        .first()
+    )
+
+
+def _employee_full_name(instance, employee_id):
+    """Nome do usuario informado, sem consulta quando e o usuario da alocacao."""
+    if employee_id == instance.employee_id:
+        return instance.employee.full_name
+    return (
+        Employee._base_manager.filter(pk=employee_id)
+        .values_list("full_name", flat=True)
+        .first()
+    )
+
+
 @receiver(pre_save, sender=PhoneLine)
 def track_phoneline_changes(sender, instance, **kwargs):
     """Registra mudancas de status, SIM e soft delete."""
     if not instance.pk:
         return
 
-    try:
-        old_instance = PhoneLine.objects.get(pk=instance.pk)
-    except PhoneLine.DoesNotExist:
+    previous = instance.get_previous_values()
+    # Linha ja excluida logicamente (reuso/revive): sem historico de mudanca,
+    # como na leitura antiga via PhoneLine.objects, que ignorava excluidas.
+    if previous is None or previous["is_deleted"]:
         return
 
     changed_by = _safe_current_user()
+    old_status_display = instance.get_previous_display("status", previous["status"])
 
     # Soft delete (is_deleted de False para True)
-    if not old_instance.is_deleted and instance.is_deleted:
+    if not previous["is_deleted"] and instance.is_deleted:
         PhoneLineHistory.objects.create(
             phone_line=instance,
             action=PhoneLineHistory.ActionType.DELETED,
             old_value=(
-                f"Status: {old_instance.get_status_display()}, "
-                f"SIM: {old_instance.sim_card.iccid}"
+                f"Status: {old_status_display}, "
+                f"SIM: {_sim_card_iccid(instance, previous['sim_card_id'])}"
             ),
             changed_by=changed_by,
-            description=f"Linha {old_instance.phone_number} excluída",
+            description=f"Linha {instance.phone_number} excluída",
         )
 
     origin_action = getattr(instance, "_history_origin_action", None)
@@ -57,29 +89,29 @@ def track_phoneline_changes(sender, instance, **kwargs):
         PhoneLineHistory.ActionType.RELEASED,
     }
 
-    if old_instance.status != instance.status and not is_status_from_allocation_flow:
+    if previous["status"] != instance.status and not is_status_from_allocation_flow:
         PhoneLineHistory.objects.create(
             phone_line=instance,
             action=PhoneLineHistory.ActionType.STATUS_CHANGED,
-            old_value=old_instance.get_status_display(),
+            old_value=old_status_display,
             new_value=instance.get_status_display(),
             changed_by=changed_by,
             description=(
-                f"Status alterado de {old_instance.get_status_display()} "
+                f"Status alterado de {old_status_display} "
                 f"para {instance.get_status_display()}"
             ),
         )
 
-    if old_instance.sim_card_id != instance.sim_card_id:
+    if previous["sim_card_id"] != instance.sim_card_id:
+        old_iccid = _sim_card_iccid(instance, previous["sim_card_id"])
         PhoneLineHistory.objects.create(
             phone_line=instance,
             action=PhoneLineHistory.ActionType.SIMCARD_CHANGED,
-            old_value=old_instance.sim_card.iccid,
+            old_value=old_iccid,
             new_value=instance.sim_card.iccid,
             changed_by=changed_by,
             description=(
-                f"SIMcard alterado de {old_instance.sim_card.iccid} "
-                f"para {instance.sim_card.iccid}"
+                f"SIMcard alterado de {old_iccid} para {instance.sim_card.iccid}"
             ),
         )
 
@@ -115,14 +147,13 @@ def track_line_release(sender, instance, **kwargs):
     if not instance.pk:
         return
 
-    try:
-        old_instance = LineAllocation.objects.get(pk=instance.pk)
-    except LineAllocation.DoesNotExist:
+    previous = instance.get_previous_values()
+    if previous is None:
         return
 
     changed_by = _safe_current_user()
 
-    if old_instance.is_active and not instance.is_active:
+    if previous["is_active"] and not instance.is_active:
         PhoneLineHistory.objects.create(
             phone_line=instance.phone_line,
             action=PhoneLineHistory.ActionType.RELEASED,
@@ -130,15 +161,26 @@ def track_line_release(sender, instance, **kwargs):
             changed_by=instance.released_by or changed_by,
             description=f"Linha liberada de {instance.employee.full_name}",
         )
-    elif old_instance.employee_id != instance.employee_id:
+    elif previous["employee_id"] != instance.employee_id:
+        old_name = _employee_full_name(instance, previous["employee_id"])
         PhoneLineHistory.objects.create(
             phone_line=instance.phone_line,
             action=PhoneLineHistory.ActionType.EMPLOYEE_CHANGED,
-            old_value=old_instance.employee.full_name,
+            old_value=old_name,
             new_value=instance.employee.full_name,
             changed_by=changed_by,
             description=(
-                f"Usuário alterado de {old_instance.employee.full_name} "
-                f"para {instance.employee.full_name}"
+                f"Usuário alterado de {old_name} para {instance.employee.full_name}"
             ),
         )
+
+
+@receiver(post_save, sender=PhoneLine)
+@receiver(post_delete, sender=PhoneLine)
+@receiver(post_save, sender=SIMcard)
+@receiver(post_delete, sender=SIMcard)
+@receiver(post_save, sender=LineAllocation)
+@receiver(post_delete, sender=LineAllocation)
+def bump_inventory_version(sender, **kwargs):
+    """Invalida os ETags das listagens de inventario apos o commit."""
+    transaction.on_commit(partial(bump_version_stamp, INVENTORY_VERSION_NAMESPACE))
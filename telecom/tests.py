@@ -1,20 +1,29 @@
+import asyncio
+import csv
+import io
+import json
 from datetime import timedelta
 
 from django.contrib import admin
+from django.db import connection
 from django.test import RequestFactory
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from unittest.mock import ANY, MagicMock, patch
 
 from allocations.forms import TelephonyAssignmentForm
+from allocations.models import LineAllocation
 from core.current_user import clear_current_user, set_current_user
 from core.exceptions.domain_exceptions import BusinessRuleException
 from core.services.allocation_service import AllocationService
+from dashboard.services.indicator_cache_service import get_today_indicator_generation
 from employees.models import Employee
 from telecom import history as telecom_history
 from telecom.forms import BlipConfigurationForm
 from telecom.models import BlipConfiguration, PhoneLine, PhoneLineHistory, SIMcard, WhatsappReconnectHistory
+from telecom.views import TelecomOverviewView
 from users.models import SystemUser
 
 
@@ -211,6 +220,74 @@ class TelecomAdminDeleteTest(TestCase):
         self.assertTrue(phone_line.is_deleted)
         self.assertFalse(allocation.is_active)
 
+    def test_simcard_queryset_delete_is_set_based_and_writes_history(self):
+        built = [self._build_sim_with_active_line(suffix) for suffix in (6, 7, 8)]
+        sim_ids = [sim_card.pk for sim_card, _, _ in built]
+        line_ids = [phone_line.pk for _, phone_line, _ in built]
+
+        set_current_user(self.admin_user)
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                deleted_count, _ = SIMcard.objects.filter(pk__in=sim_ids).delete()
+        finally:
+            clear_current_user()
+
+        self.assertEqual(deleted_count, 3)
+        # Savepoints (4), ids dos SIMs, linhas, alocacoes, 3 UPDATEs de linha
+        # e alocacao, historico em lote e UPDATE dos SIMs: fixo para N SIMs.
+        self.assertEqual(len(queries.captured_queries), 12)
+        self.assertEqual(
+            PhoneLine.all_objects.filter(
+                pk__in=line_ids,
+                is_deleted=True,
+                status=PhoneLine.Status.AVAILABLE,
+            ).count(),
+            3,
+        )
+        self.assertFalse(
+            LineAllocation.objects.filter(
+                phone_line_id__in=line_ids, is_active=True
+            ).exists()
+        )
+        released = PhoneLineHistory.objects.get(
+            phone_line=built[0][1], action=PhoneLineHistory.ActionType.RELEASED
+        )
+        self.assertEqual(released.old_value, "Usuário: Delete Admin User 6")
+        self.assertEqual(released.changed_by, self.admin_user)
+        deleted = PhoneLineHistory.objects.get(
+            phone_line=built[0][1], action=PhoneLineHistory.ActionType.DELETED
+        )
+        self.assertEqual(
+            deleted.old_value, f"Status: Disponível, SIM: {built[0][0].iccid}"
+        )
+        self.assertEqual(
+            PhoneLineHistory.objects.filter(
+                phone_line_id__in=line_ids,
+                action__in=[
+                    PhoneLineHistory.ActionType.RELEASED,
+                    PhoneLineHistory.ActionType.DELETED,
+                ],
+            ).count(),
+            6,
+        )
+
+    def test_simcard_queryset_delete_invalidates_indicator_and_logs_release(self):
+        sim_card, phone_line, allocation = self._build_sim_with_active_line(9)
+        generation = get_today_indicator_generation()
+
+        with (
+            self.assertLogs(
+                "telecom.services.soft_delete_service", level="INFO"
+            ) as logs,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            SIMcard.objects.filter(pk=sim_card.pk).delete()
+
+        self.assertNotEqual(get_today_indicator_generation(), generation)
+        self.assertEqual(logs.records[0].getMessage(), "Lines released in bulk")
+        self.assertEqual(logs.records[0].allocation_ids, [allocation.pk])
+        self.assertEqual(logs.records[0].phone_line_ids, [phone_line.pk])
+
 
 class PhoneLineHistoryAuditTest(TestCase):
     def setUp(self):
@@ -452,6 +529,97 @@ class PhoneLineHistoryAuditTest(TestCase):
             0,
         )
 
+    def test_status_change_is_tracked_without_reloading_the_line(self):
+        phone_line = PhoneLine.objects.select_related("sim_card").get(
+            pk=self.phone_line.pk
+        )
+        phone_line.status = PhoneLine.Status.SUSPENDED
+
+        with CaptureQueriesContext(connection) as queries:
+            phone_line.save(update_fields=["status"])
+
+        selects = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and "telecom_phoneline" in query["sql"]
+        ]
+        self.assertEqual(selects, [])
+        history = PhoneLineHistory.objects.get(
+            phone_line=phone_line,
+            action=PhoneLineHistory.ActionType.STATUS_CHANGED,
+        )
+        self.assertEqual(history.old_value, "Disponível")
+        self.assertEqual(history.new_value, "Quarentena")
+
+    def test_snapshot_is_refreshed_after_save(self):
+        phone_line = PhoneLine.objects.get(pk=self.phone_line.pk)
+        phone_line.status = PhoneLine.Status.SUSPENDED
+        phone_line.save(update_fields=["status"])
+        phone_line.save(update_fields=["status"])
+
+        self.assertEqual(
+            PhoneLineHistory.objects.filter(
+                phone_line=phone_line,
+                action=PhoneLineHistory.ActionType.STATUS_CHANGED,
+            ).count(),
+            1,
+        )
+
+    def test_deferred_tracked_fields_fall_back_to_database(self):
+        phone_line = PhoneLine.objects.only("id", "phone_number", "sim_card").get(
+            pk=self.phone_line.pk
+        )
+        phone_line.sim_card = self.sim_b
+        phone_line.status = PhoneLine.Status.SUSPENDED
+        phone_line.save(update_fields=["sim_card", "status"])
+
+        actions = dict(
+            PhoneLineHistory.objects.filter(
+                phone_line=phone_line,
+                action__in=[
+                    PhoneLineHistory.ActionType.SIMCARD_CHANGED,
+                    PhoneLineHistory.ActionType.STATUS_CHANGED,
+                ],
+            ).values_list("action", "old_value")
+        )
+        self.assertEqual(
+            actions,
+            {
+                PhoneLineHistory.ActionType.SIMCARD_CHANGED: self.sim_a.iccid,
+                PhoneLineHistory.ActionType.STATUS_CHANGED: "Disponível",
+            },
+        )
+
+
+    def test_reviving_soft_deleted_line_does_not_record_changes(self):
+        sim_old = SIMcard.objects.create(
+            iccid="8900000000000000303",
+            carrier="CarrierA",
+            status=SIMcard.Status.AVAILABLE,
+        )
+        phone_line = PhoneLine.objects.create(
+            phone_number="+5511988880303", sim_card=sim_old
+        )
+        phone_line.delete()
+
+        PhoneLine.create_or_reuse(
+            phone_number=phone_line.phone_number,
+            sim_card=self.sim_b,
+            status=PhoneLine.Status.SUSPENDED,
+        )
+
+        self.assertEqual(
+            sorted(
+                PhoneLineHistory.objects.filter(phone_line=phone_line).values_list(
+                    "action", flat=True
+                )
+            ),
+            [
+                PhoneLineHistory.ActionType.CREATED,
+                PhoneLineHistory.ActionType.DELETED,
+            ],
+        )
 
 class ExportPhoneLineHistoryTest(TestCase):
     def setUp(self):
@@ -531,6 +699,27 @@ class SIMcardViewsTest(TestCase):
         self.assertContains(response, self.sim_available.iccid)
         self.assertContains(response, self.sim_active.iccid)
 
+
+    @override_settings(CONDITIONAL_GET_MAX_AGE=10**9)
+    def test_simcard_ajax_list_supports_if_none_match(self):
+        url = reverse("telecom:simcard_list")
+        first = self.client.get(url, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("no-cache", first["Cache-Control"])
+        unchanged = self.client.get(
+            url,
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+        self.assertEqual(unchanged.status_code, 304)
+        filtered = self.client.get(
+            url,
+            {"status": SIMcard.Status.ACTIVE},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+        self.assertEqual(filtered.status_code, 200)
     def test_simcard_create_view(self):
         url = reverse("telecom:simcard_create")
         payload = {
@@ -901,6 +1090,20 @@ class PhoneLineViewsTest(TestCase):
         self.assertEqual(len(lines), 1)
         self.assertEqual(lines[0].pk, self.line_allocated.pk)
 
+    def test_search_by_formatted_phone_number_and_iccid_suffix(self):
+        url = reverse("telecom:overview")
+        response = self.client.get(url, {"line": "9999-002"})
+        self.assertEqual(
+            [line.pk for line in response.context["initial_lines"]],
+            [self.line_allocated.pk],
+        )
+
+        response = self.client.get(url, {"search": "00515"})
+        self.assertEqual(
+            [line.pk for line in response.context["initial_recent_lines"]],
+            [self.blip_line.pk],
+        )
+
     def test_overview_hides_line_when_related_simcard_is_soft_deleted(self):
         self.sim_available.delete()
 
@@ -981,11 +1184,11 @@ class PhoneLineViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertNotContains(response, "Reconexao WhatsApp")
 
-    def test_ajax_overview_ignores_invalid_offset_and_limit(self):
+    def test_ajax_overview_ignores_invalid_cursor_and_limit(self):
         url = reverse("telecom:overview")
         response = self.client.get(
             url,
-            {"table": "main", "offset": "abc", "limit": "xyz"},
+            {"table": "main", "cursor": "abc", "limit": "xyz"},
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
 
@@ -994,6 +1197,108 @@ class PhoneLineViewsTest(TestCase):
         self.assertIn("data", payload)
         self.assertGreaterEqual(len(payload["data"]), 1)
 
+    def _walk_overview_pages(self, params):
+        pages = []
+        cursor = ""
+        while True:
+            response = self.client.get(
+                reverse("telecom:overview"),
+                {**params, "cursor": cursor, "limit": 1},
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+            payload = response.json()
+            pages.append([item["id"] for item in payload["data"]])
+            if not payload["has_more"]:
+                self.assertEqual(payload["next_cursor"], "")
+                return pages
+            cursor = payload["next_cursor"]
+
+    def test_ajax_overview_main_table_pages_by_cursor(self):
+        pages = self._walk_overview_pages({"table": "main"})
+
+        self.assertEqual(
+            pages,
+            [[self.line_available.pk], [self.line_allocated.pk], [self.blip_line.pk]],
+        )
+
+    def test_ajax_overview_recent_table_pages_by_cursor_with_ties(self):
+        updated_at = timezone.now()
+        PhoneLine.objects.filter(pk=self.line_available.pk).update(
+            updated_at=updated_at + timedelta(minutes=1)
+        )
+        PhoneLine.objects.filter(
+            pk__in=[self.line_allocated.pk, self.blip_line.pk]
+        ).update(updated_at=updated_at)
+
+        pages = self._walk_overview_pages({"table": "recent"})
+
+        self.assertEqual(
+            pages,
+            [
+                [self.line_available.pk],
+                [max(self.line_allocated.pk, self.blip_line.pk)],
+                [min(self.line_allocated.pk, self.blip_line.pk)],
+            ],
+        )
+
+    def test_overview_first_page_shares_cursor_with_ajax(self):
+        response = self.client.get(
+            reverse("telecom:overview"), {"status": PhoneLine.Status.AVAILABLE}
+        )
+        self.assertFalse(response.context["has_more_main_lines"])
+        self.assertEqual(response.context["next_main_cursor"], "")
+
+        request = RequestFactory().get(
+            reverse("telecom:overview"),
+            {"table": "main", "limit": 2},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        request.user = self.admin
+        view = TelecomOverviewView()
+        view.setup(request)
+        with CaptureQueriesContext(connection) as captured:
+            payload = json.loads(view._handle_ajax_request(request).content)
+
+        self.assertTrue(payload["has_more"])
+        self.assertFalse(
+            any("COUNT(" in query["sql"].upper() for query in captured.captured_queries)
+        )
+        second = self.client.get(
+            reverse("telecom:overview"),
+            {"table": "main", "limit": 2, "cursor": payload["next_cursor"]},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        ).json()
+        self.assertEqual([item["id"] for item in second["data"]], [self.blip_line.pk])
+
+    @override_settings(CONDITIONAL_GET_MAX_AGE=10**9)
+    def test_ajax_overview_returns_not_modified_until_inventory_changes(self):
+        url = reverse("telecom:overview")
+        params = {"table": "main", "offset": 0, "limit": 10}
+        first = self.client.get(url, params, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        etag = first["ETag"]
+
+        # Apenas sessao e usuario autenticado; nenhuma query de dados.
+        with self.assertNumQueries(2):
+            unchanged = self.client.get(
+                url,
+                params,
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+                HTTP_IF_NONE_MATCH=etag,
+            )
+        self.assertEqual(unchanged.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.line_available.status = PhoneLine.Status.SUSPENDED
+            self.line_available.save(update_fields=["status"])
+        changed = self.client.get(
+            url,
+            params,
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+
     def test_create_view_binds_sim_to_new_line(self):
         new_sim = SIMcard.objects.create(
             iccid="8900000000000000606",
@@ -1659,6 +1964,12 @@ class FakeReconnectRepository:
         self.submit_modified = True
         self.cancel_modified = True
         self.active_session_unique_index_present = True
+        self.index_checks = 0
+        self.index_check_raises = False
+        self.bulk_lookups = []
+        self.bulk_inserts = []
+        self.conflicting_phones = set()
+        self.failing_phones = set()
         self.queued_before_count = 0
         self.count_queued_before_raises = False
 
@@ -1678,7 +1989,41 @@ class FakeReconnectRepository:
         self.active_by_phone[created["phone_number"]] = created
         return created
 
+    def find_active_sessions_by_phones(self, phone_numbers):
+        self.bulk_lookups.append(sorted(phone_numbers))
+        return {
+            phone_number: self.active_by_phone[phone_number]
+            for phone_number in phone_numbers
+            if phone_number in self.active_by_phone
+        }
+
+    def create_sessions(self, documents):
+        self.bulk_inserts.append(len(documents))
+        created = []
+        conflicted = []
+        failed = []
+        for document in documents:
+            phone_number = document["phone_number"]
+            if phone_number in self.conflicting_phones:
+                # Outro processo venceu a corrida pelo indice unico.
+                self.active_by_phone[phone_number] = {
+                    "_id": f"sess-winner-{phone_number}",
+                    "phone_number": phone_number,
+                    "status": "QUEUED",
+                    "attempt": 0,
+                }
+                conflicted.append(phone_number)
+                continue
+            if phone_number in self.failing_phones:
+                failed.append(phone_number)
+                continue
+            created.append(self.create_session(document))
+        return created, conflicted, failed
+
     def has_active_session_unique_index(self):
+        self.index_checks += 1
+        if self.index_check_raises:
+            raise RuntimeError("mongo indisponivel")
         return self.active_session_unique_index_present
 
     def get_session(self, session_id):
@@ -1934,6 +2279,179 @@ class ReconnectServiceTests(TestCase):
 
         self.assertEqual(repository.created_documents, [])
 
+    def test_start_for_lines_batches_lookup_insert_and_reports_each_line(self):
+        from telecom.services.reconnect_service import ReconnectService
+
+        def create_line(suffix, origem=PhoneLine.Origem.SRVMEMU_01):
+            return PhoneLine.objects.create(
+                phone_number=f"+551199999100{suffix}",
+                sim_card=SIMcard.objects.create(
+                    iccid=f"890000000000000880{suffix}",
+                    carrier="CarrierReconnect",
+                    status=SIMcard.Status.AVAILABLE,
+                ),
+                status=PhoneLine.Status.AVAILABLE,
+                origem=origem,
+            )
+
+        reused_line = create_line("2")
+        conflict_line = create_line("3")
+        ineligible_line = create_line("4", origem=PhoneLine.Origem.SRVMEMU_02)
+        repository = FakeReconnectRepository()
+        repository.active_by_phone["5511999991002"] = {
+            "_id": "sess-existing",
+            "phone_number": "5511999991002",
+            "status": "WAITING_FOR_CODE",
+            "attempt": 1,
+        }
+        repository.conflicting_phones.add("5511999991003")
+        service = ReconnectService(
+            repository=repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "rafael"},
+        )
+
+        with self.assertNumQueries(1):
+            result = service.start_for_lines(
+                [self.line, reused_line, conflict_line, ineligible_line]
+            )
+
+        started = {line.pk: payload for line, payload in result["started"]}
+        reused = {line.pk: payload["session_id"] for line, payload in result["reused"]}
+        self.assertEqual(list(started), [self.line.pk])
+        self.assertEqual(started[self.line.pk]["status"], "QUEUED")
+        self.assertEqual(
+            reused,
+            {
+                reused_line.pk: "sess-existing",
+                conflict_line.pk: "sess-winner-5511999991003",
+            },
+        )
+        self.assertEqual(
+            [line.pk for line, _ in result["skipped"]], [ineligible_line.pk]
+        )
+        self.assertEqual(repository.bulk_inserts, [2])
+        self.assertEqual(len(repository.bulk_lookups), 2)
+        self.assertEqual(repository.index_checks, 1)
+        self.assertEqual(repository.created_documents[0]["device_name"], "Rafael Gomes")
+
+    def test_start_for_lines_reports_repeated_number_as_skipped(self):
+        from telecom.services.reconnect_service import ReconnectService
+
+        twin_line = PhoneLine.objects.create(
+            phone_number="55 11 99999-1000",
+            sim_card=SIMcard.objects.create(
+                iccid="8900000000000008809",
+                carrier="CarrierReconnect",
+                status=SIMcard.Status.AVAILABLE,
+            ),
+            status=PhoneLine.Status.AVAILABLE,
+            origem=PhoneLine.Origem.SRVMEMU_01,
+        )
+        repository = FakeReconnectRepository()
+        service = ReconnectService(
+            repository=repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "rafael"},
+        )
+
+        result = service.start_for_lines([self.line, twin_line])
+
+        self.assertEqual([line.pk for line, _ in result["started"]], [self.line.pk])
+        self.assertEqual(len(result["skipped"]), 1)
+        skipped_line, reason = result["skipped"][0]
+        self.assertEqual(skipped_line.pk, twin_line.pk)
+        self.assertIn("Numero repetido no lote", reason)
+        self.assertEqual(repository.bulk_inserts, [1])
+
+    def test_start_for_lines_keeps_started_sessions_when_others_fail(self):
+        from telecom.services.reconnect_service import ReconnectService
+
+        failing_line = PhoneLine.objects.create(
+            phone_number="5511999991005",
+            sim_card=SIMcard.objects.create(
+                iccid="8900000000000008805",
+                carrier="CarrierReconnect",
+                status=SIMcard.Status.AVAILABLE,
+            ),
+            status=PhoneLine.Status.AVAILABLE,
+            origem=PhoneLine.Origem.SRVMEMU_01,
+        )
+        repository = FakeReconnectRepository()
+        repository.failing_phones.add("5511999991005")
+        service = ReconnectService(
+            repository=repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "rafael"},
+        )
+
+        result = service.start_for_lines([self.line, failing_line])
+
+        self.assertEqual([line.pk for line, _ in result["started"]], [self.line.pk])
+        self.assertEqual(
+            [line.pk for line, _ in result["skipped"]], [failing_line.pk]
+        )
+        self.assertIn("Nao foi possivel registrar", result["skipped"][0][1])
+
+    def test_start_for_line_checks_unique_index_once_per_interval(self):
+        from telecom.services.reconnect_index_health_service import (
+            ReconnectIndexHealth,
+        )
+        from telecom.services.reconnect_service import ReconnectService
+
+        repository = FakeReconnectRepository()
+        service = ReconnectService(
+            repository=repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "rafael"},
+            index_health=ReconnectIndexHealth(check_interval=60),
+        )
+
+        for _ in range(3):
+            service.start_for_line(self.line)
+            repository.active_by_phone.clear()
+
+        self.assertEqual(len(repository.created_documents), 3)
+        self.assertEqual(repository.index_checks, 1)
+        self.assertEqual(service.index_health.status, "ok")
+
+    def test_start_for_line_proceeds_and_reports_error_when_index_check_fails(self):
+        from telecom.services.reconnect_index_health_service import (
+            ReconnectIndexHealth,
+        )
+        from telecom.services.reconnect_service import ReconnectService
+
+        repository = FakeReconnectRepository()
+        repository.index_check_raises = True
+        index_health = ReconnectIndexHealth(retry_interval=60)
+        service = ReconnectService(
+            repository=repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "rafael"},
+            index_health=index_health,
+        )
+
+        with self.assertLogs(
+            "telecom.services.reconnect_index_health_service", level="ERROR"
+        ):
+            service.start_for_line(self.line)
+
+        self.assertEqual(len(repository.created_documents), 1)
+        self.assertEqual(index_health.snapshot()["status"], "error")
+
+    def test_missing_unique_index_is_rechecked_after_retry_interval(self):
+        from telecom.services.reconnect_index_health_service import (
+            ReconnectIndexHealth,
+        )
+
+        repository = FakeReconnectRepository()
+        repository.active_session_unique_index_present = False
+        index_health = ReconnectIndexHealth(retry_interval=0)
+
+        with self.assertLogs(
+            "telecom.services.reconnect_index_health_service", level="ERROR"
+        ):
+            self.assertEqual(index_health.check(repository), "missing")
+        repository.active_session_unique_index_present = True
+
+        self.assertEqual(index_health.check(repository), "ok")
+        self.assertEqual(repository.index_checks, 2)
+
     def test_get_status_for_line_returns_terminal_session_by_id_when_not_active(self):
         from telecom.services.reconnect_service import ReconnectService
 
@@ -2479,6 +2997,101 @@ class ReconnectRepositoryQueuePositionTests(TestCase):
             }
         )
 
+    def test_list_queued_session_ids_reads_queue_in_execution_order(self):
+        from telecom.repositories.reconnect_sessions import (
+            MongoReconnectSessionRepository,
+        )
+
+        repository = MongoReconnectSessionRepository(
+            client=MagicMock(),
+            database_name="test_db",
+            collection_name="test_col",
+        )
+        mock_collection = MagicMock()
+        mock_collection.find.return_value.sort.return_value = [
+            {"_id": "sess-1"},
+            {"_id": "sess-2"},
+        ]
+        repository.collection = mock_collection
+
+        result = repository.list_queued_session_ids("srv-01")
+
+        self.assertEqual(result, ["sess-1", "sess-2"])
+        mock_collection.find.assert_called_once_with(
+            {"target_server": "srv-01", "status": "QUEUED", "active_lock": True},
+            {"_id": 1},
+        )
+        mock_collection.find.return_value.sort.assert_called_once_with(
+            [("created_at", 1), ("_id", 1)]
+        )
+
+    def test_create_sessions_reports_duplicate_key_conflicts_per_document(self):
+        from pymongo.errors import BulkWriteError
+
+        from telecom.repositories.reconnect_sessions import (
+            MongoReconnectSessionRepository,
+        )
+
+        repository = MongoReconnectSessionRepository(
+            client=MagicMock(),
+            database_name="test_db",
+            collection_name="test_col",
+        )
+        repository.collection = MagicMock()
+        repository.collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "code": 11000}], "nInserted": 2}
+        )
+        documents = [
+            {"_id": "sess-1", "phone_number": "5511999990001"},
+            {"_id": "sess-2", "phone_number": "5511999990002"},
+            {"_id": "sess-3", "phone_number": "5511999990003"},
+        ]
+
+        created, conflicted, failed = repository.create_sessions(documents)
+
+        self.assertEqual(
+            [document["_id"] for document in created], ["sess-1", "sess-3"]
+        )
+        self.assertEqual(conflicted, ["5511999990002"])
+        self.assertEqual(failed, [])
+        repository.collection.insert_many.assert_called_once_with(
+            documents, ordered=False
+        )
+
+    def test_create_sessions_keeps_inserted_documents_on_mixed_errors(self):
+        from pymongo.errors import BulkWriteError
+
+        from telecom.repositories.reconnect_sessions import (
+            MongoReconnectSessionRepository,
+        )
+
+        repository = MongoReconnectSessionRepository(
+            client=MagicMock(),
+            database_name="test_db",
+            collection_name="test_col",
+        )
+        repository.collection = MagicMock()
+        repository.collection.insert_many.side_effect = BulkWriteError(
+            {
+                "writeErrors": [
+                    {"index": 0, "code": 11000},
+                    {"index": 2, "code": 121, "errmsg": "Document failed validation"},
+                ],
+                "nInserted": 1,
+            }
+        )
+        documents = [
+            {"_id": "sess-1", "phone_number": "5511999990001"},
+            {"_id": "sess-2", "phone_number": "5511999990002"},
+            {"_id": "sess-3", "phone_number": "5511999990003"},
+        ]
+
+        created, conflicted, failed = repository.create_sessions(documents)
+
+        self.assertEqual([document["_id"] for document in created], ["sess-2"])
+        self.assertEqual(conflicted, ["5511999990001"])
+        self.assertEqual(failed, ["5511999990003"])
+
 
 class FakeReconnectWebService:
     def __init__(self):
@@ -2995,6 +3608,98 @@ class PhoneLineReconnectViewsTests(TestCase):
 # WhatsappReconnectHistory — model + service
 # ---------------------------------------------------------------------------
 
+@override_settings(RECONNECT_ENABLED=True)
+class PhoneLineReconnectBulkStartTests(TestCase):
+    def setUp(self):
+        from telecom.services.reconnect_service import ReconnectService
+
+        self.admin = SystemUser.objects.create_user(
+            email="admin.reconnect.bulk@test.com",
+            password="123456",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.lines = [
+            PhoneLine.objects.create(
+                phone_number=f"+55119999940{index:02d}",
+                sim_card=SIMcard.objects.create(
+                    iccid=f"89000000000000940{index:02d}",
+                    carrier="CarrierBulk",
+                    status=SIMcard.Status.AVAILABLE,
+                ),
+                status=PhoneLine.Status.AVAILABLE,
+                origem=PhoneLine.Origem.SRVMEMU_01,
+            )
+            for index in range(3)
+        ]
+        self.repository = FakeReconnectRepository()
+        self.service = ReconnectService(
+            repository=self.repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "rafael"},
+        )
+
+    @patch("telecom.views.get_reconnect_service")
+    def test_bulk_start_queues_sessions_and_opens_history(self, mocked_service):
+        mocked_service.return_value = self.service
+        self.repository.active_by_phone["5511999994001"] = {
+            "_id": "sess-bulk-existing",
+            "phone_number": "5511999994001",
+            "status": "QUEUED",
+            "attempt": 0,
+        }
+        self.client.force_login(self.admin)
+
+        response = self.client.post(
+            reverse("telecom:phoneline_reconnect_bulk_start"),
+            {"phone_line_ids": [line.pk for line in self.lines] + [999999]},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [item["phone_line_id"] for item in data["started"]],
+            [self.lines[0].pk, self.lines[2].pk],
+        )
+        self.assertEqual(data["reused"][0]["session_id"], "sess-bulk-existing")
+        self.assertEqual(data["skipped"][0]["phone_line_id"], 999999)
+        self.assertEqual(self.repository.bulk_inserts, [2])
+        self.assertEqual(
+            WhatsappReconnectHistory.objects.filter(
+                phone_line__in=self.lines, started_by=self.admin
+            ).count(),
+            3,
+        )
+
+    @patch("telecom.views.get_reconnect_service")
+    def test_bulk_start_rejects_empty_selection(self, mocked_service):
+        self.client.force_login(self.admin)
+
+        response = self.client.post(reverse("telecom:phoneline_reconnect_bulk_start"))
+
+        self.assertEqual(response.status_code, 400)
+        mocked_service.assert_not_called()
+
+    @patch("telecom.services.reconnect_service.build_default_reconnect_service")
+    def test_simcard_admin_action_starts_reconnect_for_selected_lines(
+        self, mocked_builder
+    ):
+        mocked_builder.return_value = self.service
+        request = RequestFactory().post("/admin/telecom/simcard/")
+        request.user = self.admin
+        model_admin = admin.site._registry[SIMcard]
+        queryset = SIMcard.objects.filter(
+            pk__in=[line.sim_card_id for line in self.lines]
+        )
+
+        with patch.object(model_admin, "message_user") as message_user:
+            model_admin.reconnect_whatsapp_lines(request, queryset)
+
+        self.assertEqual(self.repository.bulk_inserts, [3])
+        self.assertEqual(
+            WhatsappReconnectHistory.objects.filter(phone_line__in=self.lines).count(),
+            3,
+        )
+        self.assertIn("3 reconexao(oes) iniciada(s)", message_user.call_args.args[1])
+
 class WhatsappReconnectHistoryModelTest(TestCase):
     def setUp(self):
         self.sim = SIMcard.objects.create(
@@ -3101,6 +3806,145 @@ class WhatsappReconnectHistoryModelTest(TestCase):
         self.assertIn("Conectado", str(entry))
 
 
+class FakeBulkSessionRepository:
+    def __init__(self, documents, *, fail_on_call=None):
+        self.documents = documents
+        self.fail_on_call = fail_on_call
+        self.lookups = []
+
+    def get_sessions_by_ids(self, session_ids):
+        self.lookups.append(list(session_ids))
+        if len(self.lookups) == self.fail_on_call:
+            raise RuntimeError("mongo indisponivel")
+        return {
+            session_id: self.documents[session_id]
+            for session_id in session_ids
+            if session_id in self.documents
+        }
+
+    def get_session(self, session_id):
+        raise AssertionError("reconciliacao em lote nao deve buscar por sessao")
+
+
+class WhatsappReconnectHistoryBulkReconcileTest(TestCase):
+    def setUp(self):
+        self.line = PhoneLine.objects.create(
+            phone_number="+5511999993009",
+            sim_card=SIMcard.objects.create(
+                iccid="8900000000000099009",
+                carrier="CarrierBulk",
+                status=SIMcard.Status.AVAILABLE,
+            ),
+            status=PhoneLine.Status.AVAILABLE,
+            origem=PhoneLine.Origem.SRVMEMU_01,
+        )
+        for session_id in (
+            "sess-bulk-connected",
+            "sess-bulk-failed",
+            "sess-bulk-stale",
+            "sess-bulk-active",
+            "sess-bulk-success",
+        ):
+            WhatsappReconnectHistory.objects.create(
+                phone_line=self.line, session_id=session_id, attempt_count=1
+            )
+        WhatsappReconnectHistory.objects.create(
+            phone_line=self.line,
+            session_id="sess-bulk-closed",
+            outcome=WhatsappReconnectHistory.Outcome.CONNECTED,
+        )
+        self.documents = {
+            "sess-bulk-connected": {"status": "CONNECTED", "attempt": 2},
+            "sess-bulk-failed": {
+                "status": "FAILED",
+                "attempt": 3,
+                "error_code": "timeout",
+                "error_message": "Tempo limite excedido",
+            },
+            "sess-bulk-active": {"status": "WAITING_FOR_CODE", "attempt": 1},
+            "sess-bulk-success": {"status": "SUCCESS", "attempt": 1},
+        }
+
+    def test_reconcile_closes_entries_with_one_lookup_and_update_per_chunk(self):
+        from telecom.services.reconnect_history_service import (
+            WhatsappReconnectHistoryService,
+        )
+
+        repository = FakeBulkSessionRepository(self.documents)
+
+        with CaptureQueriesContext(connection) as queries:
+            summary = WhatsappReconnectHistoryService.reconcile_open_entries(
+                repository=repository, chunk_size=2
+            )
+
+        self.assertEqual(len(repository.lookups), 3)
+        updates = [q for q in queries.captured_queries if "UPDATE" in q["sql"]]
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(
+            (summary.scanned, summary.connected, summary.failed, summary.stale),
+            (5, 2, 1, 1),
+        )
+        self.assertEqual((summary.still_open, summary.errors), (1, 0))
+        failed = WhatsappReconnectHistory.objects.get(session_id="sess-bulk-failed")
+        self.assertEqual(failed.outcome, WhatsappReconnectHistory.Outcome.FAILED)
+        self.assertEqual(failed.error_code, "timeout")
+        self.assertEqual(failed.attempt_count, 3)
+        self.assertIsNotNone(failed.finished_at)
+        stale = WhatsappReconnectHistory.objects.get(session_id="sess-bulk-stale")
+        self.assertEqual(stale.outcome, WhatsappReconnectHistory.Outcome.CANCELLED)
+        self.assertEqual(stale.error_code, "stale_session")
+        self.assertEqual(stale.attempt_count, 1)
+        self.assertEqual(
+            list(
+                WhatsappReconnectHistory.objects.filter(
+                    outcome__isnull=True
+                ).values_list("session_id", flat=True)
+            ),
+            ["sess-bulk-active"],
+        )
+
+    def test_reconcile_keeps_chunk_open_when_mongo_lookup_fails(self):
+        from telecom.services.reconnect_history_service import (
+            WhatsappReconnectHistoryService,
+        )
+
+        repository = FakeBulkSessionRepository(self.documents, fail_on_call=1)
+
+        summary = WhatsappReconnectHistoryService.reconcile_open_entries(
+            repository=repository, chunk_size=2
+        )
+
+        self.assertEqual(summary.errors, 2)
+        self.assertEqual(summary.scanned, 5)
+        self.assertFalse(
+            WhatsappReconnectHistory.objects.filter(
+                session_id__in=["sess-bulk-connected", "sess-bulk-failed"],
+                outcome__isnull=False,
+            ).exists()
+        )
+
+    @override_settings(RECONNECT_ENABLED=True)
+    def test_command_reports_counts(self):
+        from django.core.management import call_command
+
+        repository = FakeBulkSessionRepository(self.documents)
+        stdout = io.StringIO()
+
+        with patch(
+            "telecom.repositories.reconnect_sessions."
+            "MongoReconnectSessionRepository.from_settings",
+            return_value=repository,
+        ):
+            call_command("reconcile_reconnect_history", stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("Conectadas: 2", output)
+        self.assertIn("Falhas: 1", output)
+        self.assertIn("Obsoletas (sem sessao no Mongo): 1", output)
+        self.assertIn("4 entrada(s) fechada(s).", output)
+        self.assertEqual(len(repository.lookups), 1)
+
+
 @override_settings(RECONNECT_ENABLED=True)
 class WhatsappReconnectHistoryViewsTest(TestCase):
     def setUp(self):
@@ -3923,3 +4767,431 @@ class OperatorLinkedLinesViewTests(TestCase):
         )
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, reverse("telecom:operator_lines"))
+
+
+class InventoryExportViewTest(TestCase):
+    def setUp(self):
+        self.admin = SystemUser.objects.create_user(
+            email="export.admin@test.com",
+            password="123456",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.supervisor = SystemUser.objects.create_user(
+            email="export.super@test.com",
+            password="123456",
+            role=SystemUser.Role.SUPER,
+        )
+        self.employee = Employee.objects.create(
+            full_name="Export Employee",
+            corporate_email=self.supervisor.email,
+            employee_id="EXP100",
+            teams="Joinville",
+            status=Employee.Status.ACTIVE,
+        )
+        self.allocated_line = PhoneLine.objects.create(
+            phone_number="+551188880001",
+            sim_card=SIMcard.objects.create(
+                iccid="8900000000000088001", carrier="CarrierExp"
+            ),
+            status=PhoneLine.Status.AVAILABLE,
+            canal=PhoneLine.Canal.WEB,
+        )
+        AllocationService.allocate_line(
+            employee=self.employee,
+            phone_line=self.allocated_line,
+            allocated_by=self.admin,
+        )
+        self.free_line = PhoneLine.objects.create(
+            phone_number="+551188880002",
+            sim_card=SIMcard.objects.create(
+                iccid="8900000000000088002", carrier="CarrierExp"
+            ),
+            status=PhoneLine.Status.AVAILABLE,
+        )
+
+    def _csv_rows(self, response):
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        return list(csv.reader(content.splitlines()))
+
+    def test_admin_streams_full_inventory_csv(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse("telecom:phoneline_inventory_export"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = self._csv_rows(response)
+        self.assertEqual(rows[0][0], "Linha")
+        self.assertEqual(
+            rows[1],
+            [
+                "+551188880001",
+                "8900000000000088001",
+                "CarrierExp",
+                "",
+                "Whatsapp Web",
+                "Export Employee",
+                self.supervisor.email,
+                "Alocado",
+            ],
+        )
+        self.assertEqual(rows[2][0], "+551188880002")
+        self.assertEqual(rows[2][5:8], ["", "", "Disponível"])
+
+    def test_export_respects_scope_and_filters(self):
+        self.client.force_login(self.supervisor)
+
+        response = self.client.get(reverse("telecom:phoneline_inventory_export"))
+        self.assertEqual(
+            [row[0] for row in self._csv_rows(response)[1:]], ["+551188880001"]
+        )
+
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse("telecom:phoneline_inventory_export"),
+            {"status": PhoneLine.Status.AVAILABLE},
+        )
+        self.assertEqual(
+            [row[0] for row in self._csv_rows(response)[1:]], ["+551188880002"]
+        )
+
+    def test_admin_exports_xlsx(self):
+        from openpyxl import load_workbook
+
+        self.client.force_login(self.admin)
+
+        response = self.client.get(
+            reverse("telecom:phoneline_inventory_export"), {"format": "xlsx"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(".xlsx", response["Content-Disposition"])
+        workbook = load_workbook(
+            io.BytesIO(b"".join(response.streaming_content)), read_only=True
+        )
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][0], "+551188880001")
+
+
+class FakeSessionChangeStream:
+    def __init__(self, changes):
+        self.changes = list(changes)
+        self.closed = False
+
+    def try_next(self):
+        return self.changes.pop(0) if self.changes else None
+
+    def close(self):
+        self.closed = True
+
+
+class ReconnectSessionHubTests(TestCase):
+    def _repository(self, *statuses):
+        repository = FakeReconnectRepository()
+        documents = [
+            {"_id": "sess-hub-1", "phone_number": "5511999991000", "status": status}
+            for status in statuses
+        ]
+        repository.get_calls = 0
+
+        def get_session(session_id):
+            repository.get_calls += 1
+            return documents[min(repository.get_calls, len(documents)) - 1]
+
+        repository.get_session = get_session
+        return repository
+
+    async def _collect(self, updates, count):
+        received = []
+        async for document in updates:
+            if document is not None:
+                received.append(document["status"])
+            if len(received) == count:
+                break
+        await updates.aclose()
+        return received
+
+    async def test_polling_is_shared_and_only_emits_changes(self):
+        from telecom.services.reconnect_stream_service import ReconnectSessionHub
+
+        repository = self._repository(
+            "QUEUED", "QUEUED", "WAITING_FOR_CODE", "WAITING_FOR_CODE", "CONNECTED"
+        )
+        hub = ReconnectSessionHub(repository, poll_interval=0.001)
+
+        first, second = await asyncio.gather(
+            self._collect(hub.subscribe("sess-hub-1", heartbeat_seconds=1), 3),
+            self._collect(hub.subscribe("sess-hub-1", heartbeat_seconds=1), 3),
+        )
+
+        self.assertEqual(first, ["QUEUED", "WAITING_FOR_CODE", "CONNECTED"])
+        self.assertEqual(second, first)
+        self.assertEqual(repository.get_calls, 5)
+
+    async def test_change_stream_pushes_full_documents(self):
+        from telecom.services.reconnect_stream_service import ReconnectSessionHub
+
+        repository = self._repository("QUEUED")
+        stream = FakeSessionChangeStream(
+            [
+                None,
+                {"fullDocument": {"_id": "sess-hub-1", "status": "WAITING_FOR_CODE"}},
+                {"fullDocument": {"_id": "sess-hub-1", "status": "FAILED"}},
+            ]
+        )
+        repository.watch_session = lambda session_id: stream
+        hub = ReconnectSessionHub(repository)
+
+        received = await self._collect(hub.subscribe("sess-hub-1"), 3)
+
+        self.assertEqual(received, ["QUEUED", "WAITING_FOR_CODE", "FAILED"])
+        self.assertEqual(repository.get_calls, 1)
+        self.assertTrue(hub.change_streams_available)
+
+    async def test_falls_back_to_polling_without_change_streams(self):
+        from telecom.services.reconnect_stream_service import ReconnectSessionHub
+
+        repository = self._repository("QUEUED", "CANCELLED")
+
+        def watch_session(session_id):
+            raise RuntimeError("$changeStream is only supported on replica sets")
+
+        repository.watch_session = watch_session
+        hub = ReconnectSessionHub(repository, poll_interval=0.001)
+
+        received = await self._collect(hub.subscribe("sess-hub-1"), 2)
+
+        self.assertEqual(received, ["QUEUED", "CANCELLED"])
+        self.assertFalse(hub.change_streams_available)
+
+
+@override_settings(
+    RECONNECT_ENABLED=True,
+    RECONNECT_STATUS_STREAM_ENABLED=True,
+    RECONNECT_TARGET_SERVER_BY_ORIGEM={"SRVMEMU-01": "srv-01"},
+)
+class PhoneLineReconnectEventsViewTests(TestCase):
+    def setUp(self):
+        from telecom.services.reconnect_service import ReconnectService
+        from telecom.services.reconnect_stream_service import ReconnectSessionHub
+
+        self.admin = SystemUser.objects.create_user(
+            email="admin.reconnect.events@test.com",
+            password="123456",
+            role=SystemUser.Role.ADMIN,
+        )
+        self.line = PhoneLine.objects.create(
+            phone_number="+5511999992000",
+            sim_card=SIMcard.objects.create(
+                iccid="8900000000000009201", carrier="CarrierEvents"
+            ),
+            status=PhoneLine.Status.AVAILABLE,
+            origem=PhoneLine.Origem.SRVMEMU_01,
+        )
+        self.repository = FakeReconnectRepository()
+        self.session = {
+            "_id": "sess-events-1",
+            "phone_number": "5511999992000",
+            "status": "WAITING_FOR_CODE",
+            "attempt": 1,
+        }
+        self.repository.by_id[self.session["_id"]] = self.session
+        self.service = ReconnectService(
+            repository=self.repository,
+            target_server_by_origem={"SRVMEMU-01": "srv-01"},
+        )
+        self.hub = ReconnectSessionHub(self.repository, poll_interval=0.001)
+        self.url = reverse("telecom:phoneline_reconnect_events", args=[self.line.pk])
+
+    async def _read_events(self, response):
+        events = []
+        async for chunk in response.streaming_content:
+            text = chunk.decode() if isinstance(chunk, bytes) else chunk
+            if text.startswith("event: status"):
+                events.append(json.loads(text.split("data: ", 1)[1]))
+            if events and events[-1]["is_terminal"]:
+                break
+            self.session["status"] = "CONNECTED"
+        return events
+
+    async def test_streams_changes_until_terminal_and_closes_history(self):
+        await self.async_client.aforce_login(self.admin)
+
+        with (
+            patch("telecom.views.get_reconnect_service", return_value=self.service),
+            patch("telecom.views.get_reconnect_session_hub", return_value=self.hub),
+            patch(
+                "telecom.services.reconnect_history_service."
+                "WhatsappReconnectHistoryService.close"
+            ) as close_history,
+        ):
+            response = await self.async_client.get(
+                self.url, {"session_id": "sess-events-1"}
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            events = await self._read_events(response)
+
+        self.assertEqual(
+            [event["status"] for event in events], ["WAITING_FOR_CODE", "CONNECTED"]
+        )
+        close_history.assert_called_once()
+
+    @override_settings(RECONNECT_STATUS_STREAM_ENABLED=False)
+    async def test_returns_not_found_when_stream_is_disabled(self):
+        await self.async_client.aforce_login(self.admin)
+
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CachedReconnectSessionRepositoryTests(TestCase):
+    def setUp(self):
+        from telecom.repositories.cached_reconnect_sessions import (
+            CachedReconnectSessionRepository,
+            SingleFlightTTLCache,
+        )
+
+        self.inner = FakeReconnectRepository()
+        self.session = {
+            "_id": "sess-cache-1",
+            "phone_number": "5511999993000",
+            "status": "WAITING_FOR_CODE",
+            "attempt": 1,
+        }
+        self.inner.by_id[self.session["_id"]] = self.session
+        self.inner.active_by_phone[self.session["phone_number"]] = self.session
+        self.inner.get_calls = 0
+        original_get_session = self.inner.get_session
+
+        def counting_get_session(session_id):
+            self.inner.get_calls += 1
+            return original_get_session(session_id)
+
+        self.inner.get_session = counting_get_session
+        self.repository = CachedReconnectSessionRepository(
+            self.inner, cache=SingleFlightTTLCache(ttl=60)
+        )
+
+    def test_repeated_reads_hit_mongo_once_until_a_write(self):
+        for _ in range(3):
+            self.assertEqual(self.repository.get_session("sess-cache-1"), self.session)
+        self.assertEqual(self.inner.get_calls, 1)
+
+        self.repository.submit_pair_code(
+            session_id="sess-cache-1",
+            attempt=1,
+            pair_code="ABCD1234",
+            submitted_at=timezone.now(),
+        )
+        self.repository.get_session("sess-cache-1")
+
+        self.assertEqual(self.inner.get_calls, 2)
+        self.assertEqual(len(self.inner.submit_calls), 1)
+
+    def test_cancel_invalidates_active_session_lookup_by_phone(self):
+        phone_number = self.session["phone_number"]
+        self.session["status"] = "QUEUED"
+        self.assertIsNotNone(self.repository.find_active_session_by_phone(phone_number))
+
+        self.repository.cancel_session(
+            session_id="sess-cache-1", requested_at=timezone.now()
+        )
+
+        self.assertIsNone(self.repository.find_active_session_by_phone(phone_number))
+
+    def test_concurrent_reads_share_a_single_round_trip(self):
+        import threading
+
+        release = threading.Event()
+        original_get_session = self.inner.get_session
+
+        def slow_get_session(session_id):
+            release.wait(timeout=5)
+            return original_get_session(session_id)
+
+        self.inner.get_session = slow_get_session
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    self.repository.get_session("sess-cache-1")
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(results, [self.session] * 5)
+        self.assertEqual(self.inner.get_calls, 1)
+
+    def test_delegates_other_repository_methods(self):
+        self.assertTrue(self.repository.has_active_session_unique_index())
+
+    def _enable_queue_snapshot(self, queued_ids):
+        self.inner.queue_reads = 0
+
+        def list_queued_session_ids(target_server):
+            self.inner.queue_reads += 1
+            return list(queued_ids)
+
+        self.inner.list_queued_session_ids = list_queued_session_ids
+
+    def test_queue_positions_share_one_snapshot_per_target_server(self):
+        self._enable_queue_snapshot(["sess-q-1", "sess-q-2", "sess-q-3"])
+
+        positions = [
+            self.repository.get_queue_position(
+                target_server="srv-01", session_id=session_id
+            )
+            for session_id in ("sess-q-3", "sess-q-1", "sess-q-2", "sess-q-9")
+        ]
+
+        self.assertEqual(positions, [3, 1, 2, None])
+        self.assertEqual(self.inner.queue_reads, 1)
+
+    def test_cancel_invalidates_queue_snapshot(self):
+        self._enable_queue_snapshot(["sess-cache-1"])
+        self.repository.get_queue_position(
+            target_server="srv-01", session_id="sess-cache-1"
+        )
+
+        self.repository.cancel_session(
+            session_id="sess-cache-1", requested_at=timezone.now()
+        )
+        self.repository.get_queue_position(
+            target_server="srv-01", session_id="sess-cache-1"
+        )
+
+        self.assertEqual(self.inner.queue_reads, 2)
+
+    def test_service_uses_snapshot_and_falls_back_to_count(self):
+        from telecom.services.reconnect_service import ReconnectService
+
+        self._enable_queue_snapshot(["sess-q-1", "sess-q-2"])
+        self.inner.queued_before_count = 7
+        service = ReconnectService(
+            repository=self.repository,
+            target_server_by_origem={PhoneLine.Origem.SRVMEMU_01: "srv-01"},
+        )
+        base_document = {
+            "target_server": "srv-01",
+            "created_at": timezone.now(),
+        }
+
+        in_snapshot = service._resolve_queue_position(
+            {**base_document, "_id": "sess-q-2"}, "QUEUED"
+        )
+        missing = service._resolve_queue_position(
+            {**base_document, "_id": "sess-q-new"}, "QUEUED"
+        )
+
+        self.assertEqual(in_snapshot, 2)
+        self.assertEqual(missing, 8)
+        self.assertEqual(self.inner.queue_reads, 1)
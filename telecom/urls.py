@@ -5,9 +5,12 @@ from .views import (
     BlipConfigurationListView,
     BlipConfigurationUpdateView,
     ExportPhoneLinesCSVView,
+    InventoryExportView,
     OperatorLinkedLinesView,
     PhoneLineCreateView,
+    PhoneLineReconnectBulkStartView,
     PhoneLineReconnectCancelView,
+    PhoneLineReconnectEventsView,
     PhoneLineReconnectHistoryView,
     PhoneLineReconnectStartView,
     PhoneLineReconnectStatusView,
@@ -47,11 +50,21 @@ urlpatterns = [
     path(
         "phonelines/<int:pk>/", PhoneLineDetailView.as_view(), name="phoneline_detail"
     ),
+    path(
+        "phonelines/reconnect/bulk-start/",
+        PhoneLineReconnectBulkStartView.as_view(),
+        name="phoneline_reconnect_bulk_start",
+    ),
     path(
         "phonelines/<int:pk>/reconnect/status/",
         PhoneLineReconnectStatusView.as_view(),
         name="phoneline_reconnect_status",
     ),
+    path(
+        "phonelines/<int:pk>/reconnect/events/",
+        PhoneLineReconnectEventsView.as_view(),
+        name="phoneline_reconnect_events",
+    ),
     path(
         "phonelines/<int:pk>/reconnect/start/",
         PhoneLineReconnectStartView.as_view(),
@@ -96,4 +109,9 @@ urlpatterns = [
         ExportPhoneLinesCSVView.as_view(),
         name="phoneline_history_export",
     ),
+    path(
+        "phonelines/export/",
+        InventoryExportView.as_view(),
+        name="phoneline_inventory_export",
+    ),
 ]
@@ -1,15 +1,18 @@
+import asyncio
 import csv
 import logging
 
+from asgiref.sync import sync_to_async
 from django import forms
 from django.conf import settings
 from django.contrib import messages
 from django.db import transaction
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Prefetch
 from django.core.exceptions import PermissionDenied
-from django.http import Http404, HttpResponse, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 from django.views.generic import (
     CreateView,
@@ -23,7 +26,15 @@ from django.views.generic import (
 from allocations.models import LineAllocation
 from core.exceptions.domain_exceptions import BusinessRuleException
 from core.mixins import RoleRequiredMixin, StandardPaginationMixin
+from core.services.keyset_pagination_service import keyset_page
+from core.services.number_search_service import filter_by_number
 from core.services.allocation_service import AllocationService
+from core.services.version_stamp_service import (
+    INVENTORY_VERSION_NAMESPACE,
+    build_request_etag,
+    get_not_modified_response,
+    set_conditional_headers,
+)
 from core.validation import parse_non_negative_int
 from users.models import SystemUser
 
@@ -34,7 +45,18 @@ from .forms import (
     SIMcardCreateWithLineForm,
 )
 from .models import BlipConfiguration, PhoneLine, PhoneLineHistory, SIMcard
+from .services.inventory_counters_service import get_cached_inventory_counters
+from .services.inventory_export_service import (
+    get_inventory_export_queryset,
+    iter_inventory_rows,
+    stream_inventory_csv,
+    stream_inventory_xlsx,
+)
 from .services.reconnect_service import build_default_reconnect_service
+from .services.reconnect_stream_service import (
+    format_sse_event,
+    get_reconnect_session_hub,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -138,11 +160,16 @@ class SIMcardListView(RoleRequiredMixin, ListView):
             status_filter = ""
 
         if search_query:
-            queryset = queryset.filter(iccid__icontains=search_query)
+            queryset = filter_by_number(queryset, search_query, "iccid")
 
         return queryset.order_by("iccid"), search_query, status_filter
 
     def _handle_ajax_request(self, request):
+        etag = build_request_etag(request, INVENTORY_VERSION_NAMESPACE)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
         offset = parse_non_negative_int(request.GET.get("offset", 0), default=0)
         limit = max(
             parse_non_negative_int(request.GET.get("limit", self.chunk_size), 10), 1
@@ -167,8 +194,11 @@ class SIMcardListView(RoleRequiredMixin, ListView):
             for sim in simcards
         ]
 
-        return JsonResponse(
-            {"data": data, "has_more": has_more, "offset": offset + len(simcards)}
+        return set_conditional_headers(
+            JsonResponse(
+                {"data": data, "has_more": has_more, "offset": offset + len(simcards)}
+            ),
+            etag,
         )
 
     def get_queryset(self):
@@ -267,9 +297,8 @@ class PhoneLineListView(StandardPaginationMixin, RoleRequiredMixin, ListView):
             status_filter = ""
 
         if search_query:
-            queryset = queryset.filter(
-                Q(phone_number__icontains=search_query)
-                | Q(sim_card__iccid__icontains=search_query)
+            queryset = filter_by_number(
+                queryset, search_query, "phone_number", "sim_card__iccid"
             )
 
         return queryset.order_by("phone_number"), search_query, status_filter
@@ -349,6 +378,11 @@ class PhoneLineDetailView(RoleRequiredMixin, DetailView):
                 "telecom:phoneline_reconnect_status",
                 args=[self.object.pk],
             )
+            if settings.RECONNECT_STATUS_STREAM_ENABLED:
+                context["reconnect_events_url"] = reverse(
+                    "telecom:phoneline_reconnect_events",
+                    args=[self.object.pk],
+                )
             context["reconnect_start_url"] = reverse(
                 "telecom:phoneline_reconnect_start",
                 args=[self.object.pk],
@@ -381,13 +415,36 @@ class PhoneLineReconnectBaseView(RoleRequiredMixin, View):
         return get_reconnect_service()
 
 
-class PhoneLineReconnectStatusView(PhoneLineReconnectBaseView):
-    def get(self, request, *args, **kwargs):
-        from telecom.models import WhatsappReconnectHistory
-        from telecom.services.reconnect_history_service import (
-            WhatsappReconnectHistoryService,
+def close_reconnect_history_if_terminal(payload):
+    """Fecha o historico local quando o payload traz um status terminal."""
+    from telecom.models import WhatsappReconnectHistory
+    from telecom.services.reconnect_history_service import (
+        WhatsappReconnectHistoryService,
+    )
+
+    if not (payload and payload.get("is_terminal") and payload.get("session_id")):
+        return
+    raw_status = normalize_reconnect_status(
+        payload.get("raw_status") or payload.get("status", "")
+    )
+    outcome_map = {
+        "CONNECTED": WhatsappReconnectHistory.Outcome.CONNECTED,
+        "FAILED": WhatsappReconnectHistory.Outcome.FAILED,
+        "CANCELLED": WhatsappReconnectHistory.Outcome.CANCELLED,
+    }
+    outcome = outcome_map.get(raw_status)
+    if outcome:
+        WhatsappReconnectHistoryService.close(
+            session_id=payload["session_id"],
+            outcome=outcome,
+            error_code=payload.get("error_code") or "",
+            error_message=payload.get("error_message") or "",
+            attempt_count=payload.get("attempt") or 0,
         )
 
+
+class PhoneLineReconnectStatusView(PhoneLineReconnectBaseView):
+    def get(self, request, *args, **kwargs):
         phone_line = self.get_phone_line()
         session_id = request.GET.get("session_id", "").strip()
         try:
@@ -406,26 +463,88 @@ class PhoneLineReconnectStatusView(PhoneLineReconnectBaseView):
             )
             return JsonResponse({"error": str(exc)}, status=400)
 
-        if payload and payload.get("is_terminal") and payload.get("session_id"):
-            raw_status = normalize_reconnect_status(
-                payload.get("raw_status") or payload.get("status", "")
+        close_reconnect_history_if_terminal(payload)
+        return JsonResponse(payload or empty_reconnect_payload())
+
+
+class PhoneLineReconnectEventsView(View):
+    """
+    Status da reconexao via Server-Sent Events (servido pelo config.asgi).
+
+    Emite o estado atual e depois apenas quando o documento da sessao muda,
+    encerrando no status terminal ou apos RECONNECT_STATUS_STREAM_MAX_SECONDS;
+    o EventSource do navegador reconecta sozinho nesse ultimo caso.
+    """
+
+    allowed_roles = RECONNECT_ALLOWED_ROLES
+
+    async def get(self, request, pk):
+        user = await request.auser()
+        if not user.is_authenticated:
+            raise PermissionDenied("Usuario nao autenticado.")
+        allowed = {role.lower() for role in self.allowed_roles}
+        if (user.role or "").lower() not in allowed:
+            raise PermissionDenied("Acesso negado: funcao insuficiente.")
+        stream_enabled = settings.RECONNECT_STATUS_STREAM_ENABLED
+        if not settings.RECONNECT_ENABLED or not stream_enabled:
+            return JsonResponse(
+                {"error": "Acompanhamento em tempo real desabilitado."}, status=404
             )
-            outcome_map = {
-                "CONNECTED": WhatsappReconnectHistory.Outcome.CONNECTED,
-                "FAILED": WhatsappReconnectHistory.Outcome.FAILED,
-                "CANCELLED": WhatsappReconnectHistory.Outcome.CANCELLED,
-            }
-            outcome = outcome_map.get(raw_status)
-            if outcome:
-                WhatsappReconnectHistoryService.close(
-                    session_id=payload["session_id"],
-                    outcome=outcome,
-                    error_code=payload.get("error_code") or "",
-                    error_message=payload.get("error_message") or "",
-                    attempt_count=payload.get("attempt") or 0,
-                )
 
-        return JsonResponse(payload or empty_reconnect_payload())
+        phone_line = await sync_to_async(self.get_phone_line)(user, pk)
+        service = get_reconnect_service()
+        try:
+            payload = await sync_to_async(service.get_status_for_line)(
+                phone_line,
+                session_id=request.GET.get("session_id", "").strip(),
+            )
+        except BusinessRuleException as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+
+        response = StreamingHttpResponse(
+            self._stream(service, payload or empty_reconnect_payload()),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def get_phone_line(self, user, pk):
+        return get_object_or_404(
+            get_visible_phone_lines_queryset(user).filter(
+                origem=PhoneLine.Origem.SRVMEMU_01
+            ),
+            pk=pk,
+        )
+
+    async def _stream(self, service, payload):
+        await sync_to_async(close_reconnect_history_if_terminal)(payload)
+        yield format_sse_event(payload)
+        if not payload.get("session_id") or payload.get("is_terminal"):
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.RECONNECT_STATUS_STREAM_MAX_SECONDS
+        updates = get_reconnect_session_hub().subscribe(payload["session_id"])
+        try:
+            async for document in updates:
+                if document is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    latest = await sync_to_async(service.serialize_session)(document)
+                    if latest.get("is_terminal"):
+                        await sync_to_async(close_reconnect_history_if_terminal)(
+                            latest
+                        )
+                    if latest != payload:
+                        payload = latest
+                        yield format_sse_event(payload)
+                    if payload.get("is_terminal"):
+                        return
+                if loop.time() >= deadline:
+                    return
+        finally:
+            await updates.aclose()
 
 
 class PhoneLineReconnectStartView(PhoneLineReconnectBaseView):
@@ -457,6 +576,80 @@ class PhoneLineReconnectStartView(PhoneLineReconnectBaseView):
         return JsonResponse(payload)
 
 
+class PhoneLineReconnectBulkStartView(RoleRequiredMixin, View):
+    """Inicia a reconexao de varias linhas SRVMEMU-01 (phone_line_ids no POST)."""
+
+    allowed_roles = RECONNECT_ALLOWED_ROLES
+    max_lines = 200
+
+    def post(self, request, *args, **kwargs):
+        from telecom.services.reconnect_history_service import (
+            WhatsappReconnectHistoryService,
+        )
+
+        raw_ids = request.POST.getlist("phone_line_ids")
+        try:
+            line_ids = {int(raw_id) for raw_id in raw_ids}
+        except ValueError:
+            return JsonResponse({"error": "Linhas invalidas."}, status=400)
+        if not line_ids:
+            return JsonResponse({"error": "Nenhuma linha informada."}, status=400)
+        if len(line_ids) > self.max_lines:
+            return JsonResponse(
+                {"error": f"Selecione no maximo {self.max_lines} linhas."}, status=400
+            )
+        if not settings.RECONNECT_ENABLED:
+            return JsonResponse(
+                {"error": "Reconexao via Mongo nao esta habilitada."}, status=400
+            )
+
+        phone_lines = list(
+            get_visible_phone_lines_queryset(request.user)
+            .filter(pk__in=line_ids, origem=PhoneLine.Origem.SRVMEMU_01)
+            .order_by("pk")
+        )
+        try:
+            result = get_reconnect_service().start_for_lines(phone_lines)
+        except BusinessRuleException as exc:
+            logger.warning(
+                "Bulk reconnect start rejected by business rule",
+                extra={
+                    "phone_line_ids": sorted(line_ids),
+                    "user_id": getattr(request.user, "pk", None),
+                },
+            )
+            return JsonResponse({"error": str(exc)}, status=400)
+
+        WhatsappReconnectHistoryService.open_many(
+            entries=[
+                (phone_line, payload["session_id"])
+                for phone_line, payload in result["started"] + result["reused"]
+            ],
+            started_by=request.user,
+        )
+        found_ids = {phone_line.pk for phone_line in phone_lines}
+        skipped = [
+            {"phone_line_id": phone_line.pk, "error": reason}
+            for phone_line, reason in result["skipped"]
+        ] + [
+            {"phone_line_id": line_id, "error": "Linha nao encontrada."}
+            for line_id in sorted(line_ids - found_ids)
+        ]
+        return JsonResponse(
+            {
+                "started": [
+                    {"phone_line_id": phone_line.pk, **payload}
+                    for phone_line, payload in result["started"]
+                ],
+                "reused": [
+                    {"phone_line_id": phone_line.pk, **payload}
+                    for phone_line, payload in result["reused"]
+                ],
+                "skipped": skipped,
+            }
+        )
+
+
 class PhoneLineReconnectHistoryView(PhoneLineReconnectBaseView):
     def get(self, request, *args, **kwargs):
         if not settings.RECONNECT_ENABLED:
@@ -750,70 +943,92 @@ class TelecomOverviewView(RoleRequiredMixin, TemplateView):
             return self._handle_ajax_request(request)
         return super().get(request, *args, **kwargs)
 
-    def _handle_ajax_request(self, request):
-        """Retorna dados em JSON para lazy loading"""
-        table_type = request.GET.get("table", "main")
-        offset = parse_non_negative_int(request.GET.get("offset", 0), default=0)
-        limit = max(parse_non_negative_int(request.GET.get("limit", 10), 10), 1)
+    main_ordering = ("phone_number", "id")
+    recent_ordering = ("-updated_at", "-id")
+    initial_page_size = 10
+
+    def _with_active_allocations(self, lines_qs):
+        return lines_qs.select_related("sim_card").prefetch_related(
+            Prefetch(
+                "allocations",
+                queryset=LineAllocation.objects.filter(is_active=True)
+                .select_related("employee")
+                .order_by("-allocated_at"),
+                to_attr="active_allocations",
+            )
+        )
 
-        base_lines = get_visible_phone_lines_queryset(request.user)
-        valid_statuses = {choice[0] for choice in PhoneLine.Status.choices}
+    def _get_main_filters(self, params):
+        line_filter = params.get("line", "").strip()
+        status_filter = params.get("status", "").strip()
+        if status_filter not in PhoneLine.Status.values:
+            status_filter = ""
+        return line_filter, status_filter
 
-        if table_type == "main":
-            line_filter = request.GET.get("line", "").strip()
-            status_filter = request.GET.get("status", "").strip()
-
-            lines_qs = (
-                base_lines.select_related("sim_card")
-                .prefetch_related(
-                    Prefetch(
-                        "allocations",
-                        queryset=LineAllocation.objects.filter(is_active=True)
-                        .select_related("employee")
-                        .order_by("-allocated_at"),
-                        to_attr="active_allocations",
-                    )
-                )
-                .order_by("phone_number")
+    def _get_recent_filters(self, params):
+        search_query = params.get("search", "").strip()
+        status_filter_recent = params.get("status_recent", "").strip()
+        if status_filter_recent not in PhoneLine.Status.values:
+            status_filter_recent = ""
+        return search_query, status_filter_recent
+
+    def _main_lines_page(self, base_lines, params, cursor="", limit=None):
+        line_filter, status_filter = self._get_main_filters(params)
+        lines_qs = self._with_active_allocations(base_lines)
+        if line_filter:
+            lines_qs = filter_by_number(lines_qs, line_filter, "phone_number")
+        if status_filter:
+            lines_qs = lines_qs.filter(status=status_filter)
+        return keyset_page(
+            lines_qs,
+            self.main_ordering,
+            cursor=cursor,
+            limit=limit or self.initial_page_size,
+        )
+
+    def _recent_lines_page(self, base_lines, params, cursor="", limit=None):
+        search_query, status_filter_recent = self._get_recent_filters(params)
+        lines_qs = self._with_active_allocations(base_lines)
+        if search_query:
+            lines_qs = filter_by_number(
+                lines_qs, search_query, "phone_number", "sim_card__iccid"
             )
+        if status_filter_recent:
+            lines_qs = lines_qs.filter(status=status_filter_recent)
+        return keyset_page(
+            lines_qs,
+            self.recent_ordering,
+            cursor=cursor,
+            limit=limit or self.initial_page_size,
+        )
 
-            if line_filter:
-                lines_qs = lines_qs.filter(phone_number__icontains=line_filter)
-            if status_filter in valid_statuses:
-                lines_qs = lines_qs.filter(status=status_filter)
+    def _handle_ajax_request(self, request):
+        """Retorna dados em JSON para lazy loading (paginacao por cursor)."""
+        etag = build_request_etag(request, INVENTORY_VERSION_NAMESPACE)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
 
-            lines = list(lines_qs[offset : offset + limit])
-            has_more = lines_qs.count() > (offset + limit)
+        table_type = request.GET.get("table", "main")
+        cursor = request.GET.get("cursor", "")
+        limit = max(
+            parse_non_negative_int(
+                request.GET.get("limit", self.initial_page_size),
+                self.initial_page_size,
+            ),
+            1,
+        )
 
+        base_lines = get_visible_phone_lines_queryset(request.user)
+        if table_type == "main":
+            lines, next_cursor, has_more = self._main_lines_page(
+                base_lines, request.GET, cursor=cursor, limit=limit
+            )
         else:  # table_type == 'recent'
-            search_query = request.GET.get("search", "").strip()
-            status_filter_recent = request.GET.get("status_recent", "").strip()
-
-            lines_qs = (
-                base_lines.select_related("sim_card")
-                .prefetch_related(
-                    Prefetch(
-                        "allocations",
-                        queryset=LineAllocation.objects.filter(is_active=True)
-                        .select_related("employee")
-                        .order_by("-allocated_at"),
-                        to_attr="active_allocations",
-                    )
-                )
-                .order_by("-updated_at")
+            lines, next_cursor, has_more = self._recent_lines_page(
+                base_lines, request.GET, cursor=cursor, limit=limit
             )
 
-            if search_query:
-                lines_qs = lines_qs.filter(
-                    Q(phone_number__icontains=search_query)
-                    | Q(sim_card__iccid__icontains=search_query)
-                )
-            if status_filter_recent in valid_statuses:
-                lines_qs = lines_qs.filter(status=status_filter_recent)
-
-            lines = list(lines_qs[offset : offset + limit])
-            has_more = lines_qs.count() > (offset + limit)
-
         # Formatar dados para JSON
         data = []
         can_manage_telecom = user_can_manage_telecom(request.user)
@@ -852,8 +1067,11 @@ class TelecomOverviewView(RoleRequiredMixin, TemplateView):
 
             data.append(line_data)
 
-        return JsonResponse(
-            {"data": data, "has_more": has_more, "offset": offset + len(lines)}
+        return set_conditional_headers(
+            JsonResponse(
+                {"data": data, "has_more": has_more, "next_cursor": next_cursor}
+            ),
+            etag,
         )
 
     def get_context_data(self, **kwargs):
@@ -862,50 +1080,28 @@ class TelecomOverviewView(RoleRequiredMixin, TemplateView):
         can_use_reconnect = settings.RECONNECT_ENABLED and user_can_use_reconnect(
             self.request.user
         )
-        context["total_simcards"] = SIMcard.objects.filter(is_deleted=False).count()
         base_lines = get_visible_phone_lines_queryset(self.request.user)
-        context["total_lines"] = base_lines.count()
-        counts = self._line_status_counts(base_lines)
-        context["allocated_lines"] = LineAllocation.objects.filter(
-            is_active=True,
-            phone_line_id__in=base_lines.values("id"),
-        ).count()
+        counters = get_cached_inventory_counters(
+            "telecom_overview",
+            self.request.user,
+            lambda: self._build_inventory_counters(base_lines),
+        )
+        counts = counters["status_counts"]
+        context["total_simcards"] = counters["total_simcards"]
+        context["total_lines"] = counters["total_lines"]
+        context["allocated_lines"] = counters["allocated_lines"]
         context["available_lines"] = counts.get(PhoneLine.Status.AVAILABLE, 0)
         context["cancelled_lines"] = counts.get(PhoneLine.Status.CANCELLED, 0)
         context["blocked_lines"] = counts.get(PhoneLine.Status.SUSPENDED, 0)
 
-        line_filter = self.request.GET.get("line", "").strip()
-        status_filter = self.request.GET.get("status", "").strip()
-        valid_statuses = {choice[0] for choice in PhoneLine.Status.choices}
-
-        # Consultar apenas as primeiras linhas (lazy loading carregará o resto)
-        lines_qs = (
-            base_lines.select_related("sim_card")
-            .prefetch_related(
-                Prefetch(
-                    "allocations",
-                    queryset=LineAllocation.objects.filter(is_active=True)
-                    .select_related("employee")
-                    .order_by("-allocated_at"),
-                    to_attr="active_allocations",
-                )
-            )
-            .order_by("phone_number")
-        )
-
-        if line_filter:
-            lines_qs = lines_qs.filter(phone_number__icontains=line_filter)
-
-        if status_filter in valid_statuses:
-            lines_qs = lines_qs.filter(status=status_filter)
-        else:
-            status_filter = ""
-
-        # Carregar primeiros 10 itens
-        context["initial_lines"] = list(lines_qs[:10])
-        context["has_more_main_lines"] = lines_qs.count() > len(
-            context["initial_lines"]
-        )
+        # Primeira pagina de cada tabela; o lazy loading segue pelo cursor
+        params = self.request.GET
+        line_filter, status_filter = self._get_main_filters(params)
+        (
+            context["initial_lines"],
+            context["next_main_cursor"],
+            context["has_more_main_lines"],
+        ) = self._main_lines_page(base_lines, params)
         context["line_filter"] = line_filter
         context["status_filter"] = status_filter
         context["status_choices"] = PhoneLine.Status.choices
@@ -913,47 +1109,35 @@ class TelecomOverviewView(RoleRequiredMixin, TemplateView):
         context["reconnect_allowed_origem"] = PhoneLine.Origem.SRVMEMU_01
         context["can_manage_telecom"] = can_manage_telecom
         context["can_use_reconnect"] = can_use_reconnect
-
-        # Segunda tabela: Ações recentes
-        search_query = self.request.GET.get("search", "").strip()
-        status_filter_recent = self.request.GET.get("status_recent", "").strip()
-
-        recent_lines_qs = (
-            base_lines.select_related("sim_card")
-            .prefetch_related(
-                Prefetch(
-                    "allocations",
-                    queryset=LineAllocation.objects.filter(is_active=True)
-                    .select_related("employee")
-                    .order_by("-allocated_at"),
-                    to_attr="active_allocations",
-                )
-            )
-            .order_by("-updated_at")
+        context["can_export_inventory"] = (
+            getattr(self.request.user, "role", "") in InventoryExportView.allowed_roles
         )
 
-        if search_query:
-            recent_lines_qs = recent_lines_qs.filter(
-                Q(phone_number__icontains=search_query)
-                | Q(sim_card__iccid__icontains=search_query)
-            )
-
-        if status_filter_recent in valid_statuses:
-            recent_lines_qs = recent_lines_qs.filter(status=status_filter_recent)
-        else:
-            status_filter_recent = ""
-
-        # Carregar primeiros 10 itens
-        context["initial_recent_lines"] = list(recent_lines_qs[:10])
-        context["has_more_recent_lines"] = recent_lines_qs.count() > len(
-            context["initial_recent_lines"]
-        )
+        # Segunda tabela: Ações recentes
+        search_query, status_filter_recent = self._get_recent_filters(params)
+        (
+            context["initial_recent_lines"],
+            context["next_recent_cursor"],
+            context["has_more_recent_lines"],
+        ) = self._recent_lines_page(base_lines, params)
         context["search_query"] = search_query
         context["status_filter_recent"] = status_filter_recent
 
         context.update(self._line_status_summary(counts))
         return context
 
+    def _build_inventory_counters(self, base_lines):
+        status_counts = self._line_status_counts(base_lines)
+        return {
+            "total_simcards": SIMcard.objects.filter(is_deleted=False).count(),
+            "total_lines": sum(status_counts.values()),
+            "allocated_lines": LineAllocation.objects.filter(
+                is_active=True,
+                phone_line_id__in=base_lines.values("id"),
+            ).count(),
+            "status_counts": status_counts,
+        }
+
     def _line_status_counts(self, queryset):
         return {
             row["status"]: row["count"]
@@ -1005,6 +1189,52 @@ class TelecomOverviewView(RoleRequiredMixin, TemplateView):
         }
 
 
+class InventoryExportView(RoleRequiredMixin, View):
+    """Exporta todas as linhas visiveis (com filtros da visao geral) via stream."""
+
+    allowed_roles = [
+        SystemUser.Role.ADMIN,
+        SystemUser.Role.SUPER,
+        SystemUser.Role.BACKOFFICE,
+        SystemUser.Role.GERENTE,
+    ]
+
+    def get(self, request):
+        export_format = request.GET.get("format", "csv").strip().lower()
+        if export_format not in {"csv", "xlsx"}:
+            export_format = "csv"
+
+        queryset = get_inventory_export_queryset(
+            get_visible_phone_lines_queryset(request.user),
+            line_filter=request.GET.get("line", "").strip(),
+            status_filter=request.GET.get("status", "").strip(),
+        )
+        rows = iter_inventory_rows(queryset)
+        filename = timezone.localdate().strftime("inventario_linhas_%Y%m%d")
+
+        if export_format == "xlsx":
+            try:
+                content = stream_inventory_xlsx(rows)
+            except ValueError as exc:
+                messages.error(request, str(exc))
+                return redirect("telecom:overview")
+            response = StreamingHttpResponse(
+                content,
+                content_type=(
+                    "application/vnd.openxmlformats-officedocument."
+                    "spreadsheetml.sheet"
+                ),
+            )
+        else:
+            response = StreamingHttpResponse(
+                stream_inventory_csv(rows), content_type="text/csv; charset=utf-8"
+            )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{filename}.{export_format}"'
+        )
+        return response
+
+
 class ExportPhoneLinesCSVView(RoleRequiredMixin, View):
     allowed_roles = [SystemUser.Role.ADMIN]
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-17 15:24
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0007_systemuser_supervisor_email_and_backoffice_role'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='systemuser',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='users_email_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemuser',
+            index=models.Index(django.db.models.functions.text.Lower('manager_email'), name='users_manager_email_lower_idx'),
+        ),
+    ]
@@ -2,6 +2,9 @@ from django.apps import apps
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Lower
+
+from core.lookups import email_iexact
 
 
 class SystemUserManager(BaseUserManager):
@@ -67,6 +70,12 @@ class SystemUser(AbstractUser):
     REQUIRED_FIELDS = []
     objects = SystemUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(Lower("email"), name="users_email_lower_idx"),
+            models.Index(Lower("manager_email"), name="users_manager_email_lower_idx"),
+        ]
+
     def __str__(self):
         return f"{self.email} - {self.role}"
 
@@ -83,7 +92,7 @@ class SystemUser(AbstractUser):
             )
 
         if not self.__class__.objects.filter(
-            email__iexact=supervisor_email,
+            email_iexact("email", supervisor_email),
             role=self.Role.SUPER,
         ).exists():
             raise ValidationError(
@@ -121,32 +130,34 @@ class SystemUser(AbstractUser):
         if not supervisor_email:
             return None
 
-        return self.__class__.objects.filter(email__iexact=supervisor_email).first()
+        # Memorizado na instancia: request.user vive uma unica requisicao.
+        cached = self.__dict__.get("_effective_supervisor_user")
+        if cached is not None and cached[0] == supervisor_email:
+            return cached[1]
+        supervisor = self.__class__.objects.filter(
+            email_iexact("email", supervisor_email)
+        ).first()
+        self._effective_supervisor_user = (supervisor_email, supervisor)
+        return supervisor
+
+    def get_role_scope(self):
+        from core.services.role_scope_service import get_role_scope
+
+        return get_role_scope(self)
 
     def get_managed_supervisor_emails(self):
+        if self.role == self.Role.GERENTE:
+            return set(self.get_role_scope().managed_supervisor_emails)
         return set(
             self.__class__.objects.filter(
+                email_iexact("manager_email", self.email),
                 role=self.Role.SUPER,
-                manager_email__iexact=self.email,
             ).values_list("email", flat=True)
         )
 
     def scope_employee_queryset(self, queryset=None):
         employee_model = apps.get_model("employees", "Employee")
         queryset = queryset if queryset is not None else employee_model.objects.all()
-
-        if self.role in self.SUPERVISOR_SCOPE_ROLES:
-            supervisor_email = self.get_effective_supervisor_email()
-            if not supervisor_email:
-                return queryset.none()
-            return queryset.filter(corporate_email__iexact=supervisor_email)
-        if self.role == self.Role.GERENTE:
-            managed_supervisors = self.get_managed_supervisor_emails()
-            return queryset.filter(
-                models.Q(manager_email__iexact=self.email)
-                | models.Q(corporate_email__in=managed_supervisors)
-            )
-        return queryset
-
+        return self.get_role_scope().filter_employees(queryset)
 
 # Create your models here.
@@ -0,0 +1,23 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.services.role_scope_service import ROLE_SCOPE_VERSION_NAMESPACE
+from core.services.version_stamp_service import bump_version_stamp
+
+from .models import SystemUser
+
+# Campos gravados no login que nao afetam o escopo de acesso.
+SCOPE_NEUTRAL_FIELDS = {"last_login", "password"}
+
+
+@receiver(post_save, sender=SystemUser)
+@receiver(post_delete, sender=SystemUser)
+def bump_role_scope_version(sender, **kwargs):
+    """Invalida os escopos em cache apos o commit (papel ou vinculos mudaram)."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields and set(update_fields) <= SCOPE_NEUTRAL_FIELDS:
+        return
+    transaction.on_commit(partial(bump_version_stamp, ROLE_SCOPE_VERSION_NAMESPACE))
@@ -1,5 +1,9 @@
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
+
+from core.services.role_scope_service import get_role_scope
+from employees.models import Employee
 
 from .models import SystemUser
 
@@ -43,3 +47,127 @@ class SystemUserRoleTests(TestCase):
             "Selecione um supervisor valido",
         ):
             user.full_clean()
+
+
+class SystemUserRoleScopeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.manager = SystemUser.objects.create_user(
+            email="gerente.scope@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.GERENTE,
+        )
+        self.supervisor = SystemUser.objects.create_user(
+            email="super.scope@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.SUPER,
+            manager_email="GERENTE.scope@test.com",
+        )
+        self.supervised = self._create_employee(
+            "Ana Scope", "EMP-S1", corporate_email="super.scope@test.com"
+        )
+        self.managed = self._create_employee(
+            "Bruno Scope",
+            "EMP-S2",
+            corporate_email="outro.super@test.com",
+            manager_email="gerente.scope@test.com",
+        )
+        self.outsider = self._create_employee(
+            "Carla Scope", "EMP-S3", corporate_email="outro.super@test.com"
+        )
+
+    def _create_employee(self, full_name, employee_id, **extra):
+        return Employee.objects.create(
+            full_name=full_name,
+            employee_id=employee_id,
+            teams=Employee.UnitChoices.ARAQUARI,
+            status=Employee.Status.ACTIVE,
+            **extra,
+        )
+
+    def _fresh(self, user):
+        return SystemUser.objects.get(pk=user.pk)
+
+    def test_manager_scope_matches_supervisors_and_direct_reports(self):
+        scope = get_role_scope(self._fresh(self.manager))
+
+        self.assertFalse(scope.unrestricted)
+        self.assertEqual(set(scope.employee_ids), {self.supervised.pk, self.managed.pk})
+        self.assertEqual(scope.managed_supervisor_emails, {"super.scope@test.com"})
+
+    def test_scope_is_resolved_once_per_request_user(self):
+        manager = self._fresh(self.manager)
+        # Escopo (supervisores geridos + ids) e a listagem em si.
+        with self.assertNumQueries(3):
+            manager.get_managed_supervisor_emails()
+            first = list(manager.scope_employee_queryset().values_list("pk"))
+        with self.assertNumQueries(1):
+            second = list(manager.scope_employee_queryset().values_list("pk"))
+
+        self.assertEqual(first, second)
+
+    @override_settings(CACHE_IS_SHARED=True)
+    def test_scope_is_shared_across_requests_through_cache(self):
+        get_role_scope(self._fresh(self.manager))
+
+        with self.assertNumQueries(0):
+            scope = get_role_scope(self._fresh_without_query(self.manager))
+
+        self.assertIn(self.managed.pk, scope.employee_ids)
+
+    @override_settings(CACHE_IS_SHARED=False)
+    def test_local_cache_keeps_scope_only_for_the_request(self):
+        get_role_scope(self._fresh(self.manager))
+
+        with self.assertNumQueries(2):
+            get_role_scope(self._fresh_without_query(self.manager))
+
+    def _fresh_without_query(self, user):
+        return SystemUser(
+            pk=user.pk,
+            email=user.email,
+            role=user.role,
+            supervisor_email=user.supervisor_email,
+        )
+
+    def test_employee_write_invalidates_cached_scope(self):
+        manager = self._fresh(self.manager)
+        get_role_scope(manager)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.outsider.manager_email = "gerente.scope@test.com"
+            self.outsider.save()
+
+        self.assertIn(self.outsider.pk, get_role_scope(manager).employee_ids)
+
+    @override_settings(CACHE_IS_SHARED=True)
+    def test_login_does_not_invalidate_cached_scope(self):
+        manager = self._fresh(self.manager)
+        get_role_scope(manager)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.supervisor.save(update_fields=["last_login"])
+
+        with self.assertNumQueries(0):
+            get_role_scope(self._fresh_without_query(self.manager))
+
+    def test_backoffice_without_supervisor_sees_nothing(self):
+        backoffice = SystemUser(
+            pk=9999,
+            email="backoffice.scope@test.com",
+            role=SystemUser.Role.BACKOFFICE,
+        )
+
+        self.assertFalse(backoffice.scope_employee_queryset().exists())
+
+    def test_admin_scope_is_unrestricted(self):
+        admin = SystemUser.objects.create_user(
+            email="admin.scope@test.com",
+            password="StrongPass123",
+            role=SystemUser.Role.ADMIN,
+        )
+
+        with self.assertNumQueries(0):
+            queryset = admin.scope_employee_queryset(Employee.all_objects.all())
+
+        self.assertEqual(queryset.count(), 3)